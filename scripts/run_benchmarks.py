@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""CLI entry point for the benchmark suite and baseline comparison."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.benchmarks import (
+    STARTUP_BUDGET_S,
+    compare,
+    default_suite,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Benchmark the Phase 1 hot paths.")
+    parser.add_argument("--case", default="data/base_case.json", help="Case JSON used by every benchmark.")
+    parser.add_argument("--baseline", default="logs/benchmark_baseline.json", help="Baseline JSON path.")
+    parser.add_argument("--save", action="store_true", help="Write this run as the new baseline.")
+    parser.add_argument("--compare", action="store_true", help="Compare this run against the baseline.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging (0.2 = 20%%).")
+    parser.add_argument("--memory-threshold", type=float, default=0.5, help="Allowed peak memory growth.")
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=STARTUP_BUDGET_S,
+        help="Seconds allowed for import + load + one headless step.",
+    )
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run.")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this text.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the suite, print a JSON report, and exit 1 on regressions or a slow startup."""
+
+    args = parse_args()
+    results = run_suite(default_suite(args.case, quick=args.quick), args.filter)
+    report = {"results": [result.as_dict() for result in results.values()]}
+
+    status = 0
+    startup = results.get("startup.headless")
+    if startup is not None:
+        within = startup.best_s <= args.startup_budget
+        report["startup"] = {"best_s": startup.best_s, "budget_s": args.startup_budget, "within_budget": within}
+        status = 0 if within else 1
+    if args.compare:
+        rows = compare(
+            load_baseline(args.baseline),
+            results,
+            threshold=args.threshold,
+            memory_threshold=args.memory_threshold,
+        )
+        report["comparison"] = rows
+        report["regressions"] = [row["name"] for row in rows if row["regression"]]
+        if report["regressions"]:
+            status = 1
+    if args.save:
+        save_baseline(results, args.baseline)
+        report["baseline"] = args.baseline
+
+    print(json.dumps(report, indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,12 +8,19 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT / "src/scripts") not in sys.path:
     # Allow importing package modules when script is run directly.
     sys.path.insert(0, str(ROOT / "src"))
 
 from submarine_sim import SubmarineApp
+from submarine_sim.alerts import AlertSink, summarize
+from submarine_sim.checkpoint import run_with_checkpoints
+from submarine_sim.drag_tables import load_drag_table
+from submarine_sim.profiling import Profiler, stage
+from submarine_sim.telemetry_sinks import CsvSink
 
 
 def parse_args() -> argparse.Namespace:
@@ -24,6 +31,28 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--steps", type=int, default=5, help="Simulation steps to run.")
     parser.add_argument("--mode", choices=["base", "real"], default="base", help="Environment mode.")
     parser.add_argument("--report", default="logs/phase1_report.csv", help="CSV report output path.")
+    parser.add_argument("--mesh-cache-dir", default=None, help="Directory for cached hull meshes (.npz).")
+    parser.add_argument(
+        "--hydrostatics",
+        choices=["analytic", "mesh"],
+        default="analytic",
+        help="Hull area/volume from ellipsoid formulas or from the generated mesh.",
+    )
+    parser.add_argument(
+        "--drag-table",
+        default=None,
+        help="CSV of Cd(Re, profile, fin angle), e.g. data/drag_coefficients.csv (default: fixed Cd per profile).",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible sensor noise.")
+    parser.add_argument("--stream", action="store_true", help="Write rows to the report as they are produced.")
+    parser.add_argument("--flush-every", type=int, default=1000, help="Rows between flushes with --stream.")
+    parser.add_argument("--max-bytes", type=int, default=None, help="Rotate the --stream report past this size.")
+    parser.add_argument("--integrate", action="store_true", help="Evolve the vehicle state over time.")
+    parser.add_argument("--dt", type=float, default=0.1, help="Time step in seconds for --integrate.")
+    parser.add_argument("--checkpoint", default=None, help="Save a resumable checkpoint to this path while running.")
+    parser.add_argument("--checkpoint-every", type=int, default=10_000, help="Steps between checkpoints.")
+    parser.add_argument("--resume", default=None, help="Continue from a checkpoint; --steps is the total step count.")
+    parser.add_argument("--profile", action="store_true", help="Add per-stage timings and counters to the summary.")
     return parser.parse_args()
 
 
@@ -31,22 +60,61 @@ def main() -> int:
     """Run simulation once, save CSV report, and print JSON summary."""
 
     args = parse_args()
-    app = SubmarineApp()
+    drag_table = load_drag_table(args.drag_table) if args.drag_table else None
+    app = SubmarineApp(
+        mesh_cache_dir=args.mesh_cache_dir,
+        hydrostatics=args.hydrostatics,
+        drag_table=drag_table,
+        profiler=Profiler() if args.profile else None,
+    )
+    app.physics_engine.seed(args.seed)
     app.load_case(args.case)
 
     if args.mode == "real":
         app.ui_controller.toggle_environment_mode()
+    if args.integrate and (args.checkpoint or args.resume):
+        raise SystemExit("--checkpoint/--resume work with step runs, not --integrate.")
 
-    rows = app.run(steps=args.steps)
-    app.save_report(args.report)
+    if args.integrate:
+        result = app.run_trajectory(steps=args.steps, dt_s=args.dt, rng=np.random.default_rng(args.seed))
+        with stage(app.profiler, "csv"):
+            result.save_report(args.report)
+        rows = [result.row(-1)] if len(result) else []
+        events = app.alert_engine.evaluate(result.snapshots.as_dict())
+    elif args.stream:
+        alerts = AlertSink(app.alert_engine)
+        with CsvSink(args.report, flush_every=args.flush_every, max_bytes=args.max_bytes) as sink, alerts:
+            sinks = [sink, alerts]
+            if args.resume:
+                app.resume(args.resume, sinks)
+            if args.checkpoint:
+                last = run_with_checkpoints(app, args.steps, args.checkpoint, every=args.checkpoint_every, sinks=sinks)
+            else:
+                last = app.run_streaming(max(args.steps - app.step_index, 0), sinks)
+        rows = [last] if last else []
+        events = alerts.events
+    else:
+        if args.resume:
+            app.resume(args.resume)
+        if args.checkpoint:
+            run_with_checkpoints(app, args.steps, args.checkpoint, every=args.checkpoint_every)
+        else:
+            app.run(steps=max(args.steps - app.step_index, 0))
+        rows = app.telemetry_rows
+        app.save_report(args.report)
+        events = app.evaluate_alerts()
 
     summary = {
         "case": args.case,
         "steps": args.steps,
         "mode": app.ui_controller.state.environment_mode,
         "last_snapshot": rows[-1] if rows else {},
+        "alerts": summarize(events),
         "report": args.report,
     }
+    if app.profiler is not None:
+        summary["profile"] = app.profiler.summary()
+        summary["profile"]["derived_cache"] = app.derived.summary()
     print(json.dumps(summary, indent=2))
     return 0
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""CLI entry point for multi-vehicle fleet runs with proximity checks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.fleet import Fleet, FleetTelemetry, ProximityLog
+from submarine_sim.math_ingestor import MathIngestor
+from submarine_sim.trajectory import TrajectoryConfig
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Run a Phase 1 fleet of vehicles from one case.")
+    parser.add_argument("--case", default="data/base_case.json", help="Case JSON copied to every vehicle.")
+    parser.add_argument("--vehicles", type=int, default=10_000, help="Number of vehicles.")
+    parser.add_argument("--steps", type=int, default=100, help="Simulation steps.")
+    parser.add_argument("--dt", type=float, default=0.1, help="Time step in seconds.")
+    parser.add_argument("--spacing", type=float, default=20.0, help="Start lattice spacing in metres.")
+    parser.add_argument("--proximity", type=float, default=10.0, help="Close-approach distance in metres.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for headings and sensor noise.")
+    parser.add_argument("--noise", action="store_true", help="Apply the case's sensor noise.")
+    parser.add_argument("--record-every", type=int, default=10, help="Steps between telemetry snapshots.")
+    parser.add_argument("--report", default=None, help="Fleet telemetry CSV output path.")
+    parser.add_argument("--events", default=None, help="Close-approach/collision CSV output path.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the fleet, optionally save telemetry and events, and print a JSON summary."""
+
+    args = parse_args()
+    case = MathIngestor().load_json(args.case)
+    fleet = Fleet.from_case(
+        case,
+        args.vehicles,
+        spacing_m=args.spacing,
+        seed=args.seed,
+        proximity_m=args.proximity,
+        config=TrajectoryConfig(dt_s=args.dt),
+        noise_enabled=args.noise,
+    )
+    telemetry = FleetTelemetry() if args.report else None
+    proximity = ProximityLog()
+
+    started = time.perf_counter()
+    fleet.run(args.steps, telemetry=telemetry, proximity=proximity, record_every=args.record_every)
+    elapsed = time.perf_counter() - started
+
+    if telemetry is not None:
+        telemetry.save_csv(args.report)
+    if args.events:
+        proximity.save_csv(args.events)
+
+    events = proximity.columns()
+    collisions = events["collision"]
+    summary = {
+        "case": args.case,
+        "vehicles": len(fleet),
+        "steps": args.steps,
+        "elapsed_s": round(elapsed, 3),
+        "steps_per_s": round(args.steps / elapsed, 1) if elapsed > 0 else None,
+        "close_approaches": int(len(collisions) - collisions.sum()),
+        "collisions": int(collisions.sum()),
+        "vehicles_in_collision": int(len(np.union1d(events["a"][collisions], events["b"][collisions]))),
+        "grid": {"rebuilds": fleet.grid.rebuilds, "reuses": fleet.grid.reuses},
+        "report": args.report,
+        "events": args.events,
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
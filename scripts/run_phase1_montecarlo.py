@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""CLI entry point for seeded Monte Carlo noise ensembles."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.monte_carlo import MonteCarloEnsemble
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Run a Phase 1 Monte Carlo noise ensemble.")
+    parser.add_argument("--case", default="data/real_case.json", help="Path to case JSON.")
+    parser.add_argument("--realizations", type=int, default=1000, help="Number of noisy runs (K).")
+    parser.add_argument("--steps", type=int, default=1000, help="Steps per run.")
+    parser.add_argument("--seed", type=int, default=0, help="Root seed for all realization streams.")
+    parser.add_argument("--sigma", type=float, default=None, help="Override the case sensor_noise_sigma.")
+    parser.add_argument("--integrate", action="store_true", help="Use the time-integrated trajectory state.")
+    parser.add_argument("--dt", type=float, default=0.1, help="Time step in seconds for --integrate.")
+    parser.add_argument("--block-size", type=int, default=256, help="Realizations evaluated per block.")
+    parser.add_argument("--report", default="logs/phase1_montecarlo.csv", help="Per-step statistics CSV.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the ensemble, save per-step statistics, and print a JSON summary."""
+
+    args = parse_args()
+    ensemble = MonteCarloEnsemble(
+        args.case,
+        realizations=args.realizations,
+        steps=args.steps,
+        seed=args.seed,
+        integrate=args.integrate,
+        dt_s=args.dt,
+        sensor_noise_sigma=args.sigma,
+        block_size=args.block_size,
+    )
+
+    started = time.perf_counter()
+    result = ensemble.run()
+    elapsed = time.perf_counter() - started
+    result.save_report(args.report)
+
+    summary = {"case": args.case, "elapsed_s": round(elapsed, 3), **result.summary(), "report": args.report}
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""CLI entry point for fixed-rate (hardware-in-the-loop) runs."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim import SubmarineApp
+from submarine_sim.profiling import Profiler
+from submarine_sim.realtime import QueueChannel, RealTimeLoop, SerialChannel, StreamChannel
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Step the Phase 1 simulation at a fixed wall-clock rate.")
+    parser.add_argument("--case", default="data/base_case.json", help="Path to case JSON.")
+    parser.add_argument("--mode", choices=["base", "real"], default="base", help="Environment mode.")
+    parser.add_argument("--rate", type=float, default=100.0, help="Ticks per second.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Run time in seconds.")
+    parser.add_argument(
+        "--channel",
+        choices=["queue", "pty", "serial"],
+        default="queue",
+        help="queue = in-process stand-in, pty = new pseudo-terminal, serial = --port via pyserial.",
+    )
+    parser.add_argument("--port", default=None, help="Serial port or pyserial URL for --channel serial.")
+    parser.add_argument("--baud", type=int, default=115200, help="Baud rate for --channel serial.")
+    parser.add_argument("--profile", action="store_true", help="Add per-stage timings and counters to the summary.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the loop for --duration seconds and print timing statistics."""
+
+    args = parse_args()
+    app = SubmarineApp(profiler=Profiler() if args.profile else None)
+    app.load_case(args.case)
+    app.ui_controller.set_environment_mode(args.mode)
+
+    if args.channel == "serial":
+        if not args.port:
+            raise SystemExit("--channel serial needs --port.")
+        channel = SerialChannel(args.port, baudrate=args.baud)
+    elif args.channel == "pty":
+        channel, device = StreamChannel.open_pty()
+        # Tell the hardware simulator where to connect before the loop starts.
+        print(json.dumps({"pty": device}), flush=True)
+    else:
+        channel = QueueChannel(maxsize=1)
+
+    with channel:
+        stats = RealTimeLoop(app, channel, rate_hz=args.rate).run(duration_s=args.duration)
+
+    summary = {"case": args.case, "channel": args.channel, **stats.summary()}
+    if hasattr(channel, "dropped"):
+        summary["dropped_rows"] = channel.dropped
+    if app.profiler is not None:
+        summary["profile"] = app.profiler.summary()
+        summary["profile"]["derived_cache"] = app.derived.summary()
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
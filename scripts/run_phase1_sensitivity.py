@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""CLI entry point for output-vs-input sensitivity (Jacobians) of many cases."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim import MathIngestor, PhysicsEngine
+from submarine_sim.case_batch import CaseBatch
+from submarine_sim.drag_tables import load_drag_table
+from submarine_sim.sensitivity import jacobian
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Rank case inputs by their effect on Phase 1 outputs.")
+    parser.add_argument("--cases", default="data/base_case.json", help="Case JSON, directory of cases, or .jsonl file.")
+    parser.add_argument("--pattern", default="*.json", help="Glob pattern used for directories.")
+    parser.add_argument("--method", choices=["auto", "analytic", "fd"], default="auto", help="Derivative method.")
+    parser.add_argument("--drag-table", default=None, help="CSV of Cd(Re, profile, fin angle); implies finite differences.")
+    parser.add_argument("--rel-step", type=float, default=1e-5, help="Relative step for finite differences.")
+    parser.add_argument("--top", type=int, default=5, help="Inputs listed per output in the ranking.")
+    parser.add_argument("--report", default=None, help="Optional CSV with one Jacobian row per case and output.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Load the cases, compute Jacobians, and print a JSON ranking."""
+
+    args = parse_args()
+    started = time.perf_counter()
+    sources, cases, errors = [], [], []
+    for record in MathIngestor().iter_cases(args.cases, pattern=args.pattern):
+        if record.ok:
+            sources.append(record.source)
+            cases.append(record.case)
+        else:
+            errors.append({"source": record.source, "error": record.error})
+    if not cases:
+        print(json.dumps({"cases": args.cases, "loaded": 0, "failed": len(errors), "errors": errors}, indent=2))
+        return 1
+
+    drag_table = load_drag_table(args.drag_table) if args.drag_table else None
+    try:
+        result = jacobian(
+            CaseBatch.from_cases(cases),
+            PhysicsEngine(),
+            method=args.method,
+            drag_table=drag_table,
+            rel_step=args.rel_step,
+        )
+    except ValueError as exc:
+        print(f"Sensitivity failed: {exc}", file=sys.stderr)
+        return 1
+
+    if args.report:
+        report = Path(args.report)
+        report.parent.mkdir(parents=True, exist_ok=True)
+        with report.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["source", "output", "value", *result.fields])
+            for i, source in enumerate(sources):
+                for o, output in enumerate(result.outputs):
+                    writer.writerow([source, output, result.values[i, o], *result.jacobian[i, o].tolist()])
+
+    summary = {
+        "cases": args.cases,
+        "loaded": len(cases),
+        "failed": len(errors),
+        "errors": errors,
+        "method": result.method,
+        "ranking": {
+            output: [{"field": field, "elasticity": round(score, 6)} for field, score in ranked]
+            for output, ranked in result.rankings(args.top).items()
+        },
+        "total_s": round(time.perf_counter() - started, 3),
+        "report": args.report,
+    }
+    if len(cases) == 1:
+        summary["case"] = result.case_dict(0)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""CLI entry point for the long-running local simulation service."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.service import ServiceConfig, SimulationService
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Serve Phase 1 simulations over HTTP on localhost.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (0 = any free port).")
+    parser.add_argument("--workers", type=int, default=2, help="Warm worker processes.")
+    parser.add_argument("--max-queue", type=int, default=1024, help="Queued requests before answering 503.")
+    parser.add_argument("--max-batch", type=int, default=256, help="Requests per micro-batch.")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0, help="Time to wait for a batch to fill.")
+    parser.add_argument("--max-steps", type=int, default=100_000, help="Largest 'steps' accepted per request.")
+    parser.add_argument("--drag-table", default=None, help="CSV of Cd(Re, profile, fin angle) instead of fixed Cd.")
+    return parser.parse_args()
+
+
+async def serve(config: ServiceConfig) -> None:
+    """Start the service, print its address, and serve until interrupted."""
+
+    service = SimulationService(config)
+    await service.start()
+    host, port = service.address
+    print(json.dumps({"listening": f"http://{host}:{port}", "workers": config.workers}), flush=True)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def main() -> int:
+    """Run the service until Ctrl+C."""
+
+    args = parse_args()
+    config = ServiceConfig(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        max_batch=args.max_batch,
+        batch_window_s=args.batch_window_ms / 1000.0,
+        max_steps=args.max_steps,
+        drag_table=args.drag_table,
+    )
+    try:
+        asyncio.run(serve(config))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""CLI entry point for batched parameter sweeps over one base case."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.sweep import ParameterSweep
+
+
+def parse_axis(text: str) -> tuple[str, list | dict]:
+    """Parse ``field=start:stop:num`` (range) or ``field=v1,v2,...`` (levels)."""
+
+    field, _, spec = text.partition("=")
+    if not spec:
+        raise argparse.ArgumentTypeError(f"Axis must look like field=values: {text}")
+    if ":" in spec:
+        parts = spec.split(":")
+        if len(parts) not in {2, 3}:
+            raise argparse.ArgumentTypeError(f"Range must be start:stop[:num]: {text}")
+        axis = {"start": float(parts[0]), "stop": float(parts[1])}
+        if len(parts) == 3:
+            axis["num"] = int(parts[2])
+        return field, axis
+    values = spec.split(",")
+    if field.endswith("naca_profile"):
+        return field, values
+    return field, [float(v) for v in values]
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Run a Phase 1 parameter sweep.")
+    parser.add_argument("--case", default="data/base_case.json", help="Base case JSON.")
+    parser.add_argument(
+        "--axis",
+        action="append",
+        type=parse_axis,
+        required=True,
+        help="Swept field, e.g. hull_geometry.length_m=2:4:20 or environment.fluid_density_kgm3=1000,1025.",
+    )
+    parser.add_argument("--design", choices=["cartesian", "lhs"], default="cartesian", help="Design type.")
+    parser.add_argument("--samples", type=int, default=None, help="Sample count for --design lhs.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for LHS sampling and noise.")
+    parser.add_argument("--noise", action="store_true", help="Apply each case's sensor noise.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = in-process).")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Design rows per batch.")
+    parser.add_argument("--report", default="logs/phase1_sweep.csv", help="CSV results output path.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the sweep, stream results to CSV, and print a JSON summary."""
+
+    args = parse_args()
+    sweep = ParameterSweep(
+        args.case,
+        dict(args.axis),
+        design=args.design,
+        samples=args.samples,
+        seed=args.seed,
+        noise_enabled=args.noise,
+    )
+
+    started = time.perf_counter()
+    table = sweep.run(chunk_size=args.chunk_size, workers=args.workers, output_path=args.report)
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "case": args.case,
+        "design": args.design,
+        "rows": len(sweep),
+        "invalid_rows": int((~table["valid"]).sum()) if table else 0,
+        "elapsed_s": round(elapsed, 3),
+        "min_torque_margin_nm": float(table["torque_margin_nm"].min()) if table else None,
+        "report": args.report,
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
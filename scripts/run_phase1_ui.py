@@ -14,6 +14,8 @@ if str(ROOT / "src") not in sys.path:
     sys.path.insert(0, str(ROOT / "src"))
 
 from submarine_sim import SubmarineApp
+from submarine_sim.alerts import summarize
+from submarine_sim.profiling import Profiler
 
 
 def parse_args() -> argparse.Namespace:
@@ -25,6 +27,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--steps", type=int, default=5, help="Simulation steps.")
     parser.add_argument("--report", default="logs/phase1_report.csv", help="CSV report output path.")
     parser.add_argument("--interactive", action="store_true", help="Run interactive simulation prompt loop.")
+    parser.add_argument("--profile", action="store_true", help="Add per-stage timings and counters to the summary.")
     return parser.parse_args()
 
 
@@ -42,19 +45,20 @@ def main() -> int:
     args = parse_args()
     if args.interactive:
         return run_interactive()
-    return run_once(args.case, args.mode, args.steps, args.report)
+    return run_once(args.case, args.mode, args.steps, args.report, profile=args.profile)
 
 
-def run_once(case: str, mode: str, steps: int, report: str) -> int:
+def run_once(case: str, mode: str, steps: int, report: str, profile: bool = False) -> int:
     """Run one simulation session and print a short terminal summary."""
 
-    app = SubmarineApp()
+    app = SubmarineApp(profiler=Profiler() if profile else None)
     ui = app.ui_controller
 
     ui.load_case(case)
     ui.set_environment_mode(mode)
     rows = ui.run_simulation(steps)
     ui.save_report(report)
+    alerts = summarize(ui.evaluate_alerts())
 
     last = rows[-1] if rows else {}
     print("Phase 1 Simulation UI")
@@ -79,7 +83,11 @@ def run_once(case: str, mode: str, steps: int, report: str) -> int:
         "rows_logged": len(rows),
         "report": report,
         "last_snapshot": last,
+        "alerts": alerts,
     }
+    if app.profiler is not None:
+        summary["profile"] = app.profiler.summary()
+        summary["profile"]["derived_cache"] = app.derived.summary()
     print(json.dumps(summary, indent=2))
     return 0
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""CLI entry point for golden-file regression diffs of telemetry reports."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    # Allow importing package modules when script is run directly.
+    sys.path.insert(0, str(ROOT / "src"))
+
+from submarine_sim.regression import DEFAULT_TOLERANCE, Tolerance, compare_many, pair_directories
+
+
+def parse_tolerance(text: str) -> tuple[str, Tolerance]:
+    """Parse ``field=atol`` or ``field=atol:rtol``."""
+
+    name, _, spec = text.partition("=")
+    if not spec:
+        raise argparse.ArgumentTypeError(f"Tolerance must look like field=atol[:rtol]: {text}")
+    atol, _, rtol = spec.partition(":")
+    return name, Tolerance(atol=float(atol), rtol=float(rtol) if rtol else 0.0)
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command-line arguments."""
+
+    parser = argparse.ArgumentParser(description="Diff telemetry reports against golden references.")
+    parser.add_argument("--reference", required=True, help="Reference CSV, or a directory of them.")
+    parser.add_argument("--candidate", required=True, help="Candidate CSV, or a directory with the same layout.")
+    parser.add_argument("--pattern", default="*.csv", help="Glob pattern used for directories.")
+    parser.add_argument("--atol", type=float, default=DEFAULT_TOLERANCE.atol, help="Default absolute tolerance.")
+    parser.add_argument("--rtol", type=float, default=DEFAULT_TOLERANCE.rtol, help="Default relative tolerance.")
+    parser.add_argument(
+        "--tol",
+        action="append",
+        type=parse_tolerance,
+        default=[],
+        help="Per-field tolerance, e.g. effective_velocity_ms=1e-6:1e-4 (repeatable).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = in-process).")
+    parser.add_argument("--max-failures", type=int, default=20, help="Failed pairs to detail in the summary.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Compare every pair, print a JSON summary, and exit 1 if any pair fails."""
+
+    args = parse_args()
+    reference, candidate = Path(args.reference), Path(args.candidate)
+    if reference.is_dir():
+        pairs, missing = pair_directories(reference, candidate, args.pattern)
+    else:
+        pairs, missing = [(reference, candidate)], []
+
+    started = time.perf_counter()
+    results = compare_many(
+        pairs,
+        dict(args.tol),
+        Tolerance(atol=args.atol, rtol=args.rtol),
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+
+    failed = [result for result in results if not result.passed]
+    summary = {
+        "reference": args.reference,
+        "candidate": args.candidate,
+        "pairs": len(results),
+        "passed": len(results) - len(failed),
+        "failed": len(failed),
+        "missing_candidates": [str(path) for path in missing],
+        "elapsed_s": round(elapsed, 3),
+        "failures": [result.as_dict() for result in failed[: args.max_failures]],
+    }
+    print(json.dumps(summary, indent=2))
+    return 1 if failed or missing else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
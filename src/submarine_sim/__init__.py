@@ -1,10 +1,30 @@
-"""Phase 1 submarine simulation package."""
+"""Phase 1 submarine simulation package.
 
-from .app import SubmarineApp
-from .hull_generator import HullGenerator
-from .math_ingestor import MathIngestor
-from .physics_engine import PhysicsEngine
-from .ui_controller import UIController
+Public classes are imported on first attribute access, so
+``import submarine_sim`` stays cheap and submodules (and their optional
+dependencies) load only when used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - for type checkers and IDEs only
+    from .app import SubmarineApp
+    from .hull_generator import HullGenerator
+    from .math_ingestor import MathIngestor
+    from .physics_engine import PhysicsEngine
+    from .ui_controller import UIController
+
+# Public name -> submodule that defines it.
+_LAZY_EXPORTS = {
+    "SubmarineApp": ".app",
+    "MathIngestor": ".math_ingestor",
+    "HullGenerator": ".hull_generator",
+    "PhysicsEngine": ".physics_engine",
+    "UIController": ".ui_controller",
+}
 
 __all__ = [
     "SubmarineApp",
@@ -13,3 +33,17 @@ __all__ = [
     "PhysicsEngine",
     "UIController",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache on the package so later lookups skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,270 @@
+"""Vectorized alert rules with hysteresis and minimum-duration debouncing.
+
+Rules run over whole telemetry columns (or streamed chunks of them) and
+emit start/end events with step indices. The GUI, CLI and headless runs
+share the same engine, so they report the same alerts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .telemetry_sinks import TelemetrySink
+
+_OPERATORS = {"lt", "le", "gt", "ge", "true"}
+
+
+@dataclass
+class AlertRule:
+    """One alert condition on a telemetry field.
+
+    ``op`` compares the field with ``threshold`` (``lt``, ``le``, ``gt``,
+    ``ge``) or checks a boolean field (``true``). With hysteresis the
+    alert only clears once the value is back past ``clear_threshold``.
+    An episode is reported only if it lasts ``min_duration`` steps.
+    """
+
+    name: str
+    field: str
+    op: str
+    message: str
+    threshold: float = 0.0
+    clear_threshold: float | None = None
+    min_duration: int = 1
+
+    def __post_init__(self) -> None:
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Unknown alert operator: {self.op}")
+        if self.min_duration < 1:
+            raise ValueError("min_duration must be >= 1.")
+
+    def trigger_mask(self, values: np.ndarray) -> np.ndarray:
+        """Return where the alert condition is met."""
+
+        if self.op == "true":
+            return values.astype(bool)
+        return _compare(values, self.op, self.threshold)
+
+    def clear_mask(self, values: np.ndarray) -> np.ndarray:
+        """Return where an active alert is allowed to clear."""
+
+        if self.op == "true" or self.clear_threshold is None:
+            return ~self.trigger_mask(values)
+        # Clearing needs the value back across the (looser) clear threshold.
+        inverse = {"lt": "ge", "le": "gt", "gt": "le", "ge": "lt"}[self.op]
+        return _compare(values, inverse, self.clear_threshold)
+
+
+@dataclass
+class AlertEvent:
+    """Start or end of one debounced alert episode."""
+
+    rule: str
+    kind: str
+    step: int
+    message: str
+
+
+def default_rules() -> list[AlertRule]:
+    """Return the Phase 1 alerts previously hard-coded in the GUI."""
+
+    return [
+        AlertRule("torque_limit", "torque_margin_nm", "lt", "TORQUE LIMIT EXCEEDED", threshold=0.0),
+        AlertRule("cavitation", "cavitation_risk", "true", "CAVITATION RISK"),
+        AlertRule("instability", "stability_warning", "true", "NEGATIVE GM - INSTABILITY"),
+    ]
+
+
+def _compare(values: np.ndarray, op: str, threshold: float) -> np.ndarray:
+    if op == "lt":
+        return values < threshold
+    if op == "le":
+        return values <= threshold
+    if op == "gt":
+        return values > threshold
+    return values >= threshold
+
+
+class _RuleState:
+    """Carry-over state for one rule between streamed chunks."""
+
+    def __init__(self) -> None:
+        self.active = False  # Hysteresis latch at the end of the last chunk.
+        self.run_start: int | None = None  # Start step of the current raw episode.
+        self.started = False  # Whether a start event was emitted for it.
+
+
+class AlertEngine:
+    """Evaluates alert rules over telemetry arrays, chunk by chunk.
+
+    Call ``feed`` with consecutive chunks (dict of column arrays) and
+    ``finish`` at the end of a run, or ``evaluate`` for one complete run.
+    """
+
+    def __init__(self, rules: Sequence[AlertRule] | None = None) -> None:
+        self.rules = list(rules) if rules is not None else default_rules()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all streaming state."""
+
+        self._states = {rule.name: _RuleState() for rule in self.rules}
+        self._offset = 0
+
+    def evaluate(self, columns: Mapping[str, np.ndarray]) -> list[AlertEvent]:
+        """Return all events for one complete run, including final ends."""
+
+        self.reset()
+        events = self.feed(columns)
+        events.extend(self.finish())
+        return events
+
+    def feed(self, columns: Mapping[str, np.ndarray]) -> list[AlertEvent]:
+        """Process the next chunk of a run and return the events it completes."""
+
+        n = len(next(iter(columns.values()))) if columns else 0
+        events: list[AlertEvent] = []
+        for rule in self.rules:
+            values = np.asarray(columns[rule.field])
+            events.extend(self._feed_rule(rule, values))
+        self._offset += n
+        events.sort(key=lambda e: (e.step, e.kind != "end"))
+        return events
+
+    def finish(self) -> list[AlertEvent]:
+        """Close episodes still active at the end of the run."""
+
+        events = []
+        for rule in self.rules:
+            state = self._states[rule.name]
+            if state.run_start is not None and state.started:
+                events.append(AlertEvent(rule.name, "end", self._offset, rule.message))
+            state.run_start, state.started, state.active = None, False, False
+        return events
+
+    def active_messages(self) -> list[str]:
+        """Messages of alerts that are currently active (after debouncing)."""
+
+        return [rule.message for rule in self.rules if self._states[rule.name].started]
+
+    def _feed_rule(self, rule: AlertRule, values: np.ndarray) -> list[AlertEvent]:
+        state = self._states[rule.name]
+        n = len(values)
+        if n == 0:
+            return []
+
+        active = _latch(rule.trigger_mask(values), rule.clear_mask(values), state.active)
+
+        # Rising/falling edges relative to the previous chunk's final state.
+        previous = np.concatenate(([state.active], active[:-1]))
+        starts = np.flatnonzero(active & ~previous)
+        ends = np.flatnonzero(~active & previous)
+
+        events: list[AlertEvent] = []
+        run_start = state.run_start
+        started = state.started
+        # Walk the (few) edges; the per-step work above is fully vectorized.
+        edges = sorted([(int(i), "start") for i in starts] + [(int(i), "end") for i in ends])
+        for index, kind in edges:
+            step = self._offset + index
+            if kind == "start":
+                run_start, started = step, False
+                if rule.min_duration == 1:
+                    events.append(AlertEvent(rule.name, "start", step, rule.message))
+                    started = True
+                continue
+            if not started and step - run_start >= rule.min_duration:
+                events.append(AlertEvent(rule.name, "start", run_start, rule.message))
+                started = True
+            if started:
+                events.append(AlertEvent(rule.name, "end", step, rule.message))
+            run_start, started = None, False
+
+        # An episode still open at chunk end may already satisfy min_duration.
+        chunk_end = self._offset + n
+        if run_start is not None and not started and chunk_end - run_start >= rule.min_duration:
+            events.append(AlertEvent(rule.name, "start", run_start, rule.message))
+            started = True
+
+        state.active = bool(active[-1])
+        state.run_start = run_start
+        state.started = started
+        return events
+
+
+def _latch(trigger: np.ndarray, clear: np.ndarray, initial: bool) -> np.ndarray:
+    """Vectorized set/reset latch: active after a trigger until a clear.
+
+    Each step looks up the most recent trigger and clear index (running
+    maximum), and the latch is on when the last trigger is newer. A step
+    where both fire keeps the trigger.
+    """
+
+    idx = np.arange(len(trigger))
+    # -1 stands for "before this chunk"; the initial state decides who wins there.
+    last_trigger = np.maximum.accumulate(np.where(trigger, idx, -1))
+    last_clear = np.maximum.accumulate(np.where(clear & ~trigger, idx, -1))
+    if initial:
+        return last_trigger >= last_clear
+    return last_trigger > last_clear
+
+
+class AlertSink(TelemetrySink):
+    """Feeds streamed rows to an ``AlertEngine`` in vectorized chunks."""
+
+    def __init__(self, engine: AlertEngine | None = None, chunk_size: int = 4096) -> None:
+        self.engine = engine or AlertEngine()
+        self.engine.reset()
+        self.chunk_size = chunk_size
+        self.events: list[AlertEvent] = []
+        self._fields = sorted({rule.field for rule in self.engine.rules})
+        self._buffer: dict[str, list] = {name: [] for name in self._fields}
+        self._pending = 0
+
+    def write(self, row: dict) -> None:
+        for name in self._fields:
+            self._buffer[name].append(row[name])
+        self._pending += 1
+        if self._pending >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.events.extend(self.engine.feed({k: np.asarray(v) for k, v in self._buffer.items()}))
+            self._buffer = {name: [] for name in self._fields}
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.events.extend(self.engine.finish())
+
+    def checkpoint_state(self) -> dict:
+        self.flush()
+        engine = self.engine
+        return {"states": engine._states, "offset": engine._offset, "events": list(self.events)}
+
+    def restore_state(self, state: dict) -> None:
+        self._buffer = {name: [] for name in self._fields}
+        self._pending = 0
+        self.engine._states = state["states"]
+        self.engine._offset = state["offset"]
+        self.events = list(state["events"])
+
+
+def summarize(events: Sequence[AlertEvent]) -> list[dict]:
+    """Pair start/end events into JSON-friendly episode records."""
+
+    open_events: dict[str, AlertEvent] = {}
+    episodes = []
+    for event in events:
+        if event.kind == "start":
+            open_events[event.rule] = event
+        elif event.rule in open_events:
+            start = open_events.pop(event.rule)
+            episodes.append(
+                {"rule": event.rule, "message": event.message, "start_step": start.step, "end_step": event.step}
+            )
+    return episodes
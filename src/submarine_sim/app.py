@@ -6,55 +6,162 @@ physics stepping, and output reporting.
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from pathlib import Path
-import csv
+from typing import Iterator, Sequence
 
+import numpy as np
+
+from . import checkpoint
+from .alerts import AlertEngine, AlertEvent
+from .derived_cache import DerivedCache
+from .drag_tables import DragTable
 from .hull_generator import HullGenerator
 from .math_ingestor import MathIngestor
-from .physics_engine import PhysicsEngine
+from .mesh_cache import MeshCache
+from .physics_engine import PhysicsEngine, PhysicsSnapshot, StepInputs
+from .profiling import Profiler, stage
+from .telemetry_sinks import TelemetrySink
+from .telemetry_store import TelemetryRows, TelemetryStore
+from .trajectory import TrajectoryIntegrator, TrajectoryResult
 from .ui_controller import UIController
 
+# Values derived from the case, hull and UI state, and what each depends on.
+# "case", "hull" and "noise" are inputs invalidated by the app, hull generator and UI controller.
+DERIVED_DEPENDENCIES = {
+    "props": ("hull",),
+    "drag_coefficient": ("case",),
+    "sensor_noise_sigma": ("case", "noise"),
+    "step_inputs": ("case", "props", "drag_coefficient", "sensor_noise_sigma"),
+}
+
 
 class SubmarineApp:
     """Single entry point used by CLI/UI/GUI runners."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        mesh_cache_dir: str | Path | None = None,
+        hydrostatics: str = "analytic",
+        drag_table: DragTable | None = None,
+        profiler: Profiler | None = None,
+    ) -> None:
         # Build all subsystems once and keep shared state here.
-        self.ingestor = MathIngestor()
-        self.hull_generator = HullGenerator()
+        # Optional stage timers; None keeps every path uninstrumented.
+        self.profiler = profiler
+        self.ingestor = MathIngestor(drag_table=drag_table)
+        self.hull_generator = HullGenerator(MeshCache(cache_dir=mesh_cache_dir), hydrostatics=hydrostatics)
         self.physics_engine = PhysicsEngine()
         self.ui_controller = UIController()
         self.ui_controller.attach_app(self)
-        self.telemetry_rows: list[dict] = []
+        self.integrator = TrajectoryIntegrator(self.physics_engine)
+        self.telemetry = TelemetryStore()
+        self.alert_engine = AlertEngine()
+        # Physics steps run so far; checkpoints resume from here.
+        self.step_index = 0
+        # Per-step constants, recomputed only when the case, hull or noise setting changes.
+        self.derived = DerivedCache(DERIVED_DEPENDENCIES)
+        self._derived_case = None
+        self.hull_generator.add_listener(lambda: self.invalidate_derived("hull"))
+
+    @property
+    def telemetry_rows(self) -> TelemetryRows:
+        """All stored rows as a read-only list of dictionaries."""
+
+        return self.telemetry.rows()
 
     def load_case(self, json_path: str | Path) -> None:
-        """Load and validate one JSON case, then rebuild the hull."""
-
-        payload = self.ingestor.load_json(json_path)
-        self.ingestor.validate_constraints()
-        self.hull_generator.update_hull(
-            payload.hull_geometry.length_m,
-            payload.hull_geometry.max_diameter_m,
-            payload.hull_geometry.fin_surface_area_m2,
-        )
+        """Load and validate one JSON case, then update the hull."""
+
+        with stage(self.profiler, "ingest"):
+            self.ingestor.load_json(json_path)
+        self._apply_case()
+
+    def load_case_data(self, data: dict) -> None:
+        """Like ``load_case`` but for an already-decoded JSON payload."""
+
+        with stage(self.profiler, "ingest"):
+            self.ingestor.load_dict(data)
+        self._apply_case()
+
+    def _apply_case(self) -> None:
+        """Check phase limits for the loaded case and set the hull dimensions.
+
+        The hull mesh (and Open3D) are only built when something needs
+        them: mesh hydrostatics or a GUI reading ``submarine_mesh``.
+        """
+
+        payload = self.ingestor.current_params
+        with stage(self.profiler, "validate"):
+            self.ingestor.validate_constraints()
+        with stage(self.profiler, "hull"):
+            self.hull_generator.set_dimensions(
+                payload.hull_geometry.length_m,
+                payload.hull_geometry.max_diameter_m,
+                payload.hull_geometry.fin_surface_area_m2,
+            )
+        self.invalidate_derived("case")
+
+    def invalidate_derived(self, *sources: str) -> None:
+        """Drop cached values that depend on ``sources`` ("case", "hull", "noise")."""
+
+        for source in sources:
+            self.derived.invalidate(source)
 
     def update_scene(self) -> dict:
         """Run one physics step and store the result for reporting."""
 
+        with stage(self.profiler, "step"):
+            snapshot = self._step()
+        with stage(self.profiler, "row"):
+            index = self.telemetry.append(snapshot, self.ui_controller.state.environment_mode)
+            return self.telemetry.row(index)
+
+    def step_row(self) -> dict:
+        """Run one physics step and return its telemetry row.
+
+        Unlike ``update_scene`` the row is not kept in ``telemetry``.
+        """
+
+        profiler = self.profiler
+        if profiler is None:
+            row = vars(self._step()).copy()
+            row["environment_mode"] = self.ui_controller.state.environment_mode
+            return row
+
+        clock = profiler.clock
+        t0 = clock()
+        snapshot = self._step()
+        t1 = clock()
+        row = vars(snapshot).copy()
+        row["environment_mode"] = self.ui_controller.state.environment_mode
+        profiler.record("step", t1 - t0)
+        profiler.record("row", clock() - t1)
+        return row
+
+    def _step(self) -> PhysicsSnapshot:
+        """Run one physics step with the loaded case and UI state."""
+
         payload = self.ingestor.current_params
         if payload is None:
             raise ValueError("No case loaded.")
 
-        props = self.hull_generator.get_properties()
-        cd = self.ingestor.get_drag_coefficient()
-        sigma = payload.environment.sensor_noise_sigma if self.ui_controller.state.noise_enabled else 0.0
+        if payload is not self._derived_case:
+            # Also catches cases swapped in directly, e.g. real-time steering commands.
+            self._derived_case = payload
+            self.derived.invalidate("case")
+        self.step_index += 1
+        return self.physics_engine.step_prepared(self.derived.get("step_inputs", self._step_inputs))
 
-        snap = self.physics_engine.step(
+    def _step_inputs(self) -> StepInputs:
+        """Noise-independent physics inputs for the loaded case and UI state."""
+
+        payload = self.ingestor.current_params
+        props = self.derived.get("props", self.hull_generator.get_properties)
+        return self.physics_engine.prepare_step(
             velocity_ms=payload.physics_state.velocity_ms,
             current_vector_ms=payload.environment.current_vector_ms,
             density_kgm3=payload.environment.fluid_density_kgm3,
-            drag_coefficient=cd,
+            drag_coefficient=self.derived.get("drag_coefficient", self.ingestor.get_drag_coefficient),
             area_m2=props.area_m2,
             volume_m3=props.volume_m3,
             target_fin_angle_deg=payload.steering_output.target_fin_angle_deg,
@@ -63,31 +170,128 @@ class SubmarineApp:
             depth_m=payload.physics_state.depth_m,
             length_m=payload.hull_geometry.length_m,
             diameter_m=payload.hull_geometry.max_diameter_m,
-            sensor_noise_sigma=sigma,
+            sensor_noise_sigma=self.derived.get("sensor_noise_sigma", self._sensor_noise_sigma),
         )
 
-        # Convert dataclass snapshot to plain dictionary for CSV output.
-        row = asdict(snap)
-        row["environment_mode"] = self.ui_controller.state.environment_mode
-        self.telemetry_rows.append(row)
-        return row
+    def _sensor_noise_sigma(self) -> float:
+        """Noise sigma of the loaded case, or 0.0 while noise is off."""
+
+        payload = self.ingestor.current_params
+        return payload.environment.sensor_noise_sigma if self.ui_controller.state.noise_enabled else 0.0
+
+    def run(self, steps: int = 10) -> TelemetryRows:
+        """Run multiple simulation steps and return all snapshots.
+
+        Snapshots go straight into the columnar store; the returned rows
+        are a lazy view, so no per-step dictionaries are built.
+        """
+
+        start = len(self.telemetry)
+        state = self.ui_controller.state
+        profiler = self.profiler
+        if profiler is None:
+            for _ in range(steps):
+                self.telemetry.append(self._step(), state.environment_mode)
+        else:
+            clock, record = profiler.clock, profiler.record
+            for _ in range(steps):
+                t0 = clock()
+                snapshot = self._step()
+                t1 = clock()
+                self.telemetry.append(snapshot, state.environment_mode)
+                record("step", t1 - t0)
+                record("row", clock() - t1)
+        return self.telemetry.rows(start, len(self.telemetry))
+
+    def iter_run(self, steps: int, sinks: Sequence[TelemetrySink] = ()) -> Iterator[dict]:
+        """Yield rows one step at a time and hand each row to every sink.
+
+        Unlike ``run`` this does not keep rows in ``telemetry_rows``, so
+        memory stays constant for any step count. Sinks are flushed when
+        the generator finishes or is closed early; closing them is left to
+        the caller.
+        """
+
+        profiler = self.profiler
+        try:
+            for _ in range(steps):
+                row = self.step_row()
+                if profiler is None:
+                    for sink in sinks:
+                        sink.write(row)
+                else:
+                    started = profiler.clock()
+                    for sink in sinks:
+                        sink.write(row)
+                    profiler.record("sink", profiler.clock() - started)
+                yield row
+        finally:
+            with stage(profiler, "sink_flush"):
+                for sink in sinks:
+                    sink.flush()
+
+    def run_streaming(self, steps: int, sinks: Sequence[TelemetrySink]) -> dict | None:
+        """Run ``steps`` through ``iter_run`` and return only the last row."""
+
+        last = None
+        for last in self.iter_run(steps, sinks):
+            pass
+        return last
+
+    def run_trajectory(
+        self, steps: int = 10, dt_s: float | None = None, rng: np.random.Generator | None = None
+    ) -> TrajectoryResult:
+        """Integrate the loaded case over time and return whole-run arrays.
+
+        Sensor noise is drawn from ``rng`` (a fresh unseeded generator by default).
+        """
+
+        payload = self.ingestor.current_params
+        if payload is None:
+            raise ValueError("No case loaded.")
+
+        props = self.derived.get("props", self.hull_generator.get_properties)
+        state = self.ui_controller.state
+        with stage(self.profiler, "trajectory"):
+            return self.integrator.integrate(
+                payload,
+                steps=steps,
+                area_m2=props.area_m2,
+                volume_m3=props.volume_m3,
+                drag_coefficient=self.derived.get("drag_coefficient", self.ingestor.get_drag_coefficient),
+                sensor_noise_sigma=self._sensor_noise_sigma(),
+                environment_mode=state.environment_mode,
+                dt_s=dt_s,
+                rng=rng,
+            )
+
+    def evaluate_alerts(self, start: int = 0) -> list[AlertEvent]:
+        """Scan stored telemetry from row ``start`` for alert episodes.
+
+        Event step indices are relative to ``start``.
+        """
+
+        columns = {name: column[start:] for name, column in self.telemetry.columns().items()}
+        with stage(self.profiler, "alerts"):
+            return self.alert_engine.evaluate(columns)
+
+    def save_checkpoint(self, path: str | Path, sinks: Sequence[TelemetrySink] = ()) -> Path:
+        """Snapshot the run (case, UI state, step, noise RNG, telemetry, sinks) to ``path``."""
+
+        return checkpoint.save_checkpoint(self, path, sinks)
+
+    def resume(self, path: str | Path, sinks: Sequence[TelemetrySink] = ()) -> int:
+        """Restore a checkpoint written by ``save_checkpoint``; return its step index.
 
-    def run(self, steps: int = 10) -> list[dict]:
-        """Run multiple simulation steps and return all snapshots."""
+        Pass the same kinds of sinks, in the same order, as when saving.
+        """
 
-        return [self.update_scene() for _ in range(steps)]
+        return checkpoint.restore(self, checkpoint.load_checkpoint(path), sinks)
 
     def save_report(self, output_path: str | Path) -> None:
         """Write accumulated telemetry rows to CSV."""
 
-        path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.telemetry_rows:
-            path.write_text("", encoding="utf-8")
-            return
-
-        fieldnames = list(self.telemetry_rows[0].keys())
-        with path.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.telemetry_rows)
+        with stage(self.profiler, "csv"):
+            self.telemetry.save_csv(output_path)
+        if self.profiler is not None:
+            self.profiler.count("csv_rows", len(self.telemetry))
@@ -0,0 +1,331 @@
+"""Benchmark suite for the hot paths, with a JSON baseline and compare mode.
+
+Each benchmark has a setup step (not timed) that returns the callable to
+time. Timing runs without tracing; a separate traced call measures the
+peak traced memory and ``retained_blocks``, the memory blocks still
+allocated after the call. Results are saved as a baseline JSON file, and
+later runs are compared against it to flag slowdowns beyond a threshold.
+
+CPython keeps no count of the allocations a call makes, so the suite does
+not report one. Retained blocks show caches and leaks; short-lived
+temporaries only show up in the peak.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .app import SubmarineApp
+from .hull_generator import LOD_LEVELS, HullGenerator, build_grid_mesh
+from .math_ingestor import MathIngestor
+from .physics_engine import PhysicsEngine
+
+# Version 2 renamed ``net_blocks`` to ``retained_blocks``.
+BASELINE_VERSION = 2
+DEFAULT_CASE = Path(__file__).resolve().parents[2] / "data" / "base_case.json"
+
+# Wall-clock budget for a fresh interpreter to import the package, load a
+# case and run one headless step.
+STARTUP_BUDGET_S = 1.0
+
+# Child script for the startup benchmark; fails if the headless path pulls in Open3D.
+_STARTUP_SCRIPT = """
+import sys
+from submarine_sim import SubmarineApp
+app = SubmarineApp()
+app.load_case(sys.argv[1])
+app.run(steps=1)
+if "open3d" in sys.modules:
+    raise SystemExit("open3d was imported on the headless path")
+"""
+
+
+@dataclass
+class Benchmark:
+    """One timed operation.
+
+    ``setup`` runs once, untimed, and returns the callable to time.
+    ``items`` is how many units (steps, rows, triangles...) one call
+    processes, used to report throughput. ``teardown`` runs after the
+    measurements (also on failure) to release what ``setup`` created.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    items: int = 1
+    unit: str = "call"
+    repeat: int = 5
+    number: int = 1
+    teardown: Callable[[], None] | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory figures for one benchmark."""
+
+    name: str
+    unit: str
+    items: int
+    best_s: float
+    median_s: float
+    throughput_per_s: float
+    peak_bytes: int
+    # Traced blocks still allocated after one call (e.g. caches it filled).
+    retained_blocks: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def run_benchmark(bench: Benchmark) -> BenchmarkResult:
+    """Time one benchmark (best and median of ``repeat``) and trace its memory."""
+
+    func = bench.setup()
+    try:
+        return _measure(bench, func)
+    finally:
+        if bench.teardown is not None:
+            bench.teardown()
+
+
+def _measure(bench: Benchmark, func: Callable[[], object]) -> BenchmarkResult:
+    """Timed repeats plus one traced call of ``func``."""
+
+    func()  # Warm-up: first-call imports and caches are not measured.
+
+    times = []
+    for _ in range(bench.repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(bench.number):
+            func()
+        times.append((time.perf_counter() - started) / bench.number)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    best = min(times)
+    return BenchmarkResult(
+        name=bench.name,
+        unit=bench.unit,
+        items=bench.items,
+        best_s=best,
+        median_s=statistics.median(times),
+        throughput_per_s=bench.items / best if best > 0 else float("inf"),
+        peak_bytes=int(peak),
+        retained_blocks=int(retained_blocks),
+    )
+
+
+def startup_benchmark(case_path: str | Path = DEFAULT_CASE, repeat: int = 5) -> Benchmark:
+    """Time a fresh interpreter importing the package and running one step."""
+
+    def setup():
+        env = dict(os.environ)
+        src = str(Path(__file__).resolve().parents[1])
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+        command = [sys.executable, "-c", _STARTUP_SCRIPT, str(case_path)]
+        return lambda: subprocess.run(command, env=env, check=True, capture_output=True)
+
+    return Benchmark("startup.headless", setup, unit="process", repeat=repeat)
+
+
+def default_suite(case_path: str | Path = DEFAULT_CASE, *, quick: bool = False) -> list[Benchmark]:
+    """The standard benchmarks; ``quick`` shrinks sizes for smoke runs."""
+
+    scale = 10 if quick else 1
+    case = MathIngestor().load_json(case_path)
+    suite: list[Benchmark] = [startup_benchmark(case_path, repeat=3 if quick else 5)]
+
+    def physics_step():
+        # Derived inputs come from a loaded app; only the engine call is timed.
+        app = SubmarineApp()
+        app.load_case(case_path)
+        props = app.hull_generator.get_properties()
+        hg, ps, so, env = case.hull_geometry, case.physics_state, case.steering_output, case.environment
+        engine = PhysicsEngine(seed=0)
+        kwargs = dict(
+            velocity_ms=ps.velocity_ms,
+            current_vector_ms=env.current_vector_ms,
+            density_kgm3=env.fluid_density_kgm3,
+            drag_coefficient=app.ingestor.get_drag_coefficient(),
+            area_m2=props.area_m2,
+            volume_m3=props.volume_m3,
+            target_fin_angle_deg=so.target_fin_angle_deg,
+            fin_offset_m=hg.fin_offset_x,
+            motor_torque_nm=so.motor_torque_nm,
+            depth_m=ps.depth_m,
+            length_m=hg.length_m,
+            diameter_m=hg.max_diameter_m,
+            sensor_noise_sigma=env.sensor_noise_sigma,
+        )
+        return lambda: engine.step(**kwargs)
+
+    suite.append(Benchmark("physics_engine.step", physics_step, number=10_000 // scale))
+
+    for steps in (1_000, 10_000, 100_000):
+        steps //= scale
+
+        def app_run(steps=steps):
+            app = SubmarineApp()
+            app.load_case(case_path)
+
+            def run():
+                app.telemetry.clear()
+                app.run(steps=steps)
+
+            return run
+
+        suite.append(Benchmark(f"app.run[{steps}]", app_run, items=steps, unit="step", repeat=3))
+
+    def load_json():
+        ingestor = MathIngestor()
+        return lambda: ingestor.load_json(case_path)
+
+    suite.append(Benchmark("math_ingestor.load_json", load_json, number=200 // scale))
+
+    hg = case.hull_geometry
+    for level, (n_theta, n_phi) in LOD_LEVELS.items():
+        triangles = len(build_grid_mesh(hg.length_m, hg.max_diameter_m, n_theta, n_phi).triangles)
+
+        def update_hull(level=level):
+            hull = HullGenerator()
+            hull.set_level_of_detail(level)
+
+            def build():
+                # Cold build: drop the cached mesh so every call regenerates it.
+                hull.mesh_cache.clear()
+                hull.update_hull(hg.length_m, hg.max_diameter_m, hg.fin_surface_area_m2)
+
+            return build
+
+        suite.append(Benchmark(f"hull.update_hull[{level}]", update_hull, items=triangles, unit="triangle"))
+
+    # Report files live in temporary directories removed by each benchmark's teardown.
+    scratch: dict[int, tempfile.TemporaryDirectory] = {}
+    for rows in (100_000, 1_000_000):
+        rows //= scale
+
+        def save_report(rows=rows):
+            app = SubmarineApp()
+            app.load_case(case_path)
+            app.run(steps=rows)
+            scratch[rows] = tempfile.TemporaryDirectory(prefix="suba_bench_")
+            target = Path(scratch[rows].name) / "report.csv"
+            return lambda: app.save_report(target)
+
+        suite.append(
+            Benchmark(
+                f"app.save_report[{rows}]",
+                save_report,
+                items=rows,
+                unit="row",
+                repeat=3,
+                teardown=lambda rows=rows: scratch.pop(rows).cleanup(),
+            )
+        )
+
+    return suite
+
+
+def run_suite(suite: list[Benchmark], name_filter: str | None = None) -> dict[str, BenchmarkResult]:
+    """Run every benchmark whose name contains ``name_filter``."""
+
+    results = {}
+    for bench in suite:
+        if name_filter and name_filter not in bench.name:
+            continue
+        results[bench.name] = run_benchmark(bench)
+    return results
+
+
+def environment_info() -> dict:
+    """Interpreter and library versions stored alongside results."""
+
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def save_baseline(results: dict[str, BenchmarkResult], path: str | Path) -> None:
+    """Write results as a baseline JSON file."""
+
+    payload = {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "results": {name: result.as_dict() for name, result in results.items()},
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: str | Path) -> dict[str, BenchmarkResult]:
+    """Read a baseline JSON file written by ``save_baseline``."""
+
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline version: {payload.get('version')}")
+    return {name: BenchmarkResult(**values) for name, values in payload["results"].items()}
+
+
+def compare(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    *,
+    threshold: float = 0.2,
+    memory_threshold: float | None = 0.5,
+) -> list[dict]:
+    """Compare two result sets benchmark by benchmark.
+
+    A benchmark regresses when its best time grows by more than
+    ``threshold`` (0.2 = 20 %), or its traced peak memory by more than
+    ``memory_threshold``. Benchmarks missing from either side are skipped.
+    """
+
+    rows = []
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        time_ratio = now.best_s / before.best_s if before.best_s > 0 else float("inf")
+        memory_ratio = now.peak_bytes / before.peak_bytes if before.peak_bytes > 0 else 1.0
+        slower = time_ratio > 1.0 + threshold
+        heavier = memory_threshold is not None and memory_ratio > 1.0 + memory_threshold
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": before.best_s,
+                "current_s": now.best_s,
+                "time_ratio": round(time_ratio, 3),
+                "memory_ratio": round(memory_ratio, 3),
+                "regression": slower or heavier,
+            }
+        )
+    return rows
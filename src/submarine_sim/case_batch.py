@@ -0,0 +1,177 @@
+"""Column-oriented view of many simulation cases at once.
+
+A ``CaseBatch`` stores every ``SimulationInput`` field as one NumPy
+column keyed by its dotted JSON path (``hull_geometry.length_m``). Batched
+tools such as sweeps evaluate all rows with one ``PhysicsEngine.step_batch``
+call instead of building one ``SubmarineApp`` per case.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Sequence
+
+import numpy as np
+
+from .drag_tables import DragTable, fixed_drag_coefficients, reynolds_number
+from .models import Environment, HullGeometry, PhysicsState, SimulationInput, SteeringOutput
+from .physics_engine import PhysicsBatch, PhysicsEngine
+
+PROFILE_FIELD = "hull_geometry.naca_profile"
+
+# Numeric fields in JSON order; the current vector is split into 3 columns.
+NUMERIC_FIELDS = (
+    "hull_geometry.length_m",
+    "hull_geometry.max_diameter_m",
+    "hull_geometry.fin_offset_x",
+    "hull_geometry.fin_surface_area_m2",
+    "physics_state.velocity_ms",
+    "physics_state.pitch_deg",
+    "physics_state.yaw_deg",
+    "physics_state.depth_m",
+    "steering_output.target_fin_angle_deg",
+    "steering_output.motor_torque_nm",
+    "environment.fluid_density_kgm3",
+    "environment.current_vector_ms.0",
+    "environment.current_vector_ms.1",
+    "environment.current_vector_ms.2",
+    "environment.sensor_noise_sigma",
+)
+
+CURRENT_FIELDS = NUMERIC_FIELDS[11:14]
+
+
+def flatten_case(case: SimulationInput) -> dict[str, float | str]:
+    """Return a case as a flat ``{dotted.path: value}`` dictionary."""
+
+    flat: dict[str, float | str] = {}
+    # Shallow walk (no asdict deep copy): this runs once per case in bulk paths.
+    for section in (f.name for f in fields(case)):
+        for name, value in vars(getattr(case, section)).items():
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    flat[f"{section}.{name}.{i}"] = float(item)
+            else:
+                flat[f"{section}.{name}"] = value
+    return flat
+
+
+def unflatten_case(flat: dict[str, float | str]) -> SimulationInput:
+    """Rebuild a ``SimulationInput`` from a flat dotted-path dictionary."""
+
+    sections: dict[str, dict] = {}
+    for key, value in flat.items():
+        section, name, *index = key.split(".")
+        if index:
+            sections.setdefault(section, {}).setdefault(name, [0.0, 0.0, 0.0])[int(index[0])] = float(value)
+        else:
+            sections.setdefault(section, {})[name] = value if name == "naca_profile" else float(value)
+
+    return SimulationInput(
+        hull_geometry=HullGeometry(**sections["hull_geometry"]),
+        physics_state=PhysicsState(**sections["physics_state"]),
+        steering_output=SteeringOutput(**sections["steering_output"]),
+        environment=Environment(**sections["environment"]),
+    )
+
+
+@dataclass
+class CaseBatch:
+    """Struct-of-arrays container with one row per simulation case."""
+
+    columns: dict[str, np.ndarray]
+
+    @classmethod
+    def from_cases(cls, cases: Sequence[SimulationInput]) -> CaseBatch:
+        """Stack a sequence of parsed cases into columns."""
+
+        flats = [flatten_case(case) for case in cases]
+        columns = {name: np.array([f[name] for f in flats], dtype=float) for name in NUMERIC_FIELDS}
+        columns[PROFILE_FIELD] = np.array([f[PROFILE_FIELD] for f in flats], dtype=object)
+        return cls(columns)
+
+    @classmethod
+    def repeat(cls, case: SimulationInput, n: int) -> CaseBatch:
+        """Return ``n`` copies of one case, ready for per-column overrides."""
+
+        flat = flatten_case(case)
+        columns = {name: np.full(n, flat[name], dtype=float) for name in NUMERIC_FIELDS}
+        columns[PROFILE_FIELD] = np.full(n, flat[PROFILE_FIELD], dtype=object)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns[NUMERIC_FIELDS[0]])
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def set_column(self, field: str, values: np.ndarray | Sequence) -> None:
+        """Override one column in place; values are broadcast to the batch size."""
+
+        if field not in self.columns:
+            raise KeyError(f"Unknown case field: {field}")
+        dtype = object if field == PROFILE_FIELD else float
+        self.columns[field] = np.broadcast_to(np.asarray(values, dtype=dtype), (len(self),)).copy()
+
+    def case(self, index: int) -> SimulationInput:
+        """Return one row as a ``SimulationInput``."""
+
+        flat = {name: col[index] for name, col in self.columns.items()}
+        return unflatten_case({k: (v if k == PROFILE_FIELD else float(v)) for k, v in flat.items()})
+
+    def current_vectors(self) -> np.ndarray:
+        """Return the current vector columns as an ``(N, 3)`` array."""
+
+        return np.column_stack([self.columns[name] for name in CURRENT_FIELDS])
+
+    def hull_properties(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(area_m2, volume_m3)`` using ``HullGenerator``'s formulas."""
+
+        radius = self.columns["hull_geometry.max_diameter_m"] / 2.0
+        a = self.columns["hull_geometry.length_m"] / 2.0
+        area = np.pi * radius * radius
+        volume = (4.0 / 3.0) * np.pi * a * radius * radius
+        return area, volume
+
+    def drag_coefficients(self, drag_table: DragTable | None = None) -> np.ndarray:
+        """Vectorized ``MathIngestor.get_drag_coefficient``."""
+
+        if drag_table is not None:
+            re_number = reynolds_number(
+                self.columns["physics_state.velocity_ms"],
+                self.columns["hull_geometry.length_m"],
+                self.columns["environment.fluid_density_kgm3"],
+            )
+            return drag_table.lookup_many(
+                self.columns[PROFILE_FIELD], re_number, self.columns["steering_output.target_fin_angle_deg"]
+            )
+        return fixed_drag_coefficients(self.columns[PROFILE_FIELD])
+
+    def evaluate(
+        self,
+        engine: PhysicsEngine,
+        *,
+        noise_enabled: bool = False,
+        rng: np.random.Generator | None = None,
+        drag_table: DragTable | None = None,
+    ) -> PhysicsBatch:
+        """Run one physics step for every row, like ``update_scene`` per case."""
+
+        area, volume = self.hull_properties()
+        sigma = self.columns["environment.sensor_noise_sigma"] if noise_enabled else 0.0
+        return engine.step_batch(
+            velocity_ms=self.columns["physics_state.velocity_ms"],
+            current_vector_ms=self.current_vectors(),
+            density_kgm3=self.columns["environment.fluid_density_kgm3"],
+            drag_coefficient=self.drag_coefficients(drag_table),
+            area_m2=area,
+            volume_m3=volume,
+            target_fin_angle_deg=self.columns["steering_output.target_fin_angle_deg"],
+            fin_offset_m=self.columns["hull_geometry.fin_offset_x"],
+            motor_torque_nm=self.columns["steering_output.motor_torque_nm"],
+            depth_m=self.columns["physics_state.depth_m"],
+            length_m=self.columns["hull_geometry.length_m"],
+            diameter_m=self.columns["hull_geometry.max_diameter_m"],
+            sensor_noise_sigma=sigma,
+            rng=rng,
+        )
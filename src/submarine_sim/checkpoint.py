@@ -0,0 +1,134 @@
+"""Checkpoint and resume for long ``SubmarineApp`` runs.
+
+A checkpoint holds everything that decides the next steps: the loaded
+case (including steering changed at run time), ``UIState``, the step
+counter, the noise generator state, the stored telemetry columns, and
+each sink's position (e.g. the byte offset of a streamed CSV report).
+It is pickled, zlib-compressed and written atomically, so a crash while
+saving leaves the previous checkpoint intact.
+
+Resuming restores that state into a fresh app and truncates streamed
+reports back to the checkpoint (undoing any rotations made since), so
+the finished run is byte-identical to one that was never interrupted.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import zlib
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+from .telemetry_sinks import TelemetrySink
+from .ui_controller import UIState
+
+if TYPE_CHECKING:
+    from .app import SubmarineApp
+
+# File signature plus format version; bump the version when fields change.
+MAGIC = b"SUBCKPT1"
+# zlib level 1: most of the size win on telemetry columns at a fraction of the cost.
+COMPRESSION_LEVEL = 1
+
+
+@dataclass
+class Checkpoint:
+    """Everything needed to continue a run where it stopped."""
+
+    step_index: int
+    case: object  # SimulationInput
+    ui_state: UIState
+    rng_state: tuple
+    telemetry: object  # TelemetryStore
+    sink_states: list[dict]
+
+
+def capture(app: SubmarineApp, sinks: Sequence[TelemetrySink] = ()) -> Checkpoint:
+    """Flush ``sinks`` and collect the app's resumable state."""
+
+    if app.ingestor.current_params is None:
+        raise ValueError("No case loaded.")
+    return Checkpoint(
+        step_index=app.step_index,
+        case=app.ingestor.current_params,
+        ui_state=replace(app.ui_controller.state),
+        rng_state=app.physics_engine.rng.getstate(),
+        telemetry=app.telemetry,
+        sink_states=[sink.checkpoint_state() for sink in sinks],
+    )
+
+
+def save_checkpoint(app: SubmarineApp, path: str | Path, sinks: Sequence[TelemetrySink] = ()) -> Path:
+    """Write a compressed checkpoint of ``app`` (and ``sinks``) to ``path``."""
+
+    data = zlib.compress(pickle.dumps(capture(app, sinks), protocol=pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as fh:
+        fh.write(MAGIC)
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    tmp.replace(target)
+    return target
+
+
+def load_checkpoint(path: str | Path) -> Checkpoint:
+    """Read a checkpoint written by ``save_checkpoint``.
+
+    Checkpoints are pickles: only load files you wrote yourself.
+    """
+
+    raw = Path(path).read_bytes()
+    if not raw.startswith(MAGIC):
+        raise ValueError(f"Not a simulation checkpoint (or unsupported version): {path}")
+    return pickle.loads(zlib.decompress(raw[len(MAGIC) :]))
+
+
+def restore(app: SubmarineApp, checkpoint: Checkpoint, sinks: Sequence[TelemetrySink] = ()) -> int:
+    """Put ``checkpoint`` into ``app`` and ``sinks``; return the step to continue from."""
+
+    if len(sinks) != len(checkpoint.sink_states):
+        raise ValueError(f"Checkpoint has {len(checkpoint.sink_states)} sink(s), got {len(sinks)}.")
+    app.ingestor.current_params = checkpoint.case
+    app._apply_case()
+    vars(app.ui_controller.state).update(vars(checkpoint.ui_state))
+    app.invalidate_derived("noise")
+    app.physics_engine.rng.setstate(checkpoint.rng_state)
+    app.telemetry = checkpoint.telemetry
+    app.step_index = checkpoint.step_index
+    for sink, state in zip(sinks, checkpoint.sink_states):
+        sink.restore_state(state)
+    return app.step_index
+
+
+def run_with_checkpoints(
+    app: SubmarineApp,
+    steps: int,
+    path: str | Path,
+    *,
+    every: int,
+    sinks: Sequence[TelemetrySink] | None = None,
+) -> dict | None:
+    """Run until ``app.step_index`` reaches ``steps``, saving every ``every`` steps.
+
+    With ``sinks`` the run streams through ``run_streaming``; otherwise
+    rows go to the in-memory store via ``run``. A preempted run loses at
+    most ``every`` steps of work. Returns the last row produced, if any.
+    """
+
+    if every <= 0:
+        raise ValueError("every must be > 0.")
+    last = None
+    while app.step_index < steps:
+        chunk = min(every, steps - app.step_index)
+        if sinks is None:
+            last = app.run(steps=chunk)[-1]
+            save_checkpoint(app, path)
+        else:
+            last = app.run_streaming(chunk, sinks)
+            save_checkpoint(app, path, sinks)
+    return last
@@ -0,0 +1,94 @@
+"""Memoized per-case values with dependency-based invalidation.
+
+``SubmarineApp`` derives several values from the loaded case, the hull
+and the UI state (hull area/volume, drag coefficient, noise sigma, the
+physics step constants). They only change when one of those inputs
+changes, so each is computed once and kept until an input it depends on
+is invalidated::
+
+    cache = DerivedCache({"props": ("hull",), "cd": ("case",), "inputs": ("props", "cd", "noise")})
+    cache.get("inputs", build_inputs)
+    cache.invalidate("hull")  # drops "props" and, through it, "inputs"
+
+Hit/miss/invalidation counters are kept per value for monitoring.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Callable, Mapping, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cached value."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class DerivedCache:
+    """Values keyed by name, each dropped when one of its dependencies changes.
+
+    ``dependencies`` maps a value name to the names it is derived from:
+    other cached values or plain input names (e.g. ``"case"``) that are
+    only ever passed to ``invalidate``.
+    """
+
+    def __init__(self, dependencies: Mapping[str, tuple[str, ...]]) -> None:
+        self.dependencies = {name: tuple(deps) for name, deps in dependencies.items()}
+        # Reverse edges: input or value -> values derived directly from it.
+        self._dependents: dict[str, list[str]] = {}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(name)
+        self._values: dict[str, object] = {}
+        self.stats = {name: CacheStats() for name in self.dependencies}
+
+    def get(self, name: str, compute: Callable[[], T]) -> T:
+        """Return the cached ``name``, calling ``compute()`` on a miss."""
+
+        stats = self.stats[name]
+        try:
+            value = self._values[name]
+        except KeyError:
+            stats.misses += 1
+            value = self._values[name] = compute()
+            return value
+        stats.hits += 1
+        return value
+
+    def invalidate(self, source: str) -> None:
+        """Drop ``source`` (if cached) and every value derived from it."""
+
+        pending = [source]
+        while pending:
+            name = pending.pop()
+            if self._values.pop(name, _MISSING) is not _MISSING:
+                self.stats[name].invalidations += 1
+            pending.extend(self._dependents.get(name, ()))
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+
+        for name in list(self._values):
+            self.invalidate(name)
+
+    def summary(self) -> dict:
+        """Per-value counters plus totals, JSON-friendly."""
+
+        values = {name: asdict(stats) for name, stats in self.stats.items()}
+        hits = sum(stats.hits for stats in self.stats.values())
+        misses = sum(stats.misses for stats in self.stats.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 6) if hits + misses else 0.0,
+            "values": values,
+        }
+
@@ -0,0 +1,148 @@
+"""Tabulated drag coefficients Cd(Re, profile, fin angle).
+
+A drag table is a CSV with ``profile,reynolds,fin_angle_deg,cd`` rows
+(see ``data/drag_coefficients.csv``). Each profile's rows must form a
+full Reynolds-number x fin-angle grid. Interpolators are built once per
+profile and answer whole NumPy arrays of queries at a time.
+"""
+
+from __future__ import annotations
+
+import csv
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_DRAG_TABLE = Path(__file__).resolve().parents[2] / "data" / "drag_coefficients.csv"
+
+# Dynamic viscosity of seawater around 15 degC.
+SEAWATER_VISCOSITY_PAS = 1.08e-3
+
+# Historical fixed Cd per NACA profile, used when no drag table is given.
+FIXED_DRAG_COEFFICIENTS = {"0009": 0.2, "0012": 0.23, "0015": 0.23}
+
+
+def fixed_drag_coefficients(profiles) -> np.ndarray:
+    """Fixed Cd for each profile; unknown profiles raise ``ValueError``."""
+
+    profiles = np.asarray(profiles)
+    cd = np.empty(profiles.shape, dtype=float)
+    for profile in np.unique(profiles):
+        try:
+            cd[profiles == profile] = FIXED_DRAG_COEFFICIENTS[str(profile)]
+        except KeyError:
+            known = ", ".join(sorted(FIXED_DRAG_COEFFICIENTS))
+            raise ValueError(f"No fixed drag coefficient for NACA profile {str(profile)!r} (known: {known}).") from None
+    return cd
+
+
+def reynolds_number(velocity_ms, length_m, density_kgm3, viscosity_pas: float = SEAWATER_VISCOSITY_PAS):
+    """Return the hull Reynolds number ``rho * |v| * L / mu`` (scalars or arrays)."""
+
+    return np.asarray(density_kgm3) * np.abs(velocity_ms) * np.asarray(length_m) / viscosity_pas
+
+
+class DragInterpolator:
+    """Bilinear interpolation in ``(log10 Re, |fin angle|)`` for one profile.
+
+    Queries outside the table are clamped to its edges.
+    """
+
+    def __init__(self, reynolds: np.ndarray, fin_angle_deg: np.ndarray, cd: np.ndarray) -> None:
+        if len(reynolds) < 2 or len(fin_angle_deg) < 2:
+            raise ValueError("Drag tables need at least two Reynolds numbers and two fin angles.")
+        if cd.shape != (len(reynolds), len(fin_angle_deg)):
+            raise ValueError("cd grid shape does not match its axes.")
+        self.reynolds = reynolds
+        self.fin_angle_deg = fin_angle_deg
+        self.cd = cd
+        # Precomputed once so each query is a few array operations.
+        self._log_re = np.log10(reynolds)
+        self._log_re_step = np.diff(self._log_re)
+        self._angle_step = np.diff(fin_angle_deg)
+
+    def __call__(self, reynolds, fin_angle_deg) -> np.ndarray:
+        x = np.log10(np.clip(reynolds, self.reynolds[0], self.reynolds[-1]))
+        y = np.clip(np.abs(fin_angle_deg), self.fin_angle_deg[0], self.fin_angle_deg[-1])
+        i = np.clip(np.searchsorted(self._log_re, x, side="right") - 1, 0, len(self._log_re) - 2)
+        j = np.clip(np.searchsorted(self.fin_angle_deg, y, side="right") - 1, 0, len(self.fin_angle_deg) - 2)
+        tx = (x - self._log_re[i]) / self._log_re_step[i]
+        ty = (y - self.fin_angle_deg[j]) / self._angle_step[j]
+        c = self.cd
+        low = c[i, j] + (c[i + 1, j] - c[i, j]) * tx
+        high = c[i, j + 1] + (c[i + 1, j + 1] - c[i, j + 1]) * tx
+        return low + (high - low) * ty
+
+
+class DragTable:
+    """All profiles of one drag-table file, with interpolators cached per profile."""
+
+    def __init__(self, path: str | Path = DEFAULT_DRAG_TABLE) -> None:
+        self.path = Path(path)
+        self._rows: dict[str, list[tuple[float, float, float]]] = {}
+        with self.path.open(newline="", encoding="utf-8") as fh:
+            for row in csv.DictReader(fh):
+                key = row["profile"].strip()
+                self._rows.setdefault(key, []).append(
+                    (float(row["reynolds"]), float(row["fin_angle_deg"]), float(row["cd"]))
+                )
+        self._interpolators: dict[str, DragInterpolator] = {}
+
+    @property
+    def profiles(self) -> list[str]:
+        return sorted(self._rows)
+
+    def interpolator(self, profile: str) -> DragInterpolator:
+        """Return the (cached) interpolator for one NACA profile."""
+
+        interp = self._interpolators.get(profile)
+        if interp is None:
+            if profile not in self._rows:
+                raise ValueError(f"No drag data for NACA profile {profile!r} in {self.path}.")
+            interp = _build_interpolator(profile, self._rows[profile])
+            self._interpolators[profile] = interp
+        return interp
+
+    def lookup(self, profile: str, reynolds, fin_angle_deg) -> np.ndarray:
+        """Cd for one profile at any number of ``(Re, fin angle)`` points."""
+
+        return self.interpolator(profile)(reynolds, fin_angle_deg)
+
+    def lookup_many(self, profiles: np.ndarray, reynolds: np.ndarray, fin_angle_deg: np.ndarray) -> np.ndarray:
+        """Cd for rows that may each use a different profile."""
+
+        profiles = np.asarray(profiles)
+        reynolds = np.broadcast_to(reynolds, profiles.shape)
+        fin_angle_deg = np.broadcast_to(fin_angle_deg, profiles.shape)
+        cd = np.empty(profiles.shape, dtype=float)
+        for profile in np.unique(profiles):
+            mask = profiles == profile
+            cd[mask] = self.lookup(str(profile), reynolds[mask], fin_angle_deg[mask])
+        return cd
+
+
+def _build_interpolator(profile: str, rows: list[tuple[float, float, float]]) -> DragInterpolator:
+    """Arrange one profile's rows into a grid and wrap it in an interpolator."""
+
+    data = np.asarray(rows, dtype=float)
+    reynolds = np.unique(data[:, 0])
+    angles = np.unique(data[:, 1])
+    if len(data) != len(reynolds) * len(angles):
+        raise ValueError(f"Drag table for profile {profile!r} is not a full Reynolds x fin-angle grid.")
+    cd = np.full((len(reynolds), len(angles)), np.nan)
+    cd[np.searchsorted(reynolds, data[:, 0]), np.searchsorted(angles, data[:, 1])] = data[:, 2]
+    if np.isnan(cd).any():
+        raise ValueError(f"Drag table for profile {profile!r} has duplicate points.")
+    return DragInterpolator(reynolds, angles, cd)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: Path) -> DragTable:
+    return DragTable(path)
+
+
+def load_drag_table(path: str | Path = DEFAULT_DRAG_TABLE) -> DragTable:
+    """Return a shared ``DragTable`` for ``path`` (each file is read once)."""
+
+    return _load_cached(Path(path).resolve())
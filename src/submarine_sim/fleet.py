@@ -0,0 +1,411 @@
+"""Multi-vehicle fleet simulation with grid-based proximity checks.
+
+A ``Fleet`` keeps N vehicles as struct-of-arrays: static parameters in a
+``CaseBatch`` plus position, speed, pitch and yaw columns. Each ``step``
+advances every vehicle with the ``TrajectoryIntegrator`` motion model
+(one Euler step of ``dt_s``) and evaluates physics for all of them in one
+``PhysicsEngine.step_batch`` call.
+
+Close approaches are found with ``SpatialGrid``, a uniform-grid spatial
+hash. Its cell size equals the search radius, so only neighbouring cells
+are compared and the cost grows with N plus the number of nearby pairs,
+not N squared. Rows go to a shared columnar ``FleetTelemetry``.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from .case_batch import CaseBatch
+from .models import SimulationInput
+from .physics_engine import PhysicsBatch, PhysicsEngine
+from .telemetry_store import FIELD_DTYPES, SNAPSHOT_FIELDS
+from .trajectory import TrajectoryConfig
+
+# Cell coordinates are packed into one int64 key, 21 bits per axis.
+_AXIS_BITS = 21
+_AXIS_OFFSET = 1 << (_AXIS_BITS - 1)
+
+# Neighbour offsets that visit each unordered pair of adjacent cells once:
+# the cell itself plus 13 of its 26 neighbours.
+_HALF_STENCIL = np.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1) if (dx, dy, dz) >= (0, 0, 0)],
+    dtype=np.int64,
+)
+
+STATE_FIELDS = ("x_m", "y_m", "depth_m", "velocity_ms", "pitch_deg", "yaw_deg")
+
+FLEET_FIELDS = ("step", "vehicle", "time_s") + STATE_FIELDS + SNAPSHOT_FIELDS
+
+FLEET_DTYPES = {"step": np.int64, "vehicle": np.int64, "time_s": np.float64}
+FLEET_DTYPES.update({name: np.float64 for name in STATE_FIELDS})
+FLEET_DTYPES.update(FIELD_DTYPES)
+
+
+def _cell_keys(cells: np.ndarray) -> np.ndarray:
+    """Pack ``(N, 3)`` integer cell coordinates into int64 keys."""
+
+    shifted = cells + _AXIS_OFFSET
+    return (shifted[:, 0] << (2 * _AXIS_BITS)) | (shifted[:, 1] << _AXIS_BITS) | shifted[:, 2]
+
+
+class SpatialGrid:
+    """Uniform-grid spatial hash over 3D points.
+
+    Points are sorted by cell key so each cell is a contiguous run.
+    ``update`` reuses the previous order: when no point changed cell
+    nothing is re-sorted, otherwise the nearly sorted keys are re-sorted
+    with a stable sort, which is cheap for small moves.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0.0:
+            raise ValueError("cell_size must be > 0.")
+        self.cell_size = cell_size
+        self.points = np.empty((0, 3))
+        self.rebuilds = 0
+        self.reuses = 0
+        self._keys = np.empty(0, dtype=np.int64)
+        self._order = np.empty(0, dtype=np.int64)
+        self._cells = np.empty((0, 3), dtype=np.int64)
+
+    def update(self, points: np.ndarray) -> None:
+        """Index new positions for the same (or a new) set of points."""
+
+        points = np.asarray(points, dtype=float)
+        cells = np.floor(points / self.cell_size).astype(np.int64)
+        if np.abs(cells).max(initial=0) >= _AXIS_OFFSET - 1:
+            raise ValueError("Points are too far from the origin for this cell size.")
+        keys = _cell_keys(cells)
+        self.points = points
+        self._cells = cells
+        if len(keys) == len(self._keys) and np.array_equal(keys, self._keys):
+            self.reuses += 1
+            return
+        if len(keys) == len(self._order):
+            # Start from the last order: keys moved little, so this is nearly sorted.
+            order = self._order[np.argsort(keys[self._order], kind="stable")]
+        else:
+            order = np.argsort(keys, kind="stable")
+        self._keys = keys
+        self._order = order
+        self.rebuilds += 1
+
+    def pairs_within(self, radius: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(i, j, distance)`` for every pair closer than ``radius``.
+
+        ``radius`` must not exceed ``cell_size``. Each pair appears once
+        with ``i < j``.
+        """
+
+        if radius > self.cell_size:
+            raise ValueError("radius must be <= cell_size.")
+        empty = np.empty(0, dtype=np.int64)
+        if len(self._order) < 2:
+            return empty, empty, np.empty(0)
+
+        sorted_keys = self._keys[self._order]
+        uniq, starts, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+        cell_coords = self._cells[self._order[starts]]
+
+        firsts, seconds = [], []
+        for offset in _HALF_STENCIL:
+            same_cell = not offset.any()
+            if same_cell:
+                a = np.flatnonzero(counts > 1)
+                b = a
+            else:
+                target = _cell_keys(cell_coords + offset)
+                idx = np.minimum(np.searchsorted(uniq, target), len(uniq) - 1)
+                a = np.flatnonzero(uniq[idx] == target)
+                b = idx[a]
+            if not len(a):
+                continue
+            na, nb = counts[a], counts[b]
+            sizes = na * nb
+            total = int(sizes.sum())
+            # Enumerate every (p, q) member combination of each cell pair without a Python loop.
+            within = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            nb_rep = np.repeat(nb, sizes)
+            p = np.repeat(starts[a], sizes) + within // nb_rep
+            q = np.repeat(starts[b], sizes) + within % nb_rep
+            if same_cell:
+                keep = p < q
+                p, q = p[keep], q[keep]
+            firsts.append(p)
+            seconds.append(q)
+
+        if not firsts:
+            return empty, empty, np.empty(0)
+        i = self._order[np.concatenate(firsts)]
+        j = self._order[np.concatenate(seconds)]
+        distance = np.linalg.norm(self.points[i] - self.points[j], axis=1)
+        close = distance < radius
+        i, j, distance = i[close], j[close], distance[close]
+        swap = i > j
+        i[swap], j[swap] = j[swap], i[swap]
+        return i, j, distance
+
+
+class _Columns:
+    """Growable typed columns (doubling), shared by the fleet logs."""
+
+    def __init__(self, dtypes: dict, capacity: int = 1024) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._data = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in dtypes.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._data.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._data[name] = grown
+        self._capacity = capacity
+
+    def extend(self, values: dict) -> None:
+        """Append rows; every value is an array of equal length or a scalar."""
+
+        n = max((np.size(v) for v in values.values()), default=0)
+        self._reserve(n)
+        start, stop = self._size, self._size + n
+        for name, column in self._data.items():
+            column[start:stop] = values[name]
+        self._size = stop
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Zero-copy views of the filled rows."""
+
+        return {name: column[: self._size] for name, column in self._data.items()}
+
+    def save_csv(self, output_path: str | Path) -> None:
+        """Write all rows with a header, one column per field."""
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = self.columns()
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(column.tolist() for column in columns.values())))
+
+
+class FleetTelemetry(_Columns):
+    """One row per recorded vehicle-step (columns: ``FLEET_FIELDS``)."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        super().__init__(FLEET_DTYPES, capacity)
+
+
+class ProximityLog(_Columns):
+    """One row per close pair or colliding pair per step; ``collision`` marks overlapping hulls."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        super().__init__(
+            {"step": np.int64, "a": np.int64, "b": np.int64, "distance_m": np.float64, "collision": np.bool_},
+            capacity,
+        )
+
+
+@dataclass
+class FleetStep:
+    """Outputs of one fleet step."""
+
+    step: int
+    snapshots: PhysicsBatch
+    close_pairs: tuple[np.ndarray, np.ndarray, np.ndarray]
+    collisions: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+
+
+class Fleet:
+    """N vehicles stepped together as struct-of-arrays."""
+
+    def __init__(
+        self,
+        cases: CaseBatch,
+        positions: np.ndarray | None = None,
+        *,
+        proximity_m: float = 10.0,
+        config: TrajectoryConfig | None = None,
+        engine: PhysicsEngine | None = None,
+        noise_enabled: bool = False,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        n = len(cases)
+        self.cases = cases
+        self.config = config or TrajectoryConfig()
+        self.engine = engine or PhysicsEngine()
+        self.noise_enabled = noise_enabled
+        self.rng = rng if rng is not None else np.random.default_rng()
+        if proximity_m <= 0.0:
+            raise ValueError("proximity_m must be > 0.")
+        self.proximity_m = proximity_m
+
+        positions = np.zeros((n, 3)) if positions is None else np.asarray(positions, dtype=float)
+        if positions.shape != (n, 3):
+            raise ValueError(f"positions must have shape ({n}, 3).")
+        self.x_m = positions[:, 0].copy()
+        self.y_m = positions[:, 1].copy()
+        self.depth_m = positions[:, 2].copy()
+        self.velocity_ms = cases["physics_state.velocity_ms"].copy()
+        self.pitch_deg = cases["physics_state.pitch_deg"].copy()
+        self.yaw_deg = cases["physics_state.yaw_deg"].copy()
+        self.step_index = 0
+
+        # Per-vehicle constants, computed once.
+        self.area_m2, self.volume_m3 = cases.hull_properties()
+        self.drag_coefficient = cases.drag_coefficients()
+        self._current = cases.current_vectors()
+        # Bounding sphere of each hull; overlapping spheres count as a collision.
+        self.hull_radius_m = cases["hull_geometry.length_m"] / 2.0
+        # The grid must see every pair within proximity_m and every possible collision.
+        self.grid = SpatialGrid(max(proximity_m, 2.0 * float(self.hull_radius_m.max(initial=0.0))))
+
+    @classmethod
+    def from_case(
+        cls,
+        case: SimulationInput,
+        n: int,
+        *,
+        spacing_m: float = 20.0,
+        seed: int | None = None,
+        **kwargs,
+    ) -> Fleet:
+        """Spawn ``n`` copies of ``case`` on a square lattice with random headings."""
+
+        rng = np.random.default_rng(seed)
+        cases = CaseBatch.repeat(case, n)
+        cases.set_column("physics_state.yaw_deg", rng.uniform(-180.0, 180.0, n))
+        side = int(np.ceil(np.sqrt(n)))
+        index = np.arange(n)
+        positions = np.column_stack(
+            (
+                (index % side) * spacing_m,
+                (index // side) * spacing_m,
+                np.full(n, case.physics_state.depth_m),
+            )
+        )
+        kwargs.setdefault("rng", rng)
+        return cls(cases, positions, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def positions(self) -> np.ndarray:
+        """``(N, 3)`` array of x, y, depth."""
+
+        return np.column_stack((self.x_m, self.y_m, self.depth_m))
+
+    def step(self) -> FleetStep:
+        """Evaluate physics at the current state, then advance every vehicle by ``dt_s``."""
+
+        cfg = self.config
+        c = self.cases
+        dt = cfg.dt_s
+        rho = c["environment.fluid_density_kgm3"]
+        length = c["hull_geometry.length_m"]
+        motor_torque = c["steering_output.motor_torque_nm"]
+
+        snapshots = self.engine.step_batch(
+            velocity_ms=self.velocity_ms,
+            current_vector_ms=self._current,
+            density_kgm3=rho,
+            drag_coefficient=self.drag_coefficient,
+            area_m2=self.area_m2,
+            volume_m3=self.volume_m3,
+            target_fin_angle_deg=c["steering_output.target_fin_angle_deg"],
+            fin_offset_m=c["hull_geometry.fin_offset_x"],
+            motor_torque_nm=motor_torque,
+            depth_m=self.depth_m,
+            length_m=length,
+            diameter_m=c["hull_geometry.max_diameter_m"],
+            sensor_noise_sigma=c["environment.sensor_noise_sigma"] if self.noise_enabled else 0.0,
+            rng=self.rng,
+        )
+
+        self.grid.update(self.positions())
+        # Query the full cell size so collisions beyond proximity_m are found too.
+        i, j, distance = self.grid.pairs_within(self.grid.cell_size)
+        collisions = distance < self.hull_radius_m[i] + self.hull_radius_m[j]
+        keep = (distance < self.proximity_m) | collisions
+        i, j, distance, collisions = i[keep], j[keep], distance[keep], collisions[keep]
+        result = FleetStep(self.step_index, snapshots, (i, j, distance), collisions)
+
+        # Motion model of TrajectoryIntegrator, one Euler step at a time.
+        mass = rho * self.volume_m3
+        drag_k = 0.5 * rho * self.drag_coefficient * self.area_m2
+        thrust = motor_torque * cfg.thrust_per_torque
+        v = self.velocity_ms
+        # Semi-implicit drag term keeps the update stable for large dt.
+        new_v = (v + thrust / mass * dt) / (1.0 + drag_k / mass * np.abs(v) * dt)
+
+        gm = snapshots.gm_m
+        pitch_rate = np.sqrt(self.engine.gravity * np.abs(gm)) / length
+        decay = np.where(gm >= 0.0, -pitch_rate, pitch_rate)
+        pitch_rad = np.radians(self.pitch_deg)
+
+        authority = np.ones_like(v)
+        needs = snapshots.torque_required_nm > motor_torque
+        authority[needs] = motor_torque[needs] / snapshots.torque_required_nm[needs]
+        fin_rad = np.radians(c["steering_output.target_fin_angle_deg"]) * authority
+        yaw_rad = np.radians(self.yaw_deg)
+
+        heave = 0.0
+        if cfg.ballast_n != 0.0:
+            cross_area = length * c["hull_geometry.max_diameter_m"]
+            heave = np.sign(cfg.ballast_n) * np.sqrt(
+                2.0 * abs(cfg.ballast_n) / (rho * cfg.heave_drag_coefficient * cross_area)
+            )
+        horizontal = v * np.cos(pitch_rad)
+        # New arrays, not in-place updates: run() keeps the previous state for logging.
+        self.x_m = self.x_m + horizontal * np.cos(yaw_rad) * dt
+        self.y_m = self.y_m + horizontal * np.sin(yaw_rad) * dt
+        self.depth_m = np.maximum(self.depth_m + (heave - v * np.sin(pitch_rad)) * dt, 0.0)
+        self.yaw_deg = self.yaw_deg + np.degrees(v * np.tan(fin_rad) / length * dt)
+        self.pitch_deg = np.clip(self.pitch_deg * np.exp(decay * dt), -90.0, 90.0)
+        self.velocity_ms = new_v
+        self.step_index += 1
+        return result
+
+    def run(
+        self,
+        steps: int,
+        *,
+        telemetry: FleetTelemetry | None = None,
+        proximity: ProximityLog | None = None,
+        record_every: int = 1,
+    ) -> FleetStep | None:
+        """Run ``steps`` steps, logging rows every ``record_every`` steps.
+
+        Telemetry rows describe the state each step's physics was
+        evaluated at. Returns the last step's outputs.
+        """
+
+        if record_every <= 0:
+            raise ValueError("record_every must be > 0.")
+        last = None
+        vehicles = np.arange(len(self))
+        for _ in range(steps):
+            step = self.step_index
+            state = {name: getattr(self, name) for name in STATE_FIELDS} if telemetry is not None else None
+            last = self.step()
+            if telemetry is not None and step % record_every == 0:
+                row = {"step": step, "vehicle": vehicles, "time_s": step * self.config.dt_s, **state}
+                row.update(last.snapshots.as_dict())
+                telemetry.extend(row)
+            if proximity is not None and len(last.collisions):
+                i, j, distance = last.close_pairs
+                proximity.extend({"step": step, "a": i, "b": j, "distance_m": distance, "collision": last.collisions})
+        return last
@@ -4,13 +4,88 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 
 import numpy as np
 
-try:
-    import open3d as o3d
-except ImportError:  # pragma: no cover - optional for CI/headless
-    o3d = None
+from .hydrostatics import Hydrostatics, compute_hydrostatics
+from .mesh_cache import MeshArrays, MeshCache, make_key
+
+
+@lru_cache(maxsize=None)
+def load_open3d():
+    """Import Open3D on first use; ``None`` when it is not installed.
+
+    Importing Open3D takes seconds, so headless runs that never build a
+    mesh object should never call this.
+    """
+
+    try:
+        import open3d
+    except ImportError:  # pragma: no cover - optional for CI/headless
+        return None
+    return open3d
+
+
+# Grid resolutions (n_theta, n_phi) selectable at runtime.
+LOD_LEVELS = {
+    "low": (16, 24),
+    "medium": (48, 64),
+    "high": (160, 256),
+}
+
+
+def build_grid_mesh(length_m: float, diameter_m: float, n_theta: int = 48, n_phi: int = 64) -> MeshArrays:
+    """Triangulate the (theta, phi) hull grid directly, without qhull.
+
+    The two poles are single vertices joined to the first/last ring by a
+    triangle fan; rings in between are joined by two triangles per grid
+    cell. All faces are wound counter-clockwise seen from outside, and
+    normals come from the ellipsoid's analytic gradient.
+    """
+
+    if n_theta < 3 or n_phi < 3:
+        raise ValueError("n_theta and n_phi must be >= 3.")
+
+    a = length_m / 2.0
+    b = diameter_m / 2.0
+    n_rings = n_theta - 2
+
+    # Interior rings only; phi excludes 2*pi so the seam is not duplicated.
+    theta = np.linspace(0.0, np.pi, n_theta)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, n_phi, endpoint=False)
+    t_grid, p_grid = np.meshgrid(theta, phi, indexing="ij")
+    ring_points = np.column_stack(
+        (
+            (a * np.cos(t_grid)).ravel(),
+            (b * np.sin(t_grid) * np.cos(p_grid)).ravel(),
+            (b * np.sin(t_grid) * np.sin(p_grid)).ravel(),
+        )
+    )
+    vertices = np.vstack(([a, 0.0, 0.0], ring_points, [-a, 0.0, 0.0]))
+    nose = 0
+    tail = len(vertices) - 1
+
+    # Index arithmetic over the ring grid (vertex 0 is the nose pole).
+    j = np.arange(n_phi)
+    j_next = (j + 1) % n_phi
+    ring = 1 + np.arange(n_rings)[:, None] * n_phi
+    v00 = (ring[:-1] + j).ravel()
+    v01 = (ring[:-1] + j_next).ravel()
+    v10 = (ring[1:] + j).ravel()
+    v11 = (ring[1:] + j_next).ravel()
+    bands = np.concatenate((np.column_stack((v00, v10, v11)), np.column_stack((v00, v11, v01))))
+
+    last_ring = 1 + (n_rings - 1) * n_phi
+    nose_fan = np.column_stack((np.full(n_phi, nose), 1 + j, 1 + j_next))
+    tail_fan = np.column_stack((np.full(n_phi, tail), last_ring + j_next, last_ring + j))
+    triangles = np.concatenate((nose_fan, bands, tail_fan)).astype(np.int32)
+
+    # Gradient of x^2/a^2 + (y^2 + z^2)/b^2 gives the outward surface normal.
+    normals = vertices / np.array([a * a, b * b, b * b])
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    return MeshArrays(vertices, triangles, normals)
 
 
 @dataclass
@@ -24,11 +99,28 @@ class HullProperties:
 class HullGenerator:
     """Creates a coarse submarine hull and computes geometric properties."""
 
-    def __init__(self) -> None:
-        self.submarine_mesh = None
+    def __init__(self, mesh_cache: MeshCache | None = None, hydrostatics: str = "analytic") -> None:
+        if hydrostatics not in {"analytic", "mesh"}:
+            raise ValueError("hydrostatics must be 'analytic' or 'mesh'.")
+        # Both are built on first use; see ``set_dimensions``.
+        self._submarine_mesh = None
+        self.mesh_arrays: MeshArrays | None = None
+        # "analytic" keeps the ellipsoid formulas; "mesh" integrates the built mesh.
+        self.hydrostatics = hydrostatics
         self.length_m = 3.0
         self.diameter_m = 0.5
         self.fin_surface_area_m2 = 0.08
+        self.level_of_detail = "medium"
+        self.n_theta, self.n_phi = LOD_LEVELS[self.level_of_detail]
+        # Repeated loads of the same geometry reuse the cached mesh arrays.
+        self.mesh_cache = mesh_cache if mesh_cache is not None else MeshCache()
+        # Called after every dimension or LOD change, e.g. to drop values derived from the hull.
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback()`` whenever the hull dimensions or level of detail change."""
+
+        self._listeners.append(callback)
 
     def generate_myring_points(self, length_m: float, diameter_m: float, n_theta: int = 48, n_phi: int = 64) -> np.ndarray:
         """Generate point samples for an ellipsoid-like hull shape."""
@@ -45,9 +137,23 @@ class HullGenerator:
         z = b * np.sin(t_grid) * np.sin(p_grid)
         return np.column_stack((x.ravel(), y.ravel(), z.ravel()))
 
+    def set_level_of_detail(self, level: str) -> None:
+        """Select the grid resolution; the mesh is rebuilt on next use."""
+
+        if level not in LOD_LEVELS:
+            raise ValueError(f"Level of detail must be one of {sorted(LOD_LEVELS)}.")
+        self.level_of_detail = level
+        self.n_theta, self.n_phi = LOD_LEVELS[level]
+        self._geometry_changed()
+
     def create_mesh(self, points: np.ndarray):
-        """Build a mesh from points; use fallback data if Open3D is unavailable."""
+        """Build a convex-hull mesh from points; use fallback data if Open3D is unavailable.
+
+        ``update_hull`` uses ``build_grid_mesh`` instead; this is kept for
+        arbitrary point clouds.
+        """
 
+        o3d = load_open3d()
         if o3d is None:
             self.submarine_mesh = {"points": points}
             return self.submarine_mesh
@@ -59,14 +165,69 @@ class HullGenerator:
         self.submarine_mesh = hull_mesh
         return hull_mesh
 
-    def update_hull(self, length_m: float, diameter_m: float, fin_surface_area_m2: float):
-        """Store latest dimensions and regenerate the hull mesh."""
+    @property
+    def submarine_mesh(self):
+        """Display mesh for the current dimensions, built on first access."""
+
+        if self._submarine_mesh is None:
+            self._submarine_mesh = self._mesh_from_arrays(self.get_mesh_arrays())
+        return self._submarine_mesh
+
+    @submarine_mesh.setter
+    def submarine_mesh(self, mesh) -> None:
+        self._submarine_mesh = mesh
+
+    def set_dimensions(self, length_m: float, diameter_m: float, fin_surface_area_m2: float) -> None:
+        """Store new dimensions without building anything.
+
+        The mesh arrays and the display mesh are rebuilt on first use, so
+        headless runs with analytic hydrostatics never generate a mesh.
+        """
 
         self.length_m = length_m
         self.diameter_m = diameter_m
         self.fin_surface_area_m2 = fin_surface_area_m2
-        points = self.generate_myring_points(length_m, diameter_m)
-        return self.create_mesh(points)
+        self._geometry_changed()
+
+    def _geometry_changed(self) -> None:
+        """Drop the built meshes and tell listeners the hull changed."""
+
+        self.mesh_arrays = None
+        self._submarine_mesh = None
+        for callback in self._listeners:
+            callback()
+
+    def get_mesh_arrays(self) -> MeshArrays:
+        """Mesh arrays for the current dimensions, from the cache or freshly built."""
+
+        if self.mesh_arrays is None:
+            key = make_key(self.length_m, self.diameter_m, self.fin_surface_area_m2, self.n_theta, self.n_phi)
+            arrays = self.mesh_cache.get(key)
+            if arrays is None:
+                arrays = build_grid_mesh(self.length_m, self.diameter_m, self.n_theta, self.n_phi)
+                arrays.hydrostatics = compute_hydrostatics(arrays.vertices, arrays.triangles)
+                self.mesh_cache.put(key, arrays)
+            self.mesh_arrays = arrays
+        return self.mesh_arrays
+
+    def update_hull(self, length_m: float, diameter_m: float, fin_surface_area_m2: float):
+        """Store latest dimensions and regenerate the hull mesh."""
+
+        self.set_dimensions(length_m, diameter_m, fin_surface_area_m2)
+        return self.submarine_mesh
+
+    def _mesh_from_arrays(self, arrays: MeshArrays):
+        """Wrap mesh arrays in an Open3D mesh, or return them as-is without Open3D."""
+
+        o3d = load_open3d()
+        if o3d is None:
+            return arrays
+        mesh = o3d.geometry.TriangleMesh(
+            o3d.utility.Vector3dVector(arrays.vertices),
+            o3d.utility.Vector3iVector(arrays.triangles),
+        )
+        mesh.vertex_normals = o3d.utility.Vector3dVector(arrays.normals)
+        return mesh
 
     def get_hydro_area(self) -> float:
         """Return frontal area used by drag equation."""
@@ -81,7 +242,18 @@ class HullGenerator:
         b = self.diameter_m / 2.0
         return (4.0 / 3.0) * math.pi * a * b * b
 
+    def get_mesh_hydrostatics(self) -> Hydrostatics:
+        """Return hydrostatics integrated over the current mesh (cached with it)."""
+
+        arrays = self.get_mesh_arrays()
+        if arrays.hydrostatics is None:
+            arrays.hydrostatics = compute_hydrostatics(arrays.vertices, arrays.triangles)
+        return arrays.hydrostatics
+
     def get_properties(self) -> HullProperties:
         """Collect all derived geometry values in one object."""
 
+        if self.hydrostatics == "mesh":
+            hydro = self.get_mesh_hydrostatics()
+            return HullProperties(area_m2=hydro.frontal_area_m2, volume_m3=hydro.volume_m3)
         return HullProperties(area_m2=self.get_hydro_area(), volume_m3=self.get_volume())
@@ -0,0 +1,64 @@
+"""Mesh-based hydrostatics for closed triangle meshes.
+
+Volume, wetted area, centre of buoyancy and frontal area are computed
+from face sums (divergence theorem) in a few vectorized passes. The cost
+depends only on the face count, so any hull shape costs about the same
+as the closed-form ellipsoid formulas in ``HullGenerator``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Hydrostatics:
+    """Hydrostatic values of a fully submerged closed hull."""
+
+    volume_m3: float
+    wetted_area_m2: float
+    centre_of_buoyancy: np.ndarray
+    frontal_area_m2: float
+
+
+def compute_hydrostatics(vertices: np.ndarray, triangles: np.ndarray, flow_axis: int = 0) -> Hydrostatics:
+    """Return hydrostatics for a closed, outward-wound triangle mesh.
+
+    Each face forms a tetrahedron with the origin; summing their signed
+    volumes gives the enclosed volume, and their volume-weighted
+    centroids give the centre of buoyancy. The frontal area is the
+    projection on the plane normal to ``flow_axis`` (x by default). It
+    is half the total absolute projected face area, which is exact for
+    convex hulls and an upper bound otherwise.
+    """
+
+    vertices = np.asarray(vertices, dtype=float)
+    triangles = np.asarray(triangles)
+    if triangles.size == 0:
+        raise ValueError("Hydrostatics need a triangle mesh; got no faces.")
+
+    v0 = vertices[triangles[:, 0]]
+    v1 = vertices[triangles[:, 1]]
+    v2 = vertices[triangles[:, 2]]
+
+    # Twice the area vector of every face.
+    cross = np.cross(v1 - v0, v2 - v0)
+    wetted_area = 0.5 * np.linalg.norm(cross, axis=1).sum()
+
+    # Signed tetrahedron volumes: v0 . (v1 x v2) / 6.
+    tet_volume = np.einsum("ij,ij->i", v0, np.cross(v1, v2)) / 6.0
+    volume = tet_volume.sum()
+    if volume <= 0.0:
+        raise ValueError("Mesh has non-positive volume; is it closed and wound outward?")
+
+    centroid = (tet_volume[:, None] * (v0 + v1 + v2)).sum(axis=0) / (4.0 * volume)
+    frontal_area = 0.25 * np.abs(cross[:, flow_axis]).sum()
+
+    return Hydrostatics(
+        volume_m3=float(volume),
+        wetted_area_m2=float(wetted_area),
+        centre_of_buoyancy=centroid,
+        frontal_area_m2=float(frontal_area),
+    )
@@ -3,22 +3,48 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
+from .drag_tables import DragTable, fixed_drag_coefficients, reynolds_number
 from .models import Environment, HullGeometry, PhysicsState, SimulationInput, SteeringOutput
+from .parse_cache import ParseCache
+from .schema_validator import PHASE_LIMITS, default_validator
+
+
+@dataclass
+class CaseRecord:
+    """One case from bulk ingestion: either a parsed case or an error."""
+
+    source: str
+    case: SimulationInput | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 class MathIngestor:
     """Loads JSON into dataclasses and checks safety constraints."""
 
-    def __init__(self) -> None:
+    def __init__(self, drag_table: DragTable | None = None) -> None:
         self.current_params: SimulationInput | None = None
+        # Without a table the historical fixed per-profile values are used.
+        self.drag_table = drag_table
 
     def load_json(self, file_path: str | Path) -> SimulationInput:
         """Read a case file, parse it, and keep it as current parameters."""
 
         path = Path(file_path)
-        data = json.loads(path.read_text(encoding="utf-8"))
+        return self.load_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def load_dict(self, data: dict) -> SimulationInput:
+        """Parse an already-decoded case payload and keep it as current parameters."""
+
+        if not isinstance(data, dict):
+            raise ValueError("Case must be a JSON object.")
         self.current_params = self._parse_and_validate(data)
         return self.current_params
 
@@ -28,11 +54,111 @@ class MathIngestor:
         if self.current_params is None:
             raise ValueError("No parameters loaded.")
 
-        p = self.current_params
-        if p.physics_state.depth_m > 500.0:
-            raise ValueError("Depth exceeds Phase 1 limit (500m).")
-        if abs(p.steering_output.target_fin_angle_deg) > 35.0:
-            raise ValueError("Target fin angle exceeds limit (+/-35deg).")
+        self.check_constraints(self.current_params)
+
+    @staticmethod
+    def check_constraints(p: SimulationInput) -> None:
+        """Apply the phase-level limits to any parsed case."""
+
+        PHASE_LIMITS.check_case(p)
+
+    def iter_cases(
+        self,
+        source: str | Path,
+        *,
+        pattern: str = "*.json",
+        cache: ParseCache | None = None,
+    ) -> Iterator[CaseRecord]:
+        """Lazily load every case in a directory or JSON Lines file.
+
+        Each case is parsed, validated and checked against phase limits.
+        Bad cases produce a ``CaseRecord`` with ``error`` set instead of
+        stopping the run. With a ``ParseCache``, unchanged files are not
+        read or parsed again. ``current_params`` is not modified.
+        """
+
+        path = Path(source)
+        if path.is_dir():
+            for file_path in sorted(path.glob(pattern)):
+                yield self._load_cached(file_path, cache, self._parse_file)
+        elif path.suffix == ".jsonl":
+            yield from self._load_cached(path, cache, self._parse_jsonl)
+        else:
+            yield self._load_cached(path, cache, self._parse_file)
+
+    def load_cases(
+        self, source: str | Path, *, pattern: str = "*.json", cache: ParseCache | None = None
+    ) -> tuple[list[SimulationInput], list[CaseRecord]]:
+        """Load all cases from ``source`` and return ``(cases, failed_records)``."""
+
+        cases: list[SimulationInput] = []
+        errors: list[CaseRecord] = []
+        for record in self.iter_cases(source, pattern=pattern, cache=cache):
+            if record.ok:
+                cases.append(record.case)
+            else:
+                errors.append(record)
+        return cases, errors
+
+    def _load_cached(self, path: Path, cache: ParseCache | None, parse):
+        """Return ``parse(path)``, reusing a cached result when the file is unchanged.
+
+        An unreadable file is handed to ``parse`` uncached, so its error
+        record comes back in the parser's own shape (one record or a list).
+        """
+
+        if cache is None:
+            return parse(path)
+        try:
+            key = cache.key_for(path)
+        except OSError:
+            return parse(path)
+        result = cache.get(key)
+        if result is None:
+            result = parse(path)
+            cache.put(key, result)
+        return result
+
+    def _parse_file(self, path: Path) -> CaseRecord:
+        """Parse one JSON case file into a record."""
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            return CaseRecord(str(path), error=f"{type(exc).__name__}: {exc}")
+        return self._record(str(path), data)
+
+    def _parse_jsonl(self, path: Path) -> list[CaseRecord]:
+        """Parse a JSON Lines file with one case per non-empty line."""
+
+        records = []
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            return [CaseRecord(str(path), error=str(exc))]
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            source = f"{path}:{line_no}"
+            try:
+                data = json.loads(line)
+            except ValueError as exc:
+                records.append(CaseRecord(source, error=f"{type(exc).__name__}: {exc}"))
+                continue
+            records.append(self._record(source, data))
+        return records
+
+    def _record(self, source: str, data: object) -> CaseRecord:
+        """Validate raw JSON data and wrap the outcome in a record."""
+
+        try:
+            if not isinstance(data, dict):
+                raise ValueError("Case must be a JSON object.")
+            case = self._parse_and_validate(data)
+            self.check_constraints(case)
+        except (KeyError, TypeError, ValueError) as exc:
+            return CaseRecord(source, error=f"{type(exc).__name__}: {exc}")
+        return CaseRecord(source, case=case)
 
     def get_drag_coefficient(self) -> float:
         """Return drag coefficient based on selected NACA profile."""
@@ -40,9 +166,15 @@ class MathIngestor:
         if self.current_params is None:
             raise ValueError("No parameters loaded.")
 
-        base_cd = 0.2
-        profile_adjustment = 0.0 if self.current_params.hull_geometry.naca_profile == "0009" else 0.03
-        return base_cd + profile_adjustment
+        if self.drag_table is not None:
+            p = self.current_params
+            re_number = reynolds_number(
+                p.physics_state.velocity_ms, p.hull_geometry.length_m, p.environment.fluid_density_kgm3
+            )
+            cd = self.drag_table.lookup(p.hull_geometry.naca_profile, re_number, p.steering_output.target_fin_angle_deg)
+            return float(cd)
+
+        return float(fixed_drag_coefficients(self.current_params.hull_geometry.naca_profile))
 
     def _parse_and_validate(self, data: dict) -> SimulationInput:
         """Build typed models from raw dict and validate value ranges."""
@@ -52,29 +184,15 @@ class MathIngestor:
         so = SteeringOutput(**data["steering_output"])
         env = Environment(**data["environment"])
 
-        # Basic numeric sanity checks to fail early on invalid inputs.
-        if hg.length_m <= 0.0:
-            raise ValueError("length_m must be > 0.")
-        if hg.max_diameter_m <= 0.0:
-            raise ValueError("max_diameter_m must be > 0.")
-        if hg.fin_surface_area_m2 <= 0.0:
-            raise ValueError("fin_surface_area_m2 must be > 0.")
-        if ps.velocity_ms < 0.0:
-            raise ValueError("velocity_ms must be >= 0.")
-        if ps.depth_m < 0.0:
-            raise ValueError("depth_m must be >= 0.")
-        if so.motor_torque_nm <= 0.0:
-            raise ValueError("motor_torque_nm must be > 0.")
         if len(env.current_vector_ms) != 3:
             raise ValueError("current_vector_ms must have 3 values.")
-        if not 900.0 <= env.fluid_density_kgm3 <= 1300.0:
-            raise ValueError("fluid_density_kgm3 out of range.")
-        if not 0.0 <= env.sensor_noise_sigma <= 0.1:
-            raise ValueError("sensor_noise_sigma out of range.")
 
-        return SimulationInput(
+        case = SimulationInput(
             hull_geometry=hg,
             physics_state=ps,
             steering_output=so,
             environment=env,
         )
+        # Range checks are compiled from schemas/phase1_contract.schema.json.
+        default_validator(phase_limits=False).check_case(case)
+        return case
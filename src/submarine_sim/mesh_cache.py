@@ -0,0 +1,128 @@
+"""LRU cache for generated hull meshes, with an optional on-disk store.
+
+Meshes are cached as plain NumPy arrays (vertices, triangles, normals)
+keyed on the hull dimensions and grid resolution. Reloading a case with
+the same geometry, or sweeping steering-only parameters, then skips mesh
+generation entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .hydrostatics import Hydrostatics
+
+MeshKey = tuple[float, float, float, int, int]
+
+# Bump when the mesh builder changes so stale .npz files are not reused.
+CACHE_FORMAT_VERSION = 2
+
+
+@dataclass
+class MeshArrays:
+    """Triangle mesh stored as NumPy arrays (no Open3D objects)."""
+
+    vertices: np.ndarray
+    triangles: np.ndarray
+    normals: np.ndarray
+    # Filled in once per mesh and cached alongside it.
+    hydrostatics: Hydrostatics | None = None
+
+
+def make_key(length_m: float, diameter_m: float, fin_surface_area_m2: float, n_theta: int, n_phi: int) -> MeshKey:
+    """Build the cache key for one hull geometry and grid resolution."""
+
+    return (float(length_m), float(diameter_m), float(fin_surface_area_m2), int(n_theta), int(n_phi))
+
+
+class MeshCache:
+    """In-memory LRU of ``MeshArrays`` backed by optional ``.npz`` files."""
+
+    def __init__(self, maxsize: int = 32, cache_dir: str | Path | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0.")
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries: OrderedDict[MeshKey, MeshArrays] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: MeshKey) -> bool:
+        return key in self._entries or (self._path(key) is not None and self._path(key).exists())
+
+    def get(self, key: MeshKey) -> MeshArrays | None:
+        """Return a cached mesh (memory first, then disk) or ``None``."""
+
+        mesh = self._entries.get(key)
+        if mesh is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return mesh
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            try:
+                with np.load(path) as data:
+                    mesh = MeshArrays(data["vertices"], data["triangles"], data["normals"])
+                    if "hydrostatics" in data:
+                        volume, area, frontal, *centre = data["hydrostatics"].tolist()
+                        mesh.hydrostatics = Hydrostatics(volume, area, np.array(centre), frontal)
+            except (OSError, KeyError, ValueError):
+                # Corrupt or partial file: treat as a miss and rebuild it.
+                mesh = None
+            if mesh is not None:
+                self.disk_hits += 1
+                self._remember(key, mesh)
+                return mesh
+
+        self.misses += 1
+        return None
+
+    def put(self, key: MeshKey, mesh: MeshArrays) -> None:
+        """Store a mesh in memory and, if configured, on disk."""
+
+        self._remember(key, mesh)
+        path = self._path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so readers never see a partial .npz.
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        arrays = {"vertices": mesh.vertices, "triangles": mesh.triangles, "normals": mesh.normals}
+        if mesh.hydrostatics is not None:
+            h = mesh.hydrostatics
+            arrays["hydrostatics"] = np.array([h.volume_m3, h.wetted_area_m2, h.frontal_area_m2, *h.centre_of_buoyancy])
+        np.savez(tmp, **arrays)
+        tmp.replace(path)
+
+    def clear(self) -> None:
+        """Drop in-memory entries (files on disk are kept)."""
+
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters."""
+
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "entries": len(self)}
+
+    def _remember(self, key: MeshKey, mesh: MeshArrays) -> None:
+        self._entries[key] = mesh
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: MeshKey) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(repr((CACHE_FORMAT_VERSION, key)).encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / f"hull_{digest}.npz"
@@ -0,0 +1,295 @@
+"""Monte Carlo noise ensembles with streaming statistics.
+
+An ensemble runs K noisy realizations of one case. Each realization has
+its own NumPy ``Generator`` spawned from a single seed, so any run can be
+reproduced on its own. Realizations are processed in fixed-size blocks
+and folded into streaming accumulators, so memory depends on the block
+size and step count but not on K.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from .hull_generator import HullGenerator
+from .math_ingestor import MathIngestor
+from .models import SimulationInput
+from .physics_engine import PhysicsEngine
+from .trajectory import TrajectoryIntegrator
+
+# Outputs that change with noise; buoyancy and GM are noise-free constants.
+NOISY_FIELDS = ("drag_force_n", "effective_velocity_ms", "torque_required_nm", "torque_margin_nm")
+
+
+class StreamingMoments:
+    """Running mean/variance (Chan et al. block update of Welford's method)."""
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold a ``(k, *shape)`` block of samples into the running moments."""
+
+        k = block.shape[0]
+        if k == 0:
+            return
+        block_mean = block.mean(axis=0)
+        block_m2 = ((block - block_mean) ** 2).sum(axis=0)
+        total = self.count + k
+        delta = block_mean - self.mean
+        self.mean = self.mean + delta * (k / total)
+        self._m2 = self._m2 + block_m2 + delta * delta * (self.count * k / total)
+        self.count = total
+
+    @property
+    def std(self) -> np.ndarray:
+        """Sample standard deviation (zero until two samples are seen)."""
+
+        if self.count < 2:
+            return np.zeros_like(self.mean)
+        return np.sqrt(self._m2 / (self.count - 1))
+
+
+class StreamingHistogram:
+    """Fixed-bin histograms per element, used for approximate quantiles.
+
+    Bin edges are fixed from the first block, padded on both sides.
+    Later samples outside that range are clamped into the edge bins, and
+    results are clipped to the observed min/max.
+    """
+
+    def __init__(self, shape: tuple[int, ...], bins: int = 256, padding: float = 0.5) -> None:
+        self.shape = shape
+        self.bins = bins
+        self.padding = padding
+        self.low: np.ndarray | None = None
+        self.width: np.ndarray | None = None
+        self.counts = np.zeros((int(np.prod(shape)), bins), dtype=np.int64)
+        self.min = np.full(self.counts.shape[0], np.inf)
+        self.max = np.full(self.counts.shape[0], -np.inf)
+
+    def update(self, block: np.ndarray) -> None:
+        """Add a ``(k, *shape)`` block of samples to the histograms."""
+
+        flat = block.reshape(block.shape[0], -1)
+        self.min = np.minimum(self.min, flat.min(axis=0))
+        self.max = np.maximum(self.max, flat.max(axis=0))
+        if self.low is None:
+            lo, hi = flat.min(axis=0), flat.max(axis=0)
+            span = np.maximum(hi - lo, 1e-12 * np.maximum(np.abs(hi), 1.0))
+            self.low = lo - self.padding * span
+            self.width = (span * (1.0 + 2.0 * self.padding)) / self.bins
+
+        idx = np.clip(((flat - self.low) / self.width).astype(np.int64), 0, self.bins - 1)
+        # One bincount over (element, bin) pairs instead of a Python loop per element.
+        keys = (np.arange(flat.shape[1]) * self.bins + idx).ravel()
+        self.counts += np.bincount(keys, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Return ``(len(qs), *shape)`` quantiles interpolated inside bins."""
+
+        cdf = np.cumsum(self.counts, axis=1)
+        total = cdf[:, -1:]
+        out = np.empty((len(qs), self.counts.shape[0]))
+        rows = np.arange(self.counts.shape[0])
+        for i, q in enumerate(qs):
+            target = q * total[:, 0]
+            b = np.minimum((cdf < target[:, None]).sum(axis=1), self.bins - 1)
+            before = np.where(b > 0, cdf[rows, b - 1], 0)
+            inside = self.counts[rows, b]
+            frac = np.where(inside > 0, (target - before) / np.maximum(inside, 1), 0.5)
+            out[i] = np.clip(self.low + (b + np.clip(frac, 0.0, 1.0)) * self.width, self.min, self.max)
+        return out.reshape((len(qs),) + self.shape)
+
+
+@dataclass
+class MonteCarloResult:
+    """Summary statistics for one ensemble."""
+
+    realizations: int
+    steps: int
+    seed: int | None
+    quantile_levels: tuple[float, ...]
+    # field -> {"mean", "std", "q05", ...} arrays with one value per step.
+    per_step: dict[str, dict[str, np.ndarray]] = field(default_factory=dict)
+    # Per-step probabilities such as torque_margin_negative and cavitation_risk.
+    per_step_probability: dict[str, np.ndarray] = field(default_factory=dict)
+    # Run-level metric -> {"mean", "std", "q05", ...} across realizations.
+    per_run: dict[str, dict[str, float]] = field(default_factory=dict)
+    # Probability that a realization hits an event at least once.
+    per_run_probability: dict[str, float] = field(default_factory=dict)
+
+    def save_report(self, output_path: str | Path) -> None:
+        """Write per-step statistics to CSV (one row per step)."""
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns: dict[str, np.ndarray] = {"step": np.arange(self.steps)}
+        for name, stats in self.per_step.items():
+            for stat, values in stats.items():
+                columns[f"{name}_{stat}"] = values
+        for name, values in self.per_step_probability.items():
+            columns[f"p_{name}"] = values
+
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(col.tolist() for col in columns.values())))
+
+    def summary(self) -> dict:
+        """Return JSON-friendly run-level statistics."""
+
+        return {
+            "realizations": self.realizations,
+            "steps": self.steps,
+            "seed": self.seed,
+            "per_run": self.per_run,
+            "per_run_probability": self.per_run_probability,
+        }
+
+
+class MonteCarloEnsemble:
+    """Runs K noisy realizations of a case and keeps streaming statistics."""
+
+    def __init__(
+        self,
+        case: str | Path | SimulationInput,
+        *,
+        realizations: int,
+        steps: int,
+        seed: int | None = None,
+        integrate: bool = False,
+        dt_s: float | None = None,
+        sensor_noise_sigma: float | None = None,
+        block_size: int = 256,
+        bins: int = 256,
+        quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+    ) -> None:
+        if realizations <= 0 or steps <= 0:
+            raise ValueError("realizations and steps must be > 0.")
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0.")
+
+        self.ingestor = MathIngestor()
+        if isinstance(case, SimulationInput):
+            self.ingestor.current_params = case
+        else:
+            self.ingestor.load_json(case)
+        self.ingestor.validate_constraints()
+        self.case = self.ingestor.current_params
+
+        self.realizations = realizations
+        self.steps = steps
+        self.seed = seed
+        self.integrate = integrate
+        self.dt_s = dt_s
+        self.sigma = self.case.environment.sensor_noise_sigma if sensor_noise_sigma is None else sensor_noise_sigma
+        self.block_size = block_size
+        self.bins = bins
+        self.quantile_levels = tuple(quantiles)
+        self.engine = PhysicsEngine()
+
+    def _nominal_state(self, area: float, volume: float, cd: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return noise-free ``(velocity, depth)`` arrays for every step."""
+
+        ps = self.case.physics_state
+        if not self.integrate:
+            # Same constant state that repeated update_scene calls use.
+            return np.full(self.steps, ps.velocity_ms), np.full(self.steps, ps.depth_m)
+        result = TrajectoryIntegrator(self.engine).integrate(
+            self.case, steps=self.steps, area_m2=area, volume_m3=volume, drag_coefficient=cd, dt_s=self.dt_s
+        )
+        return result.velocity_ms, result.depth_m
+
+    def run(self) -> MonteCarloResult:
+        """Evaluate all realizations block by block and return statistics."""
+
+        hg = self.case.hull_geometry
+        hull = HullGenerator()
+        hull.length_m, hull.diameter_m = hg.length_m, hg.max_diameter_m
+        props = hull.get_properties()
+        cd = self.ingestor.get_drag_coefficient()
+        velocity, depth = self._nominal_state(props.area_m2, props.volume_m3, cd)
+
+        step_moments = {name: StreamingMoments((self.steps,)) for name in NOISY_FIELDS}
+        step_hists = {name: StreamingHistogram((self.steps,), self.bins) for name in NOISY_FIELDS}
+        torque_negative = np.zeros(self.steps, dtype=np.int64)
+        cavitation = np.zeros(self.steps, dtype=np.int64)
+
+        run_metrics = ("min_torque_margin_nm", "max_drag_force_n", "mean_effective_velocity_ms", "cavitation_fraction")
+        run_moments = {name: StreamingMoments(()) for name in run_metrics}
+        run_hists = {name: StreamingHistogram((), self.bins) for name in run_metrics}
+        any_torque_negative = 0
+        any_cavitation = 0
+
+        # One independent child stream per realization, all derived from one seed.
+        children = np.random.SeedSequence(self.seed).spawn(self.realizations)
+        for start in range(0, self.realizations, self.block_size):
+            block_seeds = children[start : start + self.block_size]
+            k = len(block_seeds)
+            draws = np.stack([np.random.default_rng(s).standard_normal(self.steps) for s in block_seeds])
+
+            snap = self.engine.step_batch(
+                velocity_ms=np.tile(velocity, k),
+                current_vector_ms=self.case.environment.current_vector_ms,
+                density_kgm3=self.case.environment.fluid_density_kgm3,
+                drag_coefficient=cd,
+                area_m2=props.area_m2,
+                volume_m3=props.volume_m3,
+                target_fin_angle_deg=self.case.steering_output.target_fin_angle_deg,
+                fin_offset_m=hg.fin_offset_x,
+                motor_torque_nm=self.case.steering_output.motor_torque_nm,
+                depth_m=np.tile(depth, k),
+                length_m=hg.length_m,
+                diameter_m=hg.max_diameter_m,
+                sensor_noise_sigma=self.sigma,
+                standard_normal=draws.ravel(),
+            )
+
+            values = {name: getattr(snap, name).reshape(k, self.steps) for name in NOISY_FIELDS}
+            for name in NOISY_FIELDS:
+                step_moments[name].update(values[name])
+                step_hists[name].update(values[name])
+            negative = values["torque_margin_nm"] < 0.0
+            cavitating = snap.cavitation_risk.reshape(k, self.steps)
+            torque_negative += negative.sum(axis=0)
+            cavitation += cavitating.sum(axis=0)
+            any_torque_negative += int(negative.any(axis=1).sum())
+            any_cavitation += int(cavitating.any(axis=1).sum())
+
+            per_run_values = {
+                "min_torque_margin_nm": values["torque_margin_nm"].min(axis=1),
+                "max_drag_force_n": values["drag_force_n"].max(axis=1),
+                "mean_effective_velocity_ms": values["effective_velocity_ms"].mean(axis=1),
+                "cavitation_fraction": cavitating.mean(axis=1),
+            }
+            for name, vals in per_run_values.items():
+                run_moments[name].update(vals)
+                run_hists[name].update(vals)
+
+        labels = [f"q{round(q * 100):02d}" for q in self.quantile_levels]
+        result = MonteCarloResult(self.realizations, self.steps, self.seed, self.quantile_levels)
+        for name in NOISY_FIELDS:
+            stats = {"mean": step_moments[name].mean, "std": step_moments[name].std}
+            stats.update(zip(labels, step_hists[name].quantiles(self.quantile_levels)))
+            result.per_step[name] = stats
+        result.per_step_probability = {
+            "torque_margin_negative": torque_negative / self.realizations,
+            "cavitation_risk": cavitation / self.realizations,
+        }
+        for name in run_metrics:
+            stats = {"mean": float(run_moments[name].mean), "std": float(run_moments[name].std)}
+            stats.update({lbl: float(v) for lbl, v in zip(labels, run_hists[name].quantiles(self.quantile_levels))})
+            result.per_run[name] = stats
+        result.per_run_probability = {
+            "torque_margin_negative": any_torque_negative / self.realizations,
+            "cavitation_risk": any_cavitation / self.realizations,
+        }
+        return result
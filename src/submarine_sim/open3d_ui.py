@@ -2,13 +2,60 @@
 
 from __future__ import annotations
 
+import math
+import threading
+import time
 from pathlib import Path
 
+import numpy as np
 import open3d as o3d
 import open3d.visualization.gui as gui
 import open3d.visualization.rendering as rendering
 
 from .app import SubmarineApp
+from .physics_engine import PhysicsBatch
+from .trajectory import TrajectoryDecimator
+
+# Label/telemetry refreshes from a running simulation are capped at this rate.
+UI_REFRESH_HZ = 30.0
+# Steps run between cancel checks and (throttled) UI updates.
+RUN_CHUNK_STEPS = 2048
+# Integrated runs are played back in the scene over at most this long.
+PLAYBACK_S = 5.0
+# Fixed number of trajectory points uploaded to the renderer.
+TRAIL_BUDGET = 4096
+# Longest wait for the worker to finish its current chunk when the window closes.
+CLOSE_JOIN_TIMEOUT_S = 2.0
+
+
+class _RateLimiter:
+    """Allows an action at most ``max_hz`` times per second."""
+
+    def __init__(self, max_hz: float) -> None:
+        self.interval_s = 1.0 / max_hz
+        self._last = float("-inf")
+
+    def ready(self) -> bool:
+        now = time.monotonic()
+        if now - self._last < self.interval_s:
+            return False
+        self._last = now
+        return True
+
+
+def _hull_pose(position: np.ndarray, yaw_deg: float, pitch_deg: float) -> np.ndarray:
+    """4x4 transform placing the hull (built along +x) at a path point."""
+
+    yaw, pitch = math.radians(yaw_deg), math.radians(pitch_deg)
+    cz, sz = math.cos(yaw), math.sin(yaw)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    rot_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    # Positive pitch lifts the nose (+x) towards +z.
+    rot_y = np.array([[cp, 0.0, -sp], [0.0, 1.0, 0.0], [sp, 0.0, cp]])
+    pose = np.eye(4)
+    pose[:3, :3] = rot_z @ rot_y
+    pose[:3, 3] = position
+    return pose
 
 
 class Phase1Open3DUI:
@@ -16,10 +63,16 @@ class Phase1Open3DUI:
 
     def __init__(self) -> None:
         self.submarine_app = SubmarineApp()
+        # Simulations run on a worker thread so the window stays responsive.
+        self._worker: threading.Thread | None = None
+        self._cancel = threading.Event()
+        # Written by the worker thread only; the UI receives copies.
+        self._trail = TrajectoryDecimator(TRAIL_BUDGET)
 
         # Create one main window and hook layout callback.
         self.window = gui.Application.instance.create_window("Phase 1 Submarine Simulation", 1400, 900)
         self.window.set_on_layout(self._on_layout)
+        self.window.set_on_close(self._on_close)
 
         em = self.window.theme.font_size
         spacing = int(0.35 * em)
@@ -53,6 +106,19 @@ class Phase1Open3DUI:
         self.scene.scene.add_geometry("world_axis", axis, material)
         self.scene.setup_camera(60.0, axis.get_axis_aligned_bounding_box(), axis.get_center())
 
+        self._hull_material = rendering.MaterialRecord()
+        self._hull_material.shader = "defaultLit"
+        self._hull_material.base_color = [0.75, 0.78, 0.82, 1.0]
+
+        # The trajectory is a point cloud with a fixed size, added once and
+        # then refreshed in place with update_geometry (no GPU reallocation).
+        trail_material = rendering.MaterialRecord()
+        trail_material.shader = "defaultUnlit"
+        trail_material.point_size = 3.0
+        trail_material.base_color = [1.0, 0.75, 0.2, 1.0]
+        trail = o3d.t.geometry.PointCloud(o3d.core.Tensor(np.zeros((TRAIL_BUDGET + 1, 3), dtype=np.float32)))
+        self.scene.scene.add_geometry("trajectory", trail, trail_material)
+
     def _build_inputs_panel(self, spacing: int) -> None:
         """Create controls for case path, steps, and run/export actions."""
 
@@ -68,6 +134,10 @@ class Phase1Open3DUI:
         self.steps_input.text_value = "5"
         self.inputs_panel.add_child(self.steps_input)
 
+        self.integrate_checkbox = gui.Checkbox("Integrate motion (show trajectory)")
+        self.integrate_checkbox.checked = False
+        self.inputs_panel.add_child(self.integrate_checkbox)
+
         self.inputs_panel.add_child(gui.Label("Report CSV"))
         self.report_input = gui.TextEdit()
         self.report_input.text_value = "logs/phase1_gui_report.csv"
@@ -81,6 +151,11 @@ class Phase1Open3DUI:
         self.run_button = gui.Button("Run Simulation")
         self.run_button.set_on_clicked(self._on_run_clicked)
         button_row.add_child(self.run_button)
+
+        self.cancel_button = gui.Button("Cancel")
+        self.cancel_button.set_on_clicked(self._on_cancel_clicked)
+        self.cancel_button.enabled = False
+        button_row.add_child(self.cancel_button)
         self.inputs_panel.add_child(button_row)
 
         self.save_button = gui.Button("Export CSV")
@@ -190,26 +265,206 @@ class Phase1Open3DUI:
         except Exception as exc:  # noqa: BLE001
             self._set_status(f"load failed: {exc}")
             return
+        self._show_hull(self.submarine_app.hull_generator.submarine_mesh)
         self._set_status(f"loaded {case}")
 
     def _on_run_clicked(self) -> None:
-        """Load case, run steps, then show latest telemetry."""
+        """Start a background run; results arrive through throttled updates."""
+
+        if self._is_running():
+            self._set_status("simulation already running")
+            return
 
         steps = self._read_steps()
         if steps is None:
             return
 
         case = self.case_input.text_value.strip()
+        self._cancel.clear()
+        self._set_running(True)
+        integrate = self.integrate_checkbox.checked
+        self._worker = threading.Thread(
+            target=self._run_worker, args=(case, steps, integrate), name="phase1-run", daemon=True
+        )
+        self._worker.start()
+        self._set_status(f"running 0/{steps} steps")
+
+    def _on_cancel_clicked(self) -> None:
+        """Ask the running simulation to stop after its current chunk."""
+
+        if self._is_running():
+            self._cancel.set()
+            self._set_status("cancelling...")
+
+    def _on_close(self) -> bool:
+        """Stop any background run before the window closes."""
+
+        self._cancel.set()
+        if self._is_running():
+            self._worker.join(timeout=CLOSE_JOIN_TIMEOUT_S)
+        return True
+
+    def _run_worker(self, case: str, steps: int, integrate: bool) -> None:
+        """Worker thread: load the case and run it in chunks.
+
+        Widgets are only touched on the main thread via
+        ``post_to_main_thread``, at most ``UI_REFRESH_HZ`` times per second.
+        """
+
+        app = self.submarine_app
+        post = gui.Application.instance.post_to_main_thread
+        limiter = _RateLimiter(UI_REFRESH_HZ)
+        done = 0
         try:
-            self.submarine_app.ui_controller.load_case(case)
-            rows = self.submarine_app.ui_controller.run_simulation(steps)
+            app.ui_controller.load_case(case)
+            mesh = app.hull_generator.submarine_mesh
+            post(self.window, lambda: self._show_hull(mesh))
+            # Same rules engine as CLI runs, fed chunk by chunk.
+            engine = app.alert_engine
+            engine.reset()
+            chunks = self._trajectory_chunks(steps) if integrate else self._step_chunks(steps)
+            for done, chunk_start, pose in chunks:
+                engine.feed({name: column[chunk_start:] for name, column in app.telemetry.columns().items()})
+                if limiter.ready():
+                    update = (done, steps, app.telemetry.row(-1), engine.active_messages(), *self._trail_update(pose))
+                    post(self.window, lambda update=update: self._show_progress(*update))
+                if self._cancel.is_set():
+                    break
         except Exception as exc:  # noqa: BLE001
-            self._set_status(f"run failed: {exc}")
+            message = f"run failed: {exc}"
+            post(self.window, lambda: self._finish_run(message))
             return
 
-        if rows:
-            self._update_telemetry(rows[-1])
-        self._set_status(f"simulation complete ({len(rows)} steps)")
+        if self._cancel.is_set() and done < steps:
+            message = f"simulation cancelled after {done} of {steps} steps"
+        else:
+            message = f"simulation complete ({done} steps)"
+        final = (app.telemetry.row(-1), engine.active_messages()) if done else None
+        trail, pose = self._trail_update(pose) if integrate and done else (None, None)
+        post(self.window, lambda: self._finish_run(message, final, trail, pose))
+
+    def _step_chunks(self, steps: int):
+        """Plain ``update_scene`` steps; yields ``(done, first_new_row, pose)``."""
+
+        app = self.submarine_app
+        done = 0
+        while done < steps:
+            count = min(RUN_CHUNK_STEPS, steps - done)
+            start = len(app.telemetry)
+            app.ui_controller.run_simulation(count)
+            done += count
+            yield done, start, None
+
+    def _trajectory_chunks(self, steps: int):
+        """Integrated run, played back frame by frame along its path.
+
+        The whole run is integrated at once (vectorized), then revealed
+        over at most ``PLAYBACK_S`` seconds; rows reach the telemetry table
+        frame by frame, so a cancelled run keeps only what was shown.
+        """
+
+        app = self.submarine_app
+        result = app.ui_controller.run_trajectory(steps)
+        outputs = result.snapshots.as_dict()
+        # Scene coordinates: x/y in the horizontal plane, z up (so z = -depth).
+        path = np.column_stack((result.x_m, result.y_m, -result.depth_m))
+
+        self._trail.clear()
+        frame_steps = max(1, math.ceil(steps / (PLAYBACK_S * UI_REFRESH_HZ)))
+        for start in range(0, steps, frame_steps):
+            frame_started = time.monotonic()
+            stop = min(start + frame_steps, steps)
+            first_row = len(app.telemetry)
+            frame = PhysicsBatch(**{name: column[start:stop] for name, column in outputs.items()})
+            app.telemetry.extend(frame, result.environment_mode)
+            self._trail.extend(path[start:stop])
+            last = stop - 1
+            yield stop, first_row, _hull_pose(path[last], result.yaw_deg[last], result.pitch_deg[last])
+            time.sleep(max(0.0, 1.0 / UI_REFRESH_HZ - (time.monotonic() - frame_started)))
+
+    def _trail_update(self, pose: np.ndarray | None) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Worker thread: copy the decimated path into a fresh upload buffer."""
+
+        if pose is None:
+            return None, None
+        points = np.empty((TRAIL_BUDGET + 1, 3), dtype=np.float32)
+        self._trail.fill(points)
+        return points, pose
+
+    def _show_progress(
+        self,
+        done: int,
+        steps: int,
+        snapshot: dict,
+        alerts: list[str],
+        trail: np.ndarray | None = None,
+        pose: np.ndarray | None = None,
+    ) -> None:
+        """Main thread: show the latest row (and path) of a run in progress."""
+
+        self._update_telemetry(snapshot, alerts)
+        if trail is not None:
+            self._update_trail(trail)
+        if pose is not None and self.scene.scene.has_geometry("hull"):
+            # Moving the hull only changes its transform, not its buffers.
+            self.scene.scene.set_geometry_transform("hull", pose)
+        self._set_status(f"running {done}/{steps} steps")
+
+    def _show_hull(self, mesh) -> None:
+        """Main thread: show the generated hull (replaced only when a case loads)."""
+
+        if not isinstance(mesh, o3d.geometry.TriangleMesh):
+            return
+        scene = self.scene.scene
+        if scene.has_geometry("hull"):
+            scene.remove_geometry("hull")
+        scene.add_geometry("hull", mesh, self._hull_material)
+        self._update_trail(np.zeros((TRAIL_BUDGET + 1, 3), dtype=np.float32))
+        self.scene.setup_camera(60.0, mesh.get_axis_aligned_bounding_box(), mesh.get_center())
+
+    def _update_trail(self, points: np.ndarray) -> None:
+        """Main thread: refresh the trajectory points in place."""
+
+        cloud = o3d.t.geometry.PointCloud(o3d.core.Tensor(points))
+        self.scene.scene.scene.update_geometry("trajectory", cloud, rendering.Scene.UPDATE_POINTS_FLAG)
+
+    def _finish_run(
+        self,
+        message: str,
+        final: tuple[dict, list[str]] | None = None,
+        trail: np.ndarray | None = None,
+        pose: np.ndarray | None = None,
+    ) -> None:
+        """Main thread: show the last row and re-enable the controls."""
+
+        if final is not None:
+            # Alerts still active at the last step.
+            self._update_telemetry(*final)
+        if pose is not None and self.scene.scene.has_geometry("hull"):
+            self.scene.scene.set_geometry_transform("hull", pose)
+        if trail is not None:
+            self._update_trail(trail)
+            # Frame the whole path once the run is over.
+            bounds = o3d.geometry.AxisAlignedBoundingBox(trail.min(axis=0) - 2.0, trail.max(axis=0) + 2.0)
+            self.scene.setup_camera(60.0, bounds, bounds.get_center())
+        self._set_running(False)
+        self._set_status(message)
+
+    def _is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _set_running(self, running: bool) -> None:
+        """Lock controls that would race with the worker thread."""
+
+        self.run_button.enabled = not running
+        self.load_button.enabled = not running
+        self.integrate_checkbox.enabled = not running
+        self.save_button.enabled = not running
+        # These change UIState (and the app's cached step inputs) mid-step.
+        self.mode_combo.enabled = not running
+        self.noise_checkbox.enabled = not running
+        self.emergency_button.enabled = not running
+        self.cancel_button.enabled = running
 
     def _on_save_clicked(self) -> None:
         """Export currently collected telemetry to CSV."""
@@ -237,19 +492,12 @@ class Phase1Open3DUI:
             return None
         return steps
 
-    def _update_telemetry(self, snapshot: dict) -> None:
-        """Render latest snapshot values and generate alert messages."""
+    def _update_telemetry(self, snapshot: dict, alerts: list[str]) -> None:
+        """Render latest snapshot values and active alert messages."""
 
         for field, label in self.telemetry_labels.items():
             label.text = f"{field}: {snapshot.get(field, '-')}"
 
-        alerts: list[str] = []
-        if snapshot.get("torque_margin_nm", 0.0) < 0.0:
-            alerts.append("TORQUE LIMIT EXCEEDED")
-        if snapshot.get("cavitation_risk"):
-            alerts.append("CAVITATION RISK")
-        if snapshot.get("stability_warning"):
-            alerts.append("NEGATIVE GM - INSTABILITY")
         self.alert_label.text = f"Alerts: {', '.join(alerts) if alerts else 'none'}"
 
     def _refresh_environment_state(self) -> None:
@@ -0,0 +1,84 @@
+"""Persistent cache of parsed case files keyed on path, mtime and size.
+
+Bulk ingestion looks each file up here before reading it. Unchanged
+files come back as already-validated ``SimulationInput`` objects (or
+their recorded error), so a nightly run over thousands of cases only
+parses the files that changed.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+CacheKey = tuple[str, int, int]
+
+# Bump when parsing/validation rules change so old entries are discarded.
+PARSE_CACHE_VERSION = 3
+
+
+class ParseCache:
+    """Maps ``(path, mtime_ns, size)`` to a parsed result, optionally on disk."""
+
+    def __init__(self, cache_file: str | Path | None = None) -> None:
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self._entries: dict[CacheKey, object] = {}
+        self._seen: set[CacheKey] = set()
+        self.hits = 0
+        self.misses = 0
+        if self.cache_file is not None and self.cache_file.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(path: Path) -> CacheKey:
+        """Build the cache key from the file's current metadata."""
+
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key: CacheKey) -> object | None:
+        """Return the cached result for ``key`` or ``None``."""
+
+        self._seen.add(key)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: CacheKey, value: object) -> None:
+        """Store a parsed result (a case, a list of cases, or an error)."""
+
+        self._seen.add(key)
+        self._entries[key] = value
+
+    def save(self, prune: bool = True) -> None:
+        """Write the cache file; with ``prune`` only keys used this session are kept."""
+
+        if self.cache_file is None:
+            return
+        entries = {k: v for k, v in self._entries.items() if k in self._seen} if prune else self._entries
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            pickle.dump((PARSE_CACHE_VERSION, entries), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(self.cache_file)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters."""
+
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def _load(self) -> None:
+        try:
+            with self.cache_file.open("rb") as fh:
+                version, entries = pickle.load(fh)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            # Unreadable cache: start empty, it is rebuilt on the next save.
+            return
+        if version == PARSE_CACHE_VERSION:
+            self._entries = entries
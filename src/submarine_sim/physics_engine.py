@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import numpy as np
 
 
 @dataclass
@@ -25,14 +27,71 @@ class PhysicsSnapshot:
     stability_warning: bool
 
 
+@dataclass
+class StepInputs:
+    """Noise-independent part of one ``PhysicsEngine.step`` (see ``prepare_step``)."""
+
+    effective_velocity_ms: float
+    density_kgm3: float
+    drag_coefficient: float
+    area_m2: float
+    buoyancy_force_n: float
+    target_fin_angle_deg: float
+    fin_offset_m: float
+    motor_torque_nm: float
+    depth_m: float
+    gm_m: float
+    sensor_noise_sigma: float
+    # Field values of the whole snapshot when noise is off (a plain tuple).
+    quiet: tuple | None = None
+
+
+@dataclass
+class PhysicsBatch:
+    """Output arrays produced by one batched physics step.
+
+    Each field holds one value per evaluated configuration, using the
+    same names as ``PhysicsSnapshot`` (struct-of-arrays layout).
+    """
+
+    drag_force_n: np.ndarray
+    buoyancy_force_n: np.ndarray
+    effective_velocity_ms: np.ndarray
+    torque_required_nm: np.ndarray
+    torque_margin_nm: np.ndarray
+    cavitation_risk: np.ndarray
+    gm_m: np.ndarray
+    stability_warning: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.drag_force_n)
+
+    def snapshot(self, index: int) -> PhysicsSnapshot:
+        """Return one row as a scalar ``PhysicsSnapshot``."""
+
+        return PhysicsSnapshot(**{f.name: getattr(self, f.name)[index].item() for f in fields(PhysicsSnapshot)})
+
+    def as_dict(self) -> dict[str, np.ndarray]:
+        """Return all output columns keyed by field name."""
+
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class PhysicsEngine:
     """Encapsulates all physics-related calculations."""
 
-    def __init__(self, gravity: float = 9.81) -> None:
+    def __init__(self, gravity: float = 9.81, seed: int | None = None) -> None:
         self.gravity = gravity
         self.water_density = 1000.0
         self.current_strength = 0.0
         self.noise_factor = 0.0
+        # Private generator so noisy runs can be seeded and reproduced.
+        self.rng = random.Random(seed)
+
+    def seed(self, seed: int | None) -> None:
+        """Reseed the scalar noise generator."""
+
+        self.rng.seed(seed)
 
     def calculate_drag(self, velocity_ms: float, drag_coefficient: float, area_m2: float, density_kgm3: float) -> float:
         """Return drag force using the standard drag equation."""
@@ -49,7 +108,7 @@ class PhysicsEngine:
 
         if sigma <= 0.0:
             return value
-        return value + random.gauss(0.0, sigma * max(abs(value), 1e-6))
+        return value + self.rng.gauss(0.0, sigma * max(abs(value), 1e-6))
 
     def evaluate_steering_feasibility(
         self,
@@ -103,18 +162,109 @@ class PhysicsEngine:
         current_mag = math.sqrt(sum(c * c for c in current_vector_ms))
         effective_velocity = max(0.0, velocity_ms + current_mag)
         noisy_velocity = self.apply_environmental_noise(effective_velocity, sensor_noise_sigma)
+        return self._finish_step(
+            noisy_velocity,
+            density_kgm3,
+            drag_coefficient,
+            area_m2,
+            self.calculate_buoyancy(volume_m3, density_kgm3),
+            target_fin_angle_deg,
+            fin_offset_m,
+            motor_torque_nm,
+            depth_m,
+            self.stability_check(length_m, diameter_m),
+        )
 
-        drag = self.calculate_drag(noisy_velocity, drag_coefficient, area_m2, density_kgm3)
-        buoyancy = self.calculate_buoyancy(volume_m3, density_kgm3)
+    def prepare_step(
+        self,
+        *,
+        velocity_ms: float,
+        current_vector_ms: list[float],
+        density_kgm3: float,
+        drag_coefficient: float,
+        area_m2: float,
+        volume_m3: float,
+        target_fin_angle_deg: float,
+        fin_offset_m: float,
+        motor_torque_nm: float,
+        depth_m: float,
+        length_m: float,
+        diameter_m: float,
+        sensor_noise_sigma: float,
+    ) -> StepInputs:
+        """Compute the parts of ``step`` that do not depend on sensor noise.
+
+        Pass the result to ``step_prepared`` as often as needed while the
+        inputs (and this engine's ``gravity``) stay the same.
+        """
+
+        # Convert 3D current vector into a single magnitude.
+        current_mag = math.sqrt(sum(c * c for c in current_vector_ms))
+        gm_m = self.stability_check(length_m, diameter_m)
+        inputs = StepInputs(
+            effective_velocity_ms=max(0.0, velocity_ms + current_mag),
+            density_kgm3=density_kgm3,
+            drag_coefficient=drag_coefficient,
+            area_m2=area_m2,
+            buoyancy_force_n=self.calculate_buoyancy(volume_m3, density_kgm3),
+            target_fin_angle_deg=target_fin_angle_deg,
+            fin_offset_m=fin_offset_m,
+            motor_torque_nm=motor_torque_nm,
+            depth_m=depth_m,
+            gm_m=gm_m,
+            sensor_noise_sigma=sensor_noise_sigma,
+        )
+        if sensor_noise_sigma <= 0.0:
+            # Without noise every output is fixed, so build them once here.
+            inputs.quiet = tuple(vars(self._finish_inputs(inputs, inputs.effective_velocity_ms)).values())
+        return inputs
 
+    def step_prepared(self, inputs: StepInputs) -> PhysicsSnapshot:
+        """Finish one ``step`` from ``prepare_step`` output (draws noise if enabled)."""
+
+        if inputs.quiet is not None:
+            return PhysicsSnapshot(*inputs.quiet)
+        noisy_velocity = self.apply_environmental_noise(inputs.effective_velocity_ms, inputs.sensor_noise_sigma)
+        return self._finish_inputs(inputs, noisy_velocity)
+
+    def _finish_inputs(self, inputs: StepInputs, noisy_velocity: float) -> PhysicsSnapshot:
+        """``_finish_step`` with the constants taken from ``inputs``."""
+
+        return self._finish_step(
+            noisy_velocity,
+            inputs.density_kgm3,
+            inputs.drag_coefficient,
+            inputs.area_m2,
+            inputs.buoyancy_force_n,
+            inputs.target_fin_angle_deg,
+            inputs.fin_offset_m,
+            inputs.motor_torque_nm,
+            inputs.depth_m,
+            inputs.gm_m,
+        )
+
+    def _finish_step(
+        self,
+        noisy_velocity: float,
+        density_kgm3: float,
+        drag_coefficient: float,
+        area_m2: float,
+        buoyancy_force_n: float,
+        target_fin_angle_deg: float,
+        fin_offset_m: float,
+        motor_torque_nm: float,
+        depth_m: float,
+        gm_m: float,
+    ) -> PhysicsSnapshot:
+        """Outputs that depend on the (possibly noisy) velocity."""
+
+        drag = self.calculate_drag(noisy_velocity, drag_coefficient, area_m2, density_kgm3)
         torque_required, torque_margin = self.evaluate_steering_feasibility(
             noisy_velocity, drag, target_fin_angle_deg, fin_offset_m, motor_torque_nm
         )
-
-        gm_m = self.stability_check(length_m, diameter_m)
         return PhysicsSnapshot(
             drag_force_n=drag,
-            buoyancy_force_n=buoyancy,
+            buoyancy_force_n=buoyancy_force_n,
             effective_velocity_ms=noisy_velocity,
             torque_required_nm=torque_required,
             torque_margin_nm=torque_margin,
@@ -122,3 +272,126 @@ class PhysicsEngine:
             gm_m=gm_m,
             stability_warning=gm_m < 0.0,
         )
+
+    def apply_environmental_noise_batch(
+        self,
+        values: np.ndarray,
+        sigma: np.ndarray,
+        rng: np.random.Generator | None = None,
+        standard_normal: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Vectorized version of ``apply_environmental_noise``.
+
+        Rows with ``sigma <= 0`` are returned unchanged and consume no
+        random numbers, so noise-free batches never touch the generator.
+        ``standard_normal`` supplies pre-drawn N(0, 1) samples (one per
+        value) for callers that manage their own random streams.
+        """
+
+        values = np.asarray(values, dtype=float)
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=float), values.shape)
+        noisy = sigma > 0.0
+        if not noisy.any():
+            return values
+
+        out = values.copy()
+        scale = sigma[noisy] * np.maximum(np.abs(values[noisy]), 1e-6)
+        if standard_normal is not None:
+            draws = np.broadcast_to(np.asarray(standard_normal, dtype=float), values.shape)[noisy]
+        else:
+            rng = rng if rng is not None else np.random.default_rng()
+            draws = rng.standard_normal(scale.shape)
+        out[noisy] = values[noisy] + draws * scale
+        return out
+
+    def step_batch(
+        self,
+        *,
+        velocity_ms: np.ndarray,
+        current_vector_ms: np.ndarray,
+        density_kgm3: np.ndarray,
+        drag_coefficient: np.ndarray,
+        area_m2: np.ndarray,
+        volume_m3: np.ndarray,
+        target_fin_angle_deg: np.ndarray,
+        fin_offset_m: np.ndarray,
+        motor_torque_nm: np.ndarray,
+        depth_m: np.ndarray,
+        length_m: np.ndarray,
+        diameter_m: np.ndarray,
+        sensor_noise_sigma: np.ndarray,
+        rng: np.random.Generator | None = None,
+        standard_normal: np.ndarray | None = None,
+    ) -> PhysicsBatch:
+        """Run ``step`` for many configurations in one vectorized pass.
+
+        Every argument accepts a scalar or a 1D array of length N
+        (``current_vector_ms`` is ``(3,)`` or ``(N, 3)``); scalars are
+        broadcast. With zero noise the results are bit-identical to
+        calling ``step`` once per row. Noise comes from ``rng`` or from
+        pre-drawn ``standard_normal`` samples.
+        """
+
+        current = np.asarray(current_vector_ms, dtype=float)
+        if current.shape[-1:] != (3,):
+            raise ValueError("current_vector_ms must have shape (3,) or (N, 3).")
+
+        scalars = np.broadcast_arrays(
+            *(
+                np.asarray(v, dtype=float)
+                for v in (
+                    velocity_ms,
+                    density_kgm3,
+                    drag_coefficient,
+                    area_m2,
+                    volume_m3,
+                    target_fin_angle_deg,
+                    fin_offset_m,
+                    motor_torque_nm,
+                    depth_m,
+                    length_m,
+                    diameter_m,
+                    sensor_noise_sigma,
+                )
+            ),
+            current[..., 0],
+        )
+        (
+            velocity,
+            density,
+            cd,
+            area,
+            volume,
+            fin_angle,
+            fin_offset,
+            motor_torque,
+            depth,
+            length,
+            diameter,
+            sigma,
+            _,
+        ) = (np.atleast_1d(a) for a in scalars)
+        cx, cy, cz = (np.broadcast_to(current[..., i], velocity.shape) for i in range(3))
+
+        # Same operation order as the scalar path so results match exactly.
+        current_mag = np.sqrt(cx * cx + cy * cy + cz * cz)
+        effective_velocity = np.maximum(0.0, velocity + current_mag)
+        noisy_velocity = self.apply_environmental_noise_batch(effective_velocity, sigma, rng, standard_normal)
+
+        drag = 0.5 * density * noisy_velocity * noisy_velocity * cd * area
+        buoyancy = density * self.gravity * volume
+
+        angle_ratio = np.minimum(np.abs(fin_angle) / 35.0, 1.0)
+        torque_required = drag * np.abs(fin_offset) * angle_ratio
+
+        gm_m = (diameter * 0.2) - (length * 0.01)
+        return PhysicsBatch(
+            drag_force_n=drag,
+            buoyancy_force_n=buoyancy,
+            effective_velocity_ms=noisy_velocity,
+            torque_required_nm=torque_required,
+            torque_margin_nm=motor_torque - torque_required,
+            cavitation_risk=(depth < 2.0) & (noisy_velocity > 5.0),
+            gm_m=gm_m,
+            stability_warning=gm_m < 0.0,
+        )
@@ -0,0 +1,144 @@
+"""Opt-in per-stage timers, counters and latency histograms.
+
+A ``Profiler`` is attached to ``SubmarineApp`` (``profiler=...``) and
+collects, for each named stage (``ingest``, ``hull``, ``step``, ``row``,
+``csv``...), the call count, total time and worst call. Every
+``sample_every``-th call of a stage also goes into a latency histogram
+and to the registered callbacks, e.g. to export to a metrics system.
+
+With no profiler attached the app takes its plain code paths, so the
+only cost is one ``None`` check per call.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+# Histogram bucket upper bounds in seconds: 1 us .. 1 s, three per decade.
+DEFAULT_BOUNDS = tuple(m * 10.0**e for e in range(-6, 0) for m in (1.0, 2.0, 5.0)) + (1.0,)
+
+# A callback receives the stage name and the duration of one sampled call.
+StageCallback = Callable[[str, float], None]
+
+_NULL_STAGE = nullcontext()
+
+
+@dataclass
+class StageStats:
+    """Cumulative figures for one stage."""
+
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    sampled: int = 0
+    buckets: list[int] = field(default_factory=list)
+
+    def summary(self, bounds: tuple[float, ...], scale: float = 1e6) -> dict:
+        """JSON-friendly figures (durations in microseconds by default)."""
+
+        out = {
+            "calls": self.calls,
+            "total_ms": round(self.total_s * 1e3, 3),
+            "mean_us": round(self.total_s / self.calls * scale, 3) if self.calls else 0.0,
+            "max_us": round(self.max_s * scale, 3),
+        }
+        if self.sampled:
+            out["sampled"] = self.sampled
+            for label, q in (("p50_us", 0.5), ("p99_us", 0.99)):
+                # Bucket bounds overshoot; the worst call is a tighter cap.
+                out[label] = round(min(_bucket_quantile(self.buckets, bounds, q), self.max_s) * scale, 3)
+        return out
+
+
+def _bucket_quantile(buckets: list[int], bounds: tuple[float, ...], q: float) -> float:
+    """Upper bound of the bucket holding quantile ``q`` (inf for the overflow bucket)."""
+
+    target = q * sum(buckets)
+    seen = 0
+    for i, count in enumerate(buckets):
+        seen += count
+        if count and seen >= target:
+            return bounds[i] if i < len(bounds) else float("inf")
+    return 0.0
+
+
+class Profiler:
+    """Collects stage timings and counters for one app (not thread-safe)."""
+
+    def __init__(
+        self,
+        *,
+        sample_every: int = 1,
+        bounds: tuple[float, ...] = DEFAULT_BOUNDS,
+        callbacks: tuple[StageCallback, ...] = (),
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if sample_every < 0:
+            raise ValueError("sample_every must be >= 0 (0 disables histograms).")
+        self.sample_every = sample_every
+        self.bounds = tuple(bounds)
+        self.callbacks: list[StageCallback] = list(callbacks)
+        self.clock = clock
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, int] = {}
+
+    def add_callback(self, callback: StageCallback) -> None:
+        """Call ``callback(stage, seconds)`` for every sampled stage call."""
+
+        self.callbacks.append(callback)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one timed call of ``stage``."""
+
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats(buckets=[0] * (len(self.bounds) + 1))
+        stats.calls += 1
+        stats.total_s += seconds
+        if seconds > stats.max_s:
+            stats.max_s = seconds
+        if self.sample_every and stats.calls % self.sample_every == 0:
+            stats.sampled += 1
+            stats.buckets[bisect_left(self.bounds, seconds)] += 1
+            for callback in self.callbacks:
+                callback(stage, seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the ``with`` body as one call of stage ``name``."""
+
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, self.clock() - started)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increase counter ``name`` by ``n``."""
+
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def reset(self) -> None:
+        """Drop all collected figures (callbacks are kept)."""
+
+        self.stages.clear()
+        self.counters.clear()
+
+    def summary(self) -> dict:
+        """Stages sorted by total time, plus counters."""
+
+        ordered = sorted(self.stages.items(), key=lambda item: item[1].total_s, reverse=True)
+        return {
+            "stages": {name: stats.summary(self.bounds) for name, stats in ordered},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+
+def stage(profiler: Profiler | None, name: str):
+    """``profiler.stage(name)``, or a shared no-op context when profiling is off."""
+
+    return _NULL_STAGE if profiler is None else profiler.stage(name)
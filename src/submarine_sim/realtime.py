@@ -0,0 +1,420 @@
+"""Fixed-rate simulation loop for hardware-in-the-loop runs.
+
+``RealTimeLoop`` steps a ``SubmarineApp`` at a wall-clock rate (e.g.
+100 Hz or 1 kHz). Each tick it reads steering commands from a channel,
+applies the newest one, runs one physics step and publishes the row.
+It records missed deadlines, tick start jitter and per-stage latency.
+
+Channels speak JSON Lines: one command object per line in, one
+telemetry row per line out. ``QueueChannel`` is an in-process stand-in,
+``StreamChannel`` works on raw file descriptors (e.g. a pseudo-terminal)
+and ``SerialChannel`` uses pyserial for real ports.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+import numpy as np
+
+from .app import SubmarineApp
+from .schema_validator import default_validator
+
+# Case fields a command is allowed to change.
+COMMAND_FIELDS = ("target_fin_angle_deg", "motor_torque_nm")
+
+# Error messages of the most recently rejected commands kept in the stats.
+COMMAND_ERROR_LOG_SIZE = 20
+
+STAGES = ("read", "step", "publish")
+
+
+class Channel(ABC):
+    """Base class: steering commands in, telemetry rows out."""
+
+    @abstractmethod
+    def read_commands(self) -> list[dict]:
+        """Return every command received since the last call (never blocks)."""
+
+    @abstractmethod
+    def publish(self, row: dict) -> None:
+        """Send one telemetry row (never blocks)."""
+
+    def close(self) -> None:
+        """Release resources (no-op by default)."""
+
+    def __enter__(self) -> Channel:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class QueueChannel(Channel):
+    """In-process channel backed by two queues, for local tests and demos.
+
+    When ``maxsize`` is set and nobody drains ``telemetry``, the oldest
+    row is dropped so the loop never blocks.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.commands: queue.Queue = queue.Queue()
+        self.telemetry: queue.Queue = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def send_command(self, command: dict) -> None:
+        """Producer side: queue one steering command."""
+
+        self.commands.put(command)
+
+    def read_commands(self) -> list[dict]:
+        out = []
+        while True:
+            try:
+                out.append(self.commands.get_nowait())
+            except queue.Empty:
+                return out
+
+    def publish(self, row: dict) -> None:
+        try:
+            self.telemetry.put_nowait(row)
+        except queue.Full:
+            self.telemetry.get_nowait()
+            self.telemetry.put_nowait(row)
+            self.dropped += 1
+
+
+class _JsonLinesChannel(Channel):
+    """Shared JSON Lines framing; subclasses move raw bytes."""
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self.bad_lines = 0
+
+    @abstractmethod
+    def _read_available(self) -> bytes:
+        """Return whatever bytes have arrived (never blocks)."""
+
+    @abstractmethod
+    def _write(self, data: bytes) -> None:
+        """Send one encoded line (never blocks)."""
+
+    def read_commands(self) -> list[dict]:
+        self._buffer += self._read_available()
+        *lines, self._buffer = self._buffer.split(b"\n")
+        commands = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                command = json.loads(line)
+            except ValueError:
+                self.bad_lines += 1
+                continue
+            if isinstance(command, dict):
+                commands.append(command)
+            else:
+                self.bad_lines += 1
+        return commands
+
+    def publish(self, row: dict) -> None:
+        self._write(json.dumps(row).encode("utf-8") + b"\n")
+
+
+class StreamChannel(_JsonLinesChannel):
+    """JSON Lines over raw file descriptors, e.g. the master side of a pty.
+
+    Writes never block. When the peer stops reading, a row that could not
+    be started is dropped (counted in ``dropped``); a row cut off
+    part-way is kept and finished before anything else is sent, so the
+    peer never sees a broken line.
+    """
+
+    def __init__(self, read_fd: int, write_fd: int | None = None) -> None:
+        super().__init__()
+        self.read_fd = read_fd
+        self.write_fd = read_fd if write_fd is None else write_fd
+        os.set_blocking(self.read_fd, False)
+        # Unsent tail of a partly written row.
+        self._pending = b""
+        self.dropped = 0
+
+    @classmethod
+    def open_pty(cls) -> tuple[StreamChannel, str]:
+        """Create a pseudo-terminal pair (POSIX only).
+
+        Returns the channel (master side) and the device path of the
+        other end, which a hardware simulator opens like a serial port.
+        """
+
+        import tty
+
+        master, slave = os.openpty()
+        # Raw mode: no echo and no line editing, bytes pass through as-is.
+        tty.setraw(slave)
+        channel = cls(master)
+        channel._slave_fd = slave
+        return channel, os.ttyname(slave)
+
+    def _read_available(self) -> bytes:
+        chunks = []
+        while True:
+            try:
+                data = os.read(self.read_fd, 65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            if not data:
+                break
+            chunks.append(data)
+        return b"".join(chunks)
+
+    def _write(self, data: bytes) -> None:
+        if self._pending:
+            self._pending = self._send(self._pending)
+            if self._pending:
+                # Peer is still not reading; drop this whole row rather than stall the loop.
+                self.dropped += 1
+                return
+        rest = self._send(data)
+        if len(rest) == len(data):
+            self.dropped += 1
+        else:
+            self._pending = rest
+
+    def _send(self, data: bytes) -> bytes:
+        """Write as much of ``data`` as the descriptor takes now; return the rest."""
+
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self.write_fd, view)
+            except BlockingIOError:
+                break
+            view = view[written:]
+        return bytes(view)
+
+    def close(self) -> None:
+        for fd in {self.read_fd, self.write_fd, getattr(self, "_slave_fd", None)} - {None}:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class SerialChannel(_JsonLinesChannel):
+    """JSON Lines over a serial port (or any pyserial URL such as ``loop://``)."""
+
+    def __init__(self, port: str, baudrate: int = 115200) -> None:
+        super().__init__()
+        try:
+            import serial
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("SerialChannel needs pyserial; install it from requirements.txt.") from exc
+        self.port = serial.serial_for_url(port, baudrate=baudrate, timeout=0, write_timeout=0)
+
+    def _read_available(self) -> bytes:
+        waiting = self.port.in_waiting
+        return self.port.read(waiting) if waiting else b""
+
+    def _write(self, data: bytes) -> None:
+        try:
+            self.port.write(data)
+        except Exception:  # noqa: BLE001 - pyserial raises SerialTimeoutException when the buffer is full
+            pass
+
+    def close(self) -> None:
+        self.port.close()
+
+
+class TimingRing:
+    """Running stats over all samples plus percentiles over the newest ones."""
+
+    def __init__(self, size: int) -> None:
+        self._values = np.empty(size)
+        self._next = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def summary(self, scale: float = 1e6) -> dict:
+        """Mean/max over everything, p50/p99 over the ring (microseconds by default)."""
+
+        if not self.count:
+            return {"count": 0}
+        recent = self._values[: min(self.count, len(self._values))]
+        p50, p99 = np.percentile(recent, [50, 99])
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count * scale, 3),
+            "p50": round(float(p50) * scale, 3),
+            "p99": round(float(p99) * scale, 3),
+            "max": round(self.max * scale, 3),
+        }
+
+
+@dataclass
+class RealTimeStats:
+    """Timing record of one real-time run (times in seconds)."""
+
+    rate_hz: float
+    window: int = 100_000
+    ticks: int = 0
+    missed_deadlines: int = 0
+    skipped_ticks: int = 0
+    commands_applied: int = 0
+    commands_rejected: int = 0
+    jitter: TimingRing = field(init=False)
+    stages: dict[str, TimingRing] = field(init=False)
+    command_errors: deque[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.jitter = TimingRing(self.window)
+        self.stages = {name: TimingRing(self.window) for name in STAGES}
+        self.command_errors = deque(maxlen=COMMAND_ERROR_LOG_SIZE)
+
+    def summary(self) -> dict:
+        """JSON-friendly report (durations in microseconds)."""
+
+        return {
+            "rate_hz": self.rate_hz,
+            "ticks": self.ticks,
+            "missed_deadlines": self.missed_deadlines,
+            "skipped_ticks": self.skipped_ticks,
+            "commands_applied": self.commands_applied,
+            "commands_rejected": self.commands_rejected,
+            "command_errors": list(self.command_errors),
+            "jitter_us": self.jitter.summary(),
+            "stage_latency_us": {name: ring.summary() for name, ring in self.stages.items()},
+        }
+
+
+class RealTimeLoop:
+    """Steps a loaded ``SubmarineApp`` on a fixed wall-clock schedule.
+
+    Tick ``k`` is due at ``start + k / rate_hz``. The loop sleeps until
+    just before each deadline and spins for the last ``spin_s`` for
+    precision. A tick that ends after the next one was due counts as a
+    missed deadline; ticks that are entirely overdue are skipped instead
+    of run in a burst, so the schedule never drifts.
+    """
+
+    def __init__(
+        self,
+        app: SubmarineApp,
+        channel: Channel,
+        *,
+        rate_hz: float = 100.0,
+        spin_s: float = 0.001,
+        clock: Callable[[], float] = time.perf_counter,
+        timing_window: int = 100_000,
+    ) -> None:
+        if rate_hz <= 0.0:
+            raise ValueError("rate_hz must be > 0.")
+        if app.ingestor.current_params is None:
+            raise ValueError("No case loaded.")
+        self.app = app
+        self.channel = channel
+        self.rate_hz = rate_hz
+        self.period_s = 1.0 / rate_hz
+        self.spin_s = spin_s
+        self.clock = clock
+        self.timing_window = timing_window
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Ask a running loop (e.g. on another thread) to finish after this tick."""
+
+        self._stop.set()
+
+    def run(self, ticks: int | None = None, duration_s: float | None = None) -> RealTimeStats:
+        """Run until ``ticks`` ticks, ``duration_s`` seconds, or ``stop()``."""
+
+        stats = RealTimeStats(self.rate_hz, window=self.timing_window)
+        self._stop.clear()
+        clock = self.clock
+        period = self.period_s
+        start = clock()
+        end = start + duration_s if duration_s is not None else None
+        k = 0
+
+        while not self._stop.is_set() and (ticks is None or stats.ticks < ticks):
+            due = start + k * period
+            if end is not None and due >= end:
+                break
+            self._wait_until(due)
+
+            t0 = clock()
+            stats.jitter.add(t0 - due)
+            self._apply_commands(self.channel.read_commands(), stats)
+            t1 = clock()
+            row = self.app.step_row()
+            t2 = clock()
+            self.channel.publish(row)
+            t3 = clock()
+
+            stage = stats.stages
+            stage["read"].add(t1 - t0)
+            stage["step"].add(t2 - t1)
+            stage["publish"].add(t3 - t2)
+            stats.ticks += 1
+
+            k += 1
+            next_due = start + k * period
+            if t3 > next_due:
+                stats.missed_deadlines += 1
+                # Skip ticks that are already over instead of bursting to catch up.
+                behind = int((t3 - next_due) // period)
+                stats.skipped_ticks += behind
+                k += behind
+        return stats
+
+    def _wait_until(self, deadline: float) -> None:
+        """Sleep most of the way, then spin until ``deadline``."""
+
+        remaining = deadline - self.clock()
+        if remaining > self.spin_s:
+            time.sleep(remaining - self.spin_s)
+        while self.clock() < deadline:
+            pass
+
+    def _apply_commands(self, commands: list[dict], stats: RealTimeStats) -> None:
+        """Apply the newest valid command to the loaded case's steering.
+
+        Values must be JSON numbers, as in case files: strings, booleans
+        and non-finite values reject the command and log its error.
+        """
+
+        if not commands:
+            return
+        params = self.app.ingestor.current_params
+        for command in commands:
+            try:
+                values = {name: command[name] for name in COMMAND_FIELDS if name in command}
+                if not values or len(values) != len(command):
+                    raise ValueError("Unknown or empty command.")
+                candidate = replace(params, steering_output=replace(params.steering_output, **values))
+                # Same contract and phase limits as case files.
+                default_validator().check_case(candidate)
+            except (KeyError, TypeError, ValueError) as exc:
+                stats.commands_rejected += 1
+                stats.command_errors.append(f"{type(exc).__name__}: {exc}")
+                continue
+            params = candidate
+            stats.commands_applied += 1
+        self.app.ingestor.current_params = params
@@ -0,0 +1,284 @@
+"""Golden-file regression diffing of telemetry CSV reports.
+
+Reference and candidate reports are loaded as NumPy columns and compared
+field by field in one vectorized pass. Float fields pass when
+``|candidate - reference| <= atol + rtol * |reference|`` (NumPy
+``isclose`` semantics, NaN equal to NaN); flag and text fields must
+match exactly. Each field reports its max absolute/relative error and
+the first divergent step. ``compare_many`` spreads thousands of pairs
+over worker processes.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from .telemetry_store import FIELD_DTYPES
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    """Allowed difference for one float field."""
+
+    atol: float = 0.0
+    rtol: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.atol < 0.0 or self.rtol < 0.0:
+            raise ValueError("Tolerances must be >= 0.")
+
+
+# Floats may differ by rounding noise only; everything else must match exactly.
+DEFAULT_TOLERANCE = Tolerance(atol=1e-12, rtol=1e-9)
+
+
+@dataclass
+class FieldDiff:
+    """Comparison of one column over the rows both reports have.
+
+    For flag and text fields both errors are 1.0 when any row differs.
+    """
+
+    field: str
+    mismatches: int
+    first_divergent_step: int | None
+    max_abs_error: float = 0.0
+    max_rel_error: float = 0.0
+
+
+@dataclass
+class DiffResult:
+    """Comparison of one reference/candidate report pair."""
+
+    reference: str
+    candidate: str
+    reference_rows: int = 0
+    candidate_rows: int = 0
+    fields: dict[str, FieldDiff] = field(default_factory=dict)
+    missing_fields: list[str] = field(default_factory=list)
+    extra_fields: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return (
+            self.error is None
+            and not self.missing_fields
+            and not self.extra_fields
+            and self.reference_rows == self.candidate_rows
+            and all(diff.mismatches == 0 for diff in self.fields.values())
+        )
+
+    @property
+    def first_divergent_step(self) -> int | None:
+        """Earliest step where any field differs, or where one report ends early."""
+
+        steps = [diff.first_divergent_step for diff in self.fields.values() if diff.first_divergent_step is not None]
+        if self.reference_rows != self.candidate_rows:
+            steps.append(min(self.reference_rows, self.candidate_rows))
+        return min(steps) if steps else None
+
+    def as_dict(self) -> dict:
+        out = asdict(self)
+        out["passed"] = self.passed
+        out["first_divergent_step"] = self.first_divergent_step
+        out["fields"] = {name: asdict(diff) for name, diff in self.fields.items()}
+        return out
+
+
+def load_telemetry_csv(path: str | Path) -> dict[str, np.ndarray]:
+    """Read a report into typed columns (see ``parse_telemetry_csv``)."""
+
+    return parse_telemetry_csv(Path(path).read_text(encoding="utf-8"))
+
+
+def parse_telemetry_csv(text: str) -> dict[str, np.ndarray]:
+    """Split report text into typed columns (see ``FIELD_DTYPES``).
+
+    Flags must be exactly ``True`` or ``False``; any other value raises
+    ``ValueError`` naming its row and column. Unknown columns are floats
+    when every value parses, otherwise strings. Reports written by
+    ``save_report`` have no quoted fields, so the text is split on commas
+    in one pass; quoted files fall back to the ``csv`` module.
+    """
+
+    header, _, body = text.partition("\n")
+    names = next(csv.reader([header])) if header.strip() else []
+    if not names:
+        return {}
+    body = body.replace("\r\n", "\n").strip("\n")
+    if '"' in text:
+        rows = list(csv.reader(body.split("\n"))) if body else []
+        raw = [list(col) for col in zip(*rows)] if rows else [[] for _ in names]
+    else:
+        values = body.replace("\n", ",").split(",") if body else []
+        if len(values) % len(names):
+            raise ValueError("Rows do not match the header's column count.")
+        raw = [values[i :: len(names)] for i in range(len(names))]
+
+    columns = {}
+    for name, values in zip(names, raw):
+        dtype = FIELD_DTYPES.get(name)
+        if dtype is np.bool_:
+            columns[name] = _parse_flags(name, values)
+        elif dtype is not None:
+            columns[name] = np.fromiter(map(float, values), dtype, len(values))
+        else:
+            try:
+                columns[name] = np.fromiter(map(float, values), np.float64, len(values))
+            except ValueError:
+                columns[name] = np.asarray(values, dtype=str)
+    return columns
+
+
+def _parse_flags(name: str, values: list[str]) -> np.ndarray:
+    """Parse one flag column; rows are numbered from 1 after the header."""
+
+    text = np.asarray(values, dtype=str)
+    flags = text == "True"
+    bad = ~flags & (text != "False")
+    if bad.any():
+        row = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"Row {row + 1}, column {name!r}: expected True or False, got {values[row]!r}.")
+    return flags
+
+
+def compare_columns(
+    reference: Mapping[str, np.ndarray],
+    candidate: Mapping[str, np.ndarray],
+    tolerances: Mapping[str, Tolerance] | None = None,
+    default: Tolerance = DEFAULT_TOLERANCE,
+    *,
+    reference_name: str = "reference",
+    candidate_name: str = "candidate",
+) -> DiffResult:
+    """Compare two column tables over their common rows."""
+
+    tolerances = tolerances or {}
+    ref_rows = len(next(iter(reference.values()))) if reference else 0
+    cand_rows = len(next(iter(candidate.values()))) if candidate else 0
+    result = DiffResult(
+        reference_name,
+        candidate_name,
+        reference_rows=ref_rows,
+        candidate_rows=cand_rows,
+        missing_fields=[name for name in reference if name not in candidate],
+        extra_fields=[name for name in candidate if name not in reference],
+    )
+    n = min(ref_rows, cand_rows)
+    for name, ref in reference.items():
+        if name in candidate:
+            result.fields[name] = _compare_field(name, ref[:n], candidate[name][:n], tolerances.get(name, default))
+    return result
+
+
+def _compare_field(name: str, ref: np.ndarray, cand: np.ndarray, tol: Tolerance) -> FieldDiff:
+    """Vectorized comparison of one column."""
+
+    if np.issubdtype(ref.dtype, np.floating) and np.issubdtype(cand.dtype, np.floating):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            abs_err = np.abs(cand - ref)
+            rel_err = abs_err / np.abs(ref)
+        both_nan = np.isnan(ref) & np.isnan(cand)
+        bad = ~((abs_err <= tol.atol + tol.rtol * np.abs(ref)) | both_nan)
+        finite = np.isfinite(abs_err)
+        max_abs = float(abs_err[finite].max()) if finite.any() else 0.0
+        finite_rel = np.isfinite(rel_err)
+        max_rel = float(rel_err[finite_rel].max()) if finite_rel.any() else 0.0
+    else:
+        bad = ref != cand
+        max_abs = max_rel = float(bad.any())
+    mismatches = int(np.count_nonzero(bad))
+    first = int(np.argmax(bad)) if mismatches else None
+    return FieldDiff(name, mismatches, first, max_abs, max_rel)
+
+
+def compare_files(
+    reference: str | Path,
+    candidate: str | Path,
+    tolerances: Mapping[str, Tolerance] | None = None,
+    default: Tolerance = DEFAULT_TOLERANCE,
+) -> DiffResult:
+    """Load and compare one report pair; read errors are reported, not raised.
+
+    Byte-identical files pass without being parsed.
+    """
+
+    try:
+        ref_bytes = Path(reference).read_bytes()
+        cand_bytes = Path(candidate).read_bytes()
+        if ref_bytes == cand_bytes:
+            return _identical(str(reference), str(candidate), ref_bytes)
+        ref = parse_telemetry_csv(ref_bytes.decode("utf-8"))
+        cand = parse_telemetry_csv(cand_bytes.decode("utf-8"))
+    except (OSError, ValueError) as exc:
+        return DiffResult(str(reference), str(candidate), error=str(exc))
+    return compare_columns(
+        ref, cand, tolerances, default, reference_name=str(reference), candidate_name=str(candidate)
+    )
+
+
+def _identical(reference: str, candidate: str, data: bytes) -> DiffResult:
+    """Passing result for two byte-identical reports."""
+
+    header, _, body = data.partition(b"\n")
+    names = next(csv.reader([header.decode("utf-8")])) if header.strip() else []
+    rows = body.count(b"\n") + (1 if body and not body.endswith(b"\n") else 0)
+    return DiffResult(
+        reference,
+        candidate,
+        reference_rows=rows,
+        candidate_rows=rows,
+        fields={name: FieldDiff(name, 0, None) for name in names},
+    )
+
+
+def _compare_job(job: tuple) -> DiffResult:
+    return compare_files(*job)
+
+
+def compare_many(
+    pairs: Iterable[tuple[str | Path, str | Path]],
+    tolerances: Mapping[str, Tolerance] | None = None,
+    default: Tolerance = DEFAULT_TOLERANCE,
+    *,
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> list[DiffResult]:
+    """Compare many pairs, in order.
+
+    ``workers=0`` compares in this process; otherwise pairs are spread
+    over a ``ProcessPoolExecutor`` in chunks of ``chunksize`` pairs.
+    """
+
+    jobs = [(str(ref), str(cand), dict(tolerances or {}), default) for ref, cand in pairs]
+    if workers == 0 or len(jobs) <= 1:
+        return [_compare_job(job) for job in jobs]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_compare_job, jobs, chunksize=chunksize))
+
+
+def pair_directories(
+    reference_dir: str | Path,
+    candidate_dir: str | Path,
+    pattern: str = "*.csv",
+) -> tuple[list[tuple[Path, Path]], list[Path]]:
+    """Match reports by relative path; also return references with no candidate."""
+
+    reference_dir, candidate_dir = Path(reference_dir), Path(candidate_dir)
+    pairs, missing = [], []
+    for ref in sorted(reference_dir.rglob(pattern)):
+        cand = candidate_dir / ref.relative_to(reference_dir)
+        if cand.is_file():
+            pairs.append((ref, cand))
+        else:
+            missing.append(ref)
+    return pairs, missing
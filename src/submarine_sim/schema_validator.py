@@ -0,0 +1,313 @@
+"""Batch validation compiled from ``schemas/phase1_contract.schema.json``.
+
+The schema's numeric limits are compiled once into range rules on
+dotted field paths, and its string enums into choice rules. A whole batch of cases is then checked as NumPy
+columns, one vectorized comparison per rule. The same rules back
+``MathIngestor`` single-case validation, so the limits live in one place.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .case_batch import CaseBatch
+from .models import SimulationInput
+
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / "schemas" / "phase1_contract.schema.json"
+
+ERROR_DTYPE = np.dtype([("case", np.int64), ("field", "U64"), ("message", "U96")])
+
+
+@dataclass
+class RangeRule:
+    """Numeric limits for one dotted field path."""
+
+    field: str
+    minimum: float | None = None
+    maximum: float | None = None
+    exclusive_minimum: float | None = None
+    exclusive_maximum: float | None = None
+    use_abs: bool = False
+    message: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.message is None:
+            self.message = self._default_message()
+
+    def _default_message(self) -> str:
+        """Build messages in the style MathIngestor has always used."""
+
+        parts = self.field.split(".")
+        # Array items read as e.g. "current_vector_ms[0]".
+        name = f"{parts[-2]}[{parts[-1]}]" if parts[-1].isdigit() else parts[-1]
+        lower = self.minimum if self.minimum is not None else self.exclusive_minimum
+        upper = self.maximum if self.maximum is not None else self.exclusive_maximum
+        if lower is None and upper is None:
+            return f"{name} must be a finite number."
+        if lower is not None and upper is not None:
+            return f"{name} out of range."
+        if self.exclusive_minimum is not None:
+            return f"{name} must be > {_fmt(self.exclusive_minimum)}."
+        if self.minimum is not None:
+            return f"{name} must be >= {_fmt(self.minimum)}."
+        if self.exclusive_maximum is not None:
+            return f"{name} must be < {_fmt(self.exclusive_maximum)}."
+        return f"{name} must be <= {_fmt(self.maximum)}."
+
+    def check(self, value: float) -> bool:
+        """Return ``True`` if one scalar value passes (no NumPy overhead)."""
+
+        x = abs(value) if self.use_abs else value
+        if not math.isfinite(x):
+            return False
+        if self.minimum is not None and x < self.minimum:
+            return False
+        if self.exclusive_minimum is not None and x <= self.exclusive_minimum:
+            return False
+        if self.maximum is not None and x > self.maximum:
+            return False
+        if self.exclusive_maximum is not None and x >= self.exclusive_maximum:
+            return False
+        return True
+
+    def violations(self, values: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of rows that break this rule."""
+
+        x = np.abs(values) if self.use_abs else values
+        with np.errstate(invalid="ignore"):
+            bad = ~np.isfinite(x)
+            if self.minimum is not None:
+                bad |= x < self.minimum
+            if self.exclusive_minimum is not None:
+                bad |= x <= self.exclusive_minimum
+            if self.maximum is not None:
+                bad |= x > self.maximum
+            if self.exclusive_maximum is not None:
+                bad |= x >= self.exclusive_maximum
+        return bad
+
+
+@dataclass
+class ChoiceRule:
+    """Allowed string values for one dotted field path."""
+
+    field: str
+    choices: tuple[str, ...]
+    message: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.message is None:
+            self.message = f"{self.field.split('.')[-1]} must be one of {', '.join(self.choices)}."
+
+    def check(self, value: object) -> bool:
+        """Return ``True`` if one value is an allowed choice."""
+
+        return isinstance(value, str) and value in self.choices
+
+    def violations(self, values: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of rows whose value is not an allowed choice."""
+
+        return np.array([not self.check(value) for value in values], dtype=bool)
+
+
+# Phase 1 operating limits that sit on top of the input contract.
+PHASE_LIMIT_RULES = (
+    RangeRule("physics_state.depth_m", maximum=500.0, message="Depth exceeds Phase 1 limit (500m)."),
+    RangeRule(
+        "steering_output.target_fin_angle_deg",
+        maximum=35.0,
+        use_abs=True,
+        message="Target fin angle exceeds limit (+/-35deg).",
+    ),
+)
+
+
+def _fmt(value: float) -> str:
+    return f"{value:g}"
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating a batch.
+
+    ``mask[i]`` is ``True`` when case ``i`` passed every rule. ``errors``
+    is a structured array with one ``(case, field, message)`` record per
+    violation.
+    """
+
+    mask: np.ndarray
+    errors: np.ndarray
+
+    @property
+    def valid_count(self) -> int:
+        return int(self.mask.sum())
+
+    def errors_for(self, case_index: int) -> list[tuple[str, str]]:
+        """Return ``(field, message)`` pairs for one case."""
+
+        rows = self.errors[self.errors["case"] == case_index]
+        return list(zip(rows["field"].tolist(), rows["message"].tolist()))
+
+
+class BatchValidator:
+    """Checks many cases at once against compiled range rules."""
+
+    def __init__(
+        self, rules: Sequence[RangeRule], required: Sequence[str] = (), choices: Sequence[ChoiceRule] = ()
+    ) -> None:
+        self.rules = list(rules)
+        self.required = list(required)
+        self.choices = list(choices)
+
+    @classmethod
+    def from_schema(cls, schema_path: str | Path = SCHEMA_PATH, *, phase_limits: bool = True) -> BatchValidator:
+        """Compile rules from the JSON schema (plus Phase 1 limits if requested)."""
+
+        schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
+        rules: list[RangeRule] = []
+        required: list[str] = []
+        choices: list[ChoiceRule] = []
+        _compile(schema, "", rules, required, choices)
+        if phase_limits:
+            rules.extend(PHASE_LIMIT_RULES)
+        return cls(rules, required, choices)
+
+    def validate_columns(self, columns: Mapping[str, np.ndarray]) -> ValidationResult:
+        """Validate dotted-path columns (missing required fields are errors)."""
+
+        n = len(next(iter(columns.values()))) if columns else 0
+        mask = np.ones(n, dtype=bool)
+        chunks: list[np.ndarray] = []
+
+        for field in self.required:
+            if field not in columns:
+                mask[:] = False
+                chunks.append(_records(np.arange(n), field, f"{field} is required."))
+
+        for rule in self.rules:
+            if rule.field not in columns:
+                continue
+            bad = rule.violations(np.asarray(columns[rule.field], dtype=float))
+            if bad.any():
+                mask &= ~bad
+                chunks.append(_records(np.flatnonzero(bad), rule.field, rule.message))
+
+        for choice in self.choices:
+            if choice.field not in columns:
+                continue
+            bad = choice.violations(columns[choice.field])
+            if bad.any():
+                mask &= ~bad
+                chunks.append(_records(np.flatnonzero(bad), choice.field, choice.message))
+
+        errors = np.concatenate(chunks) if chunks else np.empty(0, dtype=ERROR_DTYPE)
+        if len(errors):
+            errors = errors[np.argsort(errors["case"], kind="stable")]
+        return ValidationResult(mask, errors)
+
+    def validate_batch(self, batch: CaseBatch) -> ValidationResult:
+        """Validate every row of a ``CaseBatch``."""
+
+        return self.validate_columns(batch.columns)
+
+    def validate_records(self, records: Sequence[Mapping]) -> ValidationResult:
+        """Validate raw JSON-like dicts; missing or non-numeric values become NaN."""
+
+        fields = {rule.field for rule in self.rules}
+        columns = {field: np.full(len(records), np.nan) for field in fields}
+        for i, record in enumerate(records):
+            for field in fields:
+                value = _lookup(record, field)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    columns[field][i] = value
+        for choice in self.choices:
+            columns[choice.field] = np.array([_lookup(record, choice.field) for record in records], dtype=object)
+        return self.validate_columns(columns)
+
+    def check_case(self, case: SimulationInput) -> None:
+        """Raise ``ValueError`` with the first violated rule of one case.
+
+        Like ``validate_records``, values must be real JSON numbers:
+        strings such as ``"3.05"``, booleans and nulls are rejected, not coerced.
+        """
+
+        raw = {section: vars(getattr(case, section)) for section in vars(case)}
+        for rule in self.rules:
+            value = _lookup(raw, rule.field)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValueError(f"{rule.field} must be a number, got {type(value).__name__}.")
+            if not rule.check(float(value)):
+                raise ValueError(rule.message)
+        for choice in self.choices:
+            if not choice.check(_lookup(raw, choice.field)):
+                raise ValueError(choice.message)
+
+
+def _compile(
+    node: Mapping, prefix: str, rules: list[RangeRule], required: list[str], choices: list[ChoiceRule]
+) -> None:
+    """Walk schema ``properties`` and collect numeric range rules and string enums."""
+
+    for name, spec in node.get("properties", {}).items():
+        path = f"{prefix}{name}"
+        if name in node.get("required", ()) and spec.get("type") != "object":
+            if spec.get("type") == "array":
+                required.extend(f"{path}.{i}" for i in range(spec.get("minItems", 0)))
+            elif spec.get("type") == "number":
+                required.append(path)
+        kind = spec.get("type")
+        if kind == "object":
+            _compile(spec, f"{path}.", rules, required, choices)
+        elif kind == "number":
+            limits = {
+                "minimum": spec.get("minimum"),
+                "maximum": spec.get("maximum"),
+                "exclusive_minimum": spec.get("exclusiveMinimum"),
+                "exclusive_maximum": spec.get("exclusiveMaximum"),
+            }
+            rules.append(RangeRule(path, **limits))
+        elif kind == "array" and spec.get("items", {}).get("type") == "number":
+            # Fixed-length numeric arrays become one column per item.
+            for i in range(spec.get("maxItems", spec.get("minItems", 0))):
+                rules.append(RangeRule(f"{path}.{i}"))
+        elif kind == "string" and "enum" in spec:
+            choices.append(ChoiceRule(path, tuple(spec["enum"])))
+
+
+def _records(cases: np.ndarray, field: str, message: str) -> np.ndarray:
+    out = np.empty(len(cases), dtype=ERROR_DTYPE)
+    out["case"] = cases
+    out["field"] = field
+    out["message"] = message
+    return out
+
+
+def _lookup(record: Mapping, field: str) -> object:
+    """Follow a dotted path (list items by index) through nested dicts."""
+
+    value: object = record
+    for part in field.split("."):
+        if isinstance(value, Mapping):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+PHASE_LIMITS = BatchValidator(PHASE_LIMIT_RULES)
+
+
+@lru_cache(maxsize=None)
+def default_validator(phase_limits: bool = True) -> BatchValidator:
+    """Return the validator compiled from the shipped schema (compiled once)."""
+
+    return BatchValidator.from_schema(phase_limits=phase_limits)
@@ -0,0 +1,272 @@
+"""Sensitivity of physics outputs to case inputs, for many cases at once.
+
+``jacobian`` returns, for every case in a ``CaseBatch``, the matrix of
+partial derivatives d(output)/d(input) for every float ``PhysicsSnapshot``
+output and every numeric case field (``NUMERIC_FIELDS``). The noise-free
+physics step is differentiated:
+
+- ``analytic``: closed-form derivatives of the formulas in
+  ``PhysicsEngine`` (fixed Cd per NACA profile, analytic hull area and
+  volume). Exact and cheap.
+- ``fd``: central finite differences. Every +/- perturbation of every
+  field of every case is stacked into one ``CaseBatch`` and evaluated in
+  a single ``step_batch`` call (per chunk of cases). Needed with a drag
+  table, where Cd depends on velocity, length, density and fin angle.
+
+At kinks (fin angle at +/-35 deg, zero effective velocity, zero current)
+the analytic path uses the one-sided derivative on the side the formulas
+pick; finite differences average both sides.
+
+``SensitivityResult.ranking`` orders inputs by normalized sensitivity
+(elasticity, ``dy/dx * x / y``: the % change of an output per % change of
+an input), averaged over cases.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .case_batch import CURRENT_FIELDS, NUMERIC_FIELDS, PROFILE_FIELD, CaseBatch
+from .drag_tables import DragTable
+from .physics_engine import PhysicsEngine
+
+# Float outputs of one step; the two flags have no useful derivative.
+SENSITIVITY_OUTPUTS = (
+    "drag_force_n",
+    "buoyancy_force_n",
+    "effective_velocity_ms",
+    "torque_required_nm",
+    "torque_margin_nm",
+    "gm_m",
+)
+
+# Relative central-difference step, near cbrt(machine epsilon).
+DEFAULT_REL_STEP = 1e-5
+# Cases per finite-difference call (each case adds 2 * 15 perturbed rows).
+DEFAULT_CHUNK_SIZE = 2048
+
+
+@dataclass
+class SensitivityResult:
+    """Outputs and Jacobians for a batch of cases.
+
+    ``jacobian[i, o, p]`` is d ``outputs[o]`` / d ``fields[p]`` for case ``i``.
+    """
+
+    fields: tuple[str, ...]
+    outputs: tuple[str, ...]
+    inputs: np.ndarray  # (cases, fields)
+    values: np.ndarray  # (cases, outputs)
+    jacobian: np.ndarray  # (cases, outputs, fields)
+    method: str
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def normalized(self) -> np.ndarray:
+        """Elasticities ``dy/dx * x / y``; NaN where the output is zero."""
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = self.jacobian * self.inputs[:, None, :] / self.values[:, :, None]
+        out[np.broadcast_to(self.values[:, :, None] == 0.0, out.shape)] = np.nan
+        return out
+
+    def ranking(self, output: str, top: int | None = None) -> list[tuple[str, float]]:
+        """Inputs ordered by mean absolute elasticity of ``output`` over all cases.
+
+        Cases where the output is zero are skipped; inputs with no effect
+        score 0.0.
+        """
+
+        if output not in self.outputs:
+            raise ValueError(f"Unknown output: {output}")
+        elasticity = np.abs(self.normalized()[:, self.outputs.index(output), :])
+        with np.errstate(invalid="ignore"):
+            counts = np.count_nonzero(~np.isnan(elasticity), axis=0)
+            scores = np.where(counts > 0, np.nansum(elasticity, axis=0) / np.maximum(counts, 1), 0.0)
+        order = np.argsort(-scores, kind="stable")
+        ranked = [(self.fields[p], float(scores[p])) for p in order]
+        return ranked[:top] if top is not None else ranked
+
+    def rankings(self, top: int | None = None) -> dict[str, list[tuple[str, float]]]:
+        """``ranking`` for every output."""
+
+        return {output: self.ranking(output, top) for output in self.outputs}
+
+    def case_dict(self, index: int) -> dict:
+        """One case's outputs and non-zero partial derivatives, JSON-friendly."""
+
+        return {
+            output: {
+                "value": float(self.values[index, o]),
+                "jacobian": {
+                    field: float(self.jacobian[index, o, p])
+                    for p, field in enumerate(self.fields)
+                    if self.jacobian[index, o, p] != 0.0
+                },
+            }
+            for o, output in enumerate(self.outputs)
+        }
+
+
+def jacobian(
+    cases: CaseBatch,
+    engine: PhysicsEngine | None = None,
+    *,
+    method: str = "auto",
+    drag_table: DragTable | None = None,
+    rel_step: float = DEFAULT_REL_STEP,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SensitivityResult:
+    """Jacobians of ``SENSITIVITY_OUTPUTS`` w.r.t. ``NUMERIC_FIELDS`` for every case.
+
+    ``method="auto"`` is analytic unless a ``drag_table`` is given.
+    """
+
+    if method not in {"auto", "analytic", "fd"}:
+        raise ValueError("method must be 'auto', 'analytic' or 'fd'.")
+    engine = engine if engine is not None else PhysicsEngine()
+    if method == "auto":
+        method = "fd" if drag_table is not None else "analytic"
+    if method == "analytic":
+        if drag_table is not None:
+            raise ValueError("Analytic derivatives need the fixed Cd; use method='fd' with a drag table.")
+        return analytic_jacobian(cases, engine)
+    return finite_difference_jacobian(cases, engine, drag_table=drag_table, rel_step=rel_step, chunk_size=chunk_size)
+
+
+def _outputs(cases: CaseBatch, engine: PhysicsEngine, drag_table: DragTable | None = None) -> np.ndarray:
+    """Noise-free outputs as a ``(cases, outputs)`` array."""
+
+    batch = cases.evaluate(engine, drag_table=drag_table)
+    return np.column_stack([getattr(batch, name) for name in SENSITIVITY_OUTPUTS])
+
+
+def _inputs(cases: CaseBatch) -> np.ndarray:
+    return np.column_stack([cases[name] for name in NUMERIC_FIELDS])
+
+
+def analytic_jacobian(cases: CaseBatch, engine: PhysicsEngine) -> SensitivityResult:
+    """Closed-form Jacobians of ``PhysicsEngine.step`` with the fixed Cd."""
+
+    col = cases.columns
+    n = len(cases)
+    length = col["hull_geometry.length_m"]
+    diameter = col["hull_geometry.max_diameter_m"]
+    fin_offset = col["hull_geometry.fin_offset_x"]
+    velocity = col["physics_state.velocity_ms"]
+    fin_angle = col["steering_output.target_fin_angle_deg"]
+    density = col["environment.fluid_density_kgm3"]
+    current = cases.current_vectors()
+    area, volume = cases.hull_properties()
+    cd = cases.drag_coefficients()
+
+    # Effective velocity max(0, v + |c|): slope 1 in v and c/|c| in c while positive.
+    current_mag = np.sqrt((current * current).sum(axis=1))
+    moving = (velocity + current_mag) > 0.0
+    v_eff = np.where(moving, velocity + current_mag, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        d_current = np.where((current_mag > 0.0)[:, None], current / current_mag[:, None], 0.0)
+    d_current *= moving[:, None]
+
+    drag = 0.5 * density * v_eff * v_eff * cd * area
+    angle_ratio = np.minimum(np.abs(fin_angle) / 35.0, 1.0)
+    lever = np.abs(fin_offset) * angle_ratio
+
+    p = {name: i for i, name in enumerate(NUMERIC_FIELDS)}
+    o = {name: i for i, name in enumerate(SENSITIVITY_OUTPUTS)}
+    jac = np.zeros((n, len(SENSITIVITY_OUTPUTS), len(NUMERIC_FIELDS)))
+
+    # effective_velocity_ms
+    jac[:, o["effective_velocity_ms"], p["physics_state.velocity_ms"]] = moving
+    for i, name in enumerate(CURRENT_FIELDS):
+        jac[:, o["effective_velocity_ms"], p[name]] = d_current[:, i]
+
+    # drag = 0.5 rho v^2 Cd A, A = pi d^2 / 4
+    d_drag_d_veff = density * v_eff * cd * area
+    d_drag = jac[:, o["drag_force_n"], :]
+    d_drag[:, p["physics_state.velocity_ms"]] = d_drag_d_veff * moving
+    for i, name in enumerate(CURRENT_FIELDS):
+        d_drag[:, p[name]] = d_drag_d_veff * d_current[:, i]
+    d_drag[:, p["environment.fluid_density_kgm3"]] = 0.5 * v_eff * v_eff * cd * area
+    d_drag[:, p["hull_geometry.max_diameter_m"]] = 0.5 * density * v_eff * v_eff * cd * (np.pi * diameter / 2.0)
+
+    # buoyancy = rho g V, V = pi L d^2 / 6
+    d_buoy = jac[:, o["buoyancy_force_n"], :]
+    d_buoy[:, p["environment.fluid_density_kgm3"]] = engine.gravity * volume
+    d_buoy[:, p["hull_geometry.length_m"]] = density * engine.gravity * np.pi * diameter * diameter / 6.0
+    d_buoy[:, p["hull_geometry.max_diameter_m"]] = density * engine.gravity * np.pi * length * diameter / 3.0
+
+    # torque = drag * |offset| * min(|angle| / 35, 1)
+    d_torque = jac[:, o["torque_required_nm"], :]
+    d_torque[:] = d_drag * lever[:, None]
+    d_torque[:, p["hull_geometry.fin_offset_x"]] = drag * np.sign(fin_offset) * angle_ratio
+    d_torque[:, p["steering_output.target_fin_angle_deg"]] = np.where(
+        np.abs(fin_angle) < 35.0, drag * np.abs(fin_offset) * np.sign(fin_angle) / 35.0, 0.0
+    )
+
+    # margin = motor torque - torque
+    jac[:, o["torque_margin_nm"], :] = -d_torque
+    jac[:, o["torque_margin_nm"], p["steering_output.motor_torque_nm"]] = 1.0
+
+    # gm = 0.2 d - 0.01 L
+    jac[:, o["gm_m"], p["hull_geometry.max_diameter_m"]] = 0.2
+    jac[:, o["gm_m"], p["hull_geometry.length_m"]] = -0.01
+
+    return SensitivityResult(
+        NUMERIC_FIELDS, SENSITIVITY_OUTPUTS, _inputs(cases), _outputs(cases, engine), jac, "analytic"
+    )
+
+
+def finite_difference_jacobian(
+    cases: CaseBatch,
+    engine: PhysicsEngine,
+    *,
+    drag_table: DragTable | None = None,
+    rel_step: float = DEFAULT_REL_STEP,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SensitivityResult:
+    """Central-difference Jacobians, one batched evaluation per chunk of cases.
+
+    Field ``x`` is moved by ``+/- rel_step * max(|x|, 1)``.
+    """
+
+    if rel_step <= 0.0:
+        raise ValueError("rel_step must be > 0.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0.")
+    n = len(cases)
+    jac = np.empty((n, len(SENSITIVITY_OUTPUTS), len(NUMERIC_FIELDS)))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        chunk = CaseBatch({name: column[start:stop] for name, column in cases.columns.items()})
+        jac[start:stop] = _fd_chunk(chunk, engine, drag_table, rel_step)
+    return SensitivityResult(
+        NUMERIC_FIELDS, SENSITIVITY_OUTPUTS, _inputs(cases), _outputs(cases, engine, drag_table), jac, "fd"
+    )
+
+
+def _fd_chunk(cases: CaseBatch, engine: PhysicsEngine, drag_table: DragTable | None, rel_step: float) -> np.ndarray:
+    """Jacobians of one chunk from a single ``(2 * fields * cases)``-row evaluation."""
+
+    n, n_fields = len(cases), len(NUMERIC_FIELDS)
+    # Row block 2p holds every case with field p moved up, block 2p + 1 moved down.
+    reps = 2 * n_fields
+    columns = {name: np.tile(cases[name], reps) for name in NUMERIC_FIELDS}
+    columns[PROFILE_FIELD] = np.tile(cases[PROFILE_FIELD], reps)
+    denominators = np.empty((n, n_fields))
+    for p, name in enumerate(NUMERIC_FIELDS):
+        x = cases[name]
+        h = rel_step * np.maximum(np.abs(x), 1.0)
+        up, down = x + h, x - h
+        column = columns[name]
+        column[2 * p * n : (2 * p + 1) * n] = up
+        column[(2 * p + 1) * n : (2 * p + 2) * n] = down
+        # The step actually taken after rounding.
+        denominators[:, p] = up - down
+
+    out = _outputs(CaseBatch(columns), engine, drag_table).reshape(n_fields, 2, n, len(SENSITIVITY_OUTPUTS))
+    diff = out[:, 0] - out[:, 1]  # (fields, cases, outputs)
+    return diff.transpose(1, 2, 0) / denominators[:, None, :]
@@ -0,0 +1,470 @@
+"""Long-running local simulation service (JSON over HTTP on localhost).
+
+Other tools POST case payloads here instead of starting ``run_phase1.py``
+as a subprocess for every call, so Python start-up and the NumPy/Open3D
+imports are paid once. An asyncio front-end queues requests and groups
+them into micro-batches. Batches run in a process pool whose workers
+each keep a warm ``SubmarineApp``; single-step requests in a batch are
+evaluated together through ``CaseBatch``.
+
+Endpoints:
+
+- ``POST /simulate``: body is a case JSON, or ``{"case": {...}, "mode",
+  "steps", "seed", "integrate", "dt_s", "telemetry"}``.
+- ``GET /metrics``: queue depth, counters and latency histograms.
+- ``GET /health``: liveness check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Sequence
+
+import numpy as np
+
+from .alerts import AlertEngine, summarize
+from .app import SubmarineApp
+from .case_batch import CaseBatch
+from .drag_tables import load_drag_table
+from .math_ingestor import MathIngestor
+
+LATENCY_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+@dataclass
+class ServiceConfig:
+    """Listening address, pool size and backpressure limits."""
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    workers: int = 2
+    # Requests waiting beyond this are rejected with 503 instead of queued.
+    max_queue: int = 1024
+    max_batch: int = 256
+    batch_window_s: float = 0.002
+    max_steps: int = 100_000
+    max_body_bytes: int = 1_000_000
+    drag_table: str | None = None
+
+
+class ServiceBusy(Exception):
+    """Raised when the request queue is full."""
+
+
+class Histogram:
+    """Fixed-bucket histogram reported with cumulative ``le`` counts."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict:
+        cumulative = np.cumsum(self.counts).tolist()
+        buckets = {f"{bound:g}": n for bound, n in zip(self.bounds, cumulative)}
+        buckets["+Inf"] = cumulative[-1]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class ServiceMetrics:
+    """Counters and histograms exposed at ``/metrics``."""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.requests_total = 0
+        self.rejected_total = 0
+        self.failed_total = 0
+        self.batches_total = 0
+        self.latency_ms = Histogram(LATENCY_BOUNDS_MS)
+        self.queue_wait_ms = Histogram(LATENCY_BOUNDS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BOUNDS)
+
+    def as_dict(self) -> dict:
+        return {
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests_total": self.requests_total,
+            "rejected_total": self.rejected_total,
+            "failed_total": self.failed_total,
+            "batches_total": self.batches_total,
+            "latency_ms": self.latency_ms.as_dict(),
+            "queue_wait_ms": self.queue_wait_ms.as_dict(),
+            "batch_size": self.batch_size.as_dict(),
+        }
+
+
+def parse_request(body: object, max_steps: int) -> dict:
+    """Normalize a ``/simulate`` body; raises ``ValueError`` when malformed."""
+
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object.")
+    request = dict(body) if "case" in body else {"case": body}
+    if not isinstance(request["case"], dict):
+        raise ValueError("'case' must be a JSON object.")
+
+    mode = request.get("mode", "base")
+    if mode not in {"base", "real"}:
+        raise ValueError("mode must be 'base' or 'real'.")
+    # bool is an int subclass, so JSON true/false must be rejected explicitly.
+    steps = request.get("steps", 1)
+    if not isinstance(steps, int) or isinstance(steps, bool) or not 1 <= steps <= max_steps:
+        raise ValueError(f"steps must be an integer between 1 and {max_steps}.")
+    seed = request.get("seed")
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+        raise ValueError("seed must be an integer.")
+    dt_s = request.get("dt_s")
+    if dt_s is not None and not (isinstance(dt_s, (int, float)) and not isinstance(dt_s, bool) and dt_s > 0):
+        raise ValueError("dt_s must be > 0.")
+
+    return {
+        "case": request["case"],
+        "mode": mode,
+        "steps": steps,
+        "seed": seed,
+        "integrate": bool(request.get("integrate", False)),
+        "dt_s": dt_s,
+        "telemetry": bool(request.get("telemetry", False)),
+    }
+
+
+# --- Worker process side -------------------------------------------------
+
+_APP: SubmarineApp | None = None
+
+
+def _init_worker(drag_table: str | None) -> None:
+    """Process-pool initializer: build one warm app per worker."""
+
+    global _APP
+    _APP = SubmarineApp(drag_table=load_drag_table(drag_table) if drag_table else None)
+
+
+def _ping() -> bool:
+    return _APP is not None
+
+
+def _process_batch(requests: list[dict]) -> list[dict]:
+    """Worker entry point: answer a micro-batch of requests, in order."""
+
+    results: list[dict | None] = [None] * len(requests)
+    batchable = []
+    for i, request in enumerate(requests):
+        # Seeded, multi-step and integrated runs use the app's own loop so
+        # they match run_phase1.py exactly.
+        if request["steps"] == 1 and not request["integrate"] and request["seed"] is None:
+            batchable.append(i)
+        else:
+            results[i] = _guarded(_run_on_app, request)
+    if batchable:
+        for i, result in zip(batchable, _run_batched([requests[i] for i in batchable])):
+            results[i] = result
+    return results
+
+
+def _guarded(func, request: dict) -> dict:
+    try:
+        return func(request)
+    except (KeyError, TypeError, ValueError) as exc:
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def _run_on_app(request: dict) -> dict:
+    """Run one request through the warm ``SubmarineApp``."""
+
+    app = _APP
+    app.telemetry.clear()
+    app.load_case_data(request["case"])
+    app.ui_controller.set_environment_mode(request["mode"])
+    app.physics_engine.seed(request["seed"])
+
+    if request["integrate"]:
+        result = app.run_trajectory(steps=request["steps"], dt_s=request["dt_s"])
+        last = result.row(-1)
+        events = app.alert_engine.evaluate(result.snapshots.as_dict())
+        rows = list(result.iter_rows()) if request["telemetry"] else None
+    else:
+        view = app.run(steps=request["steps"])
+        last = view[-1]
+        events = app.evaluate_alerts()
+        rows = list(view) if request["telemetry"] else None
+
+    response = {"mode": request["mode"], "steps": request["steps"], "last_snapshot": last, "alerts": summarize(events)}
+    if rows is not None:
+        response["telemetry"] = rows
+    return response
+
+
+def _run_batched(requests: list[dict]) -> list[dict]:
+    """Evaluate single-step requests together with ``CaseBatch``."""
+
+    ingestor = MathIngestor(drag_table=_APP.ingestor.drag_table)
+    results: list[dict | None] = [None] * len(requests)
+    cases, rows = [], []
+    for i, request in enumerate(requests):
+        try:
+            case = ingestor.load_dict(request["case"])
+            ingestor.check_constraints(case)
+            # A profile missing from the drag table fails this request, not the whole batch.
+            ingestor.get_drag_coefficient()
+        except (KeyError, TypeError, ValueError) as exc:
+            results[i] = {"error": f"{type(exc).__name__}: {exc}"}
+            continue
+        cases.append(case)
+        rows.append(i)
+    if not cases:
+        return results
+
+    batch = CaseBatch.from_cases(cases)
+    # Base-mode rows get zero sigma so one noisy evaluation covers both modes.
+    real = np.array([requests[i]["mode"] == "real" for i in rows])
+    batch.set_column("environment.sensor_noise_sigma", np.where(real, batch.columns["environment.sensor_noise_sigma"], 0.0))
+    snaps = batch.evaluate(
+        _APP.physics_engine, noise_enabled=True, rng=np.random.default_rng(), drag_table=_APP.ingestor.drag_table
+    )
+
+    # A one-step run has an alert episode [0, 1) wherever a rule triggers,
+    # so every rule is checked once for the whole batch.
+    rules = [rule for rule in AlertEngine().rules if rule.min_duration == 1]
+    triggered = [rule.trigger_mask(getattr(snaps, rule.field)) for rule in rules]
+    for k, i in enumerate(rows):
+        row = vars(snaps.snapshot(k))
+        row["environment_mode"] = requests[i]["mode"]
+        alerts = [
+            {"rule": rule.name, "message": rule.message, "start_step": 0, "end_step": 1}
+            for rule, mask in zip(rules, triggered)
+            if mask[k]
+        ]
+        results[i] = {"mode": requests[i]["mode"], "steps": 1, "last_snapshot": row, "alerts": alerts}
+        if requests[i]["telemetry"]:
+            results[i]["telemetry"] = [row]
+    return results
+
+
+# --- asyncio front-end ---------------------------------------------------
+
+
+class SimulationService:
+    """Asyncio HTTP front-end that micro-batches requests onto a process pool."""
+
+    def __init__(self, config: ServiceConfig | None = None) -> None:
+        self.config = config or ServiceConfig()
+        if self.config.workers <= 0:
+            raise ValueError("workers must be > 0.")
+        self.metrics = ServiceMetrics()
+        self.in_flight = 0
+        self._queue: asyncio.Queue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Actual ``(host, port)``; useful when ``port=0`` picked a free port."""
+
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start workers (and wait until they are warm), then start listening."""
+
+        loop = asyncio.get_running_loop()
+        cfg = self.config
+        self._pool = ProcessPoolExecutor(max_workers=cfg.workers, initializer=_init_worker, initargs=(cfg.drag_table,))
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ping) for _ in range(cfg.workers)))
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(cfg.workers)
+        self._spawn(self._batcher())
+        self._server = await asyncio.start_server(self._handle_connection, cfg.host, cfg.port)
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, cancel the batcher and shut the pool down."""
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._pool is not None:
+            # shutdown() waits for the workers; keep that off the event loop.
+            await asyncio.to_thread(self._pool.shutdown, cancel_futures=True)
+
+    async def submit(self, request: dict) -> dict:
+        """Queue one normalized request and wait for its result."""
+
+        if self._queue.qsize() >= self.config.max_queue:
+            self.metrics.rejected_total += 1
+            raise ServiceBusy("Request queue is full.")
+        self.metrics.requests_total += 1
+        enqueued = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future, enqueued))
+        try:
+            return await future
+        finally:
+            self.metrics.latency_ms.observe((time.perf_counter() - enqueued) * 1000.0)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _batcher(self) -> None:
+        """Group queued requests into batches, one batch per free worker."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            # Waiting for a free worker first lets the queue fill up under load.
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.config.batch_window_s
+            while len(batch) < self.config.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self._spawn(self._dispatch(batch))
+
+    async def _dispatch(self, batch: list[tuple]) -> None:
+        """Send one batch to the pool and resolve the waiting requests."""
+
+        started = time.perf_counter()
+        for _, _, enqueued in batch:
+            self.metrics.queue_wait_ms.observe((started - enqueued) * 1000.0)
+        self.metrics.batches_total += 1
+        self.metrics.batch_size.observe(len(batch))
+        self.in_flight += 1
+        try:
+            requests = [request for request, _, _ in batch]
+            results = await asyncio.get_running_loop().run_in_executor(self._pool, _process_batch, requests)
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection (keep-alive aware)."""
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    raw_length = headers.get("content-length", "0")
+                    # Plain decimal digits only: no sign, spaces or underscores.
+                    if not (raw_length.isascii() and raw_length.isdigit()):
+                        raise ValueError(raw_length)
+                    length = int(raw_length)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request."}, False)
+                    break
+                if length > self.config.max_body_bytes:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body too large."}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                status, payload = await self._route(method, target.split("?", 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict]:
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok", "workers": self.config.workers}
+        if path == "/metrics":
+            metrics = self.metrics.as_dict()
+            metrics.update(queue_depth=self.queue_depth, max_queue=self.config.max_queue, in_flight_batches=self.in_flight)
+            return HTTPStatus.OK, metrics
+        if path != "/simulate":
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST /simulate."}
+
+        try:
+            request = parse_request(json.loads(body), self.config.max_steps)
+        except ValueError as exc:
+            self.metrics.failed_total += 1
+            return HTTPStatus.BAD_REQUEST, {"error": f"{type(exc).__name__}: {exc}"}
+        try:
+            result = await self.submit(request)
+        except ServiceBusy as exc:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)}
+        except Exception as exc:  # Broken pool or other worker failure.
+            self.metrics.failed_total += 1
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(exc).__name__}: {exc}"}
+        if "error" in result:
+            self.metrics.failed_total += 1
+            return HTTPStatus.BAD_REQUEST, result
+        return HTTPStatus.OK, result
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
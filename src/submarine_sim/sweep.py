@@ -0,0 +1,249 @@
+"""Parameter sweeps over one base case using batched physics.
+
+A sweep takes a base case plus values for any number of case fields,
+expands them into a Cartesian or Latin-hypercube design, and evaluates
+the design in chunks. Each chunk is one ``CaseBatch.evaluate`` call, and
+chunks can be spread across a ``ProcessPoolExecutor``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping, Sequence
+
+import numpy as np
+
+from .case_batch import NUMERIC_FIELDS, PROFILE_FIELD, CaseBatch, flatten_case, unflatten_case
+from .math_ingestor import MathIngestor
+from .models import SimulationInput
+from .physics_engine import PhysicsEngine
+from .schema_validator import ValidationResult, default_validator
+from .telemetry_store import SNAPSHOT_FIELDS
+
+
+@dataclass
+class SweepAxis:
+    """Values for one swept field.
+
+    ``levels`` are discrete values. ``bounds`` is a continuous
+    ``(low, high)`` range: Cartesian designs sample it with ``num``
+    evenly spaced points, Latin-hypercube designs sample it uniformly.
+    """
+
+    field: str
+    levels: np.ndarray | None = None
+    bounds: tuple[float, float] | None = None
+    num: int = 0
+
+    @classmethod
+    def parse(cls, field: str, spec: Sequence | Mapping) -> SweepAxis:
+        """Build an axis from a list of values or a ``{start, stop, num}`` range."""
+
+        if field not in NUMERIC_FIELDS and field != PROFILE_FIELD:
+            raise ValueError(f"Unknown sweep field: {field}")
+        if isinstance(spec, Mapping):
+            return cls(field, bounds=(float(spec["start"]), float(spec["stop"])), num=int(spec.get("num", 0)))
+        dtype = object if field == PROFILE_FIELD else float
+        levels = np.asarray(list(spec), dtype=dtype)
+        if levels.size == 0:
+            raise ValueError(f"Sweep axis {field} has no values.")
+        for choice in default_validator().choices:
+            # Unknown profiles have no drag coefficient, so reject them before any chunk runs.
+            if choice.field == field and choice.violations(levels).any():
+                raise ValueError(f"Sweep axis {field}: {choice.message}")
+        return cls(field, levels=levels)
+
+    def grid(self) -> np.ndarray:
+        """Return the values used by a Cartesian design."""
+
+        if self.levels is not None:
+            return self.levels
+        if self.num <= 0:
+            raise ValueError(f"Sweep axis {self.field} needs 'num' for a Cartesian design.")
+        return np.linspace(self.bounds[0], self.bounds[1], self.num)
+
+
+class ParameterSweep:
+    """Expands a design over a base case and evaluates it in batches."""
+
+    def __init__(
+        self,
+        base_case: str | Path | SimulationInput,
+        axes: Mapping[str, Sequence | Mapping],
+        *,
+        design: str = "cartesian",
+        samples: int | None = None,
+        seed: int | None = None,
+        noise_enabled: bool = False,
+    ) -> None:
+        if design not in {"cartesian", "lhs"}:
+            raise ValueError("design must be 'cartesian' or 'lhs'.")
+        if design == "lhs" and not samples:
+            raise ValueError("Latin-hypercube designs need a sample count.")
+        if not axes:
+            raise ValueError("At least one sweep axis is required.")
+
+        if isinstance(base_case, SimulationInput):
+            self.base_case = base_case
+        else:
+            ingestor = MathIngestor()
+            self.base_case = ingestor.load_json(base_case)
+            ingestor.validate_constraints()
+
+        self.axes = [SweepAxis.parse(field, spec) for field, spec in axes.items()]
+        self.design = design
+        self.samples = samples
+        self.seed = seed
+        self.noise_enabled = noise_enabled
+        self._lhs_design: dict[str, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        if self.design == "lhs":
+            return int(self.samples)
+        return int(np.prod([len(axis.grid()) for axis in self.axes]))
+
+    def design_chunk(self, start: int, stop: int) -> dict[str, np.ndarray]:
+        """Return swept field values for design rows ``start:stop``."""
+
+        if self.design == "lhs":
+            design = self._latin_hypercube()
+            return {field: values[start:stop] for field, values in design.items()}
+
+        # Cartesian rows are decoded from flat indices so the full grid is never built.
+        grids = [axis.grid() for axis in self.axes]
+        index = np.unravel_index(np.arange(start, stop), [len(g) for g in grids])
+        return {axis.field: grid[idx] for axis, grid, idx in zip(self.axes, grids, index)}
+
+    def _latin_hypercube(self) -> dict[str, np.ndarray]:
+        """Build (once) an LHS design: one sample per stratum on every axis."""
+
+        if self._lhs_design is None:
+            rng = np.random.default_rng(self.seed)
+            n = int(self.samples)
+            design: dict[str, np.ndarray] = {}
+            for axis in self.axes:
+                # Random point inside each of n equal strata, then shuffle strata.
+                unit = (rng.permutation(n) + rng.random(n)) / n
+                if axis.levels is not None:
+                    picks = np.minimum((unit * len(axis.levels)).astype(int), len(axis.levels) - 1)
+                    design[axis.field] = axis.levels[picks]
+                else:
+                    low, high = axis.bounds
+                    design[axis.field] = low + unit * (high - low)
+            self._lhs_design = design
+        return self._lhs_design
+
+    def screen(self, chunk_size: int = 100_000) -> ValidationResult:
+        """Check every design row against the input contract without evaluating it."""
+
+        validator = default_validator()
+        total = len(self)
+        masks: list[np.ndarray] = []
+        errors: list[np.ndarray] = []
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            batch = _design_batch(flatten_case(self.base_case), self.design_chunk(start, stop))
+            result = validator.validate_batch(batch)
+            result.errors["case"] += start
+            masks.append(result.mask)
+            errors.append(result.errors)
+        return ValidationResult(np.concatenate(masks), np.concatenate(errors))
+
+    def iter_chunks(self, chunk_size: int = 10_000, workers: int | None = None) -> Iterator[dict[str, np.ndarray]]:
+        """Yield result tables chunk by chunk, in design order.
+
+        ``workers=0`` evaluates in this process; otherwise chunks are
+        spread over a ``ProcessPoolExecutor`` with ``workers`` processes.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0.")
+        total = len(self)
+        bounds = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(bounds))
+        base = flatten_case(self.base_case)
+        jobs = (
+            (base, self.design_chunk(start, stop), self.noise_enabled, seed)
+            for (start, stop), seed in zip(bounds, seeds)
+        )
+
+        if workers == 0:
+            yield from map(_evaluate_chunk, jobs)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from _ordered_map(pool, jobs, window=2 * (workers or os.cpu_count() or 1))
+
+    def run(
+        self,
+        chunk_size: int = 10_000,
+        workers: int | None = None,
+        output_path: str | Path | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Evaluate the whole design and return one results table.
+
+        When ``output_path`` is given, each chunk is appended to that CSV
+        as soon as it arrives.
+        """
+
+        chunks: list[dict[str, np.ndarray]] = []
+        writer = None
+        fh = None
+        try:
+            for chunk in self.iter_chunks(chunk_size=chunk_size, workers=workers):
+                chunks.append(chunk)
+                if output_path is not None:
+                    if writer is None:
+                        path = Path(output_path)
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        fh = path.open("w", newline="", encoding="utf-8")
+                        writer = csv.writer(fh)
+                        writer.writerow(chunk.keys())
+                    writer.writerows(zip(*(col.tolist() for col in chunk.values())))
+        finally:
+            if fh is not None:
+                fh.close()
+
+        if not chunks:
+            return {}
+        return {name: np.concatenate([c[name] for c in chunks]) for name in chunks[0]}
+
+
+def _ordered_map(pool: Executor, jobs: Iterator[tuple], window: int) -> Iterator[dict[str, np.ndarray]]:
+    """Submit jobs with a bounded number in flight and yield results in order."""
+
+    pending = []
+    for job in jobs:
+        pending.append(pool.submit(_evaluate_chunk, job))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+def _evaluate_chunk(job: tuple) -> dict[str, np.ndarray]:
+    """Worker entry point: evaluate one design chunk against the base case."""
+
+    base, design, noise_enabled, seed = job
+    batch = _design_batch(base, design)
+
+    snapshots = batch.evaluate(PhysicsEngine(), noise_enabled=noise_enabled, rng=np.random.default_rng(seed))
+    table = dict(design)
+    for name in SNAPSHOT_FIELDS:
+        table[name] = getattr(snapshots, name)
+    # Rows outside the input contract are still evaluated but flagged.
+    table["valid"] = default_validator().validate_batch(batch).mask
+    return table
+
+
+def _design_batch(base: dict, design: Mapping[str, np.ndarray]) -> CaseBatch:
+    """Expand the flat base case into a batch with the design columns applied."""
+
+    n = len(next(iter(design.values())))
+    batch = CaseBatch.repeat(unflatten_case(base), n)
+    for field, values in design.items():
+        batch.set_column(field, values)
+    return batch
@@ -0,0 +1,264 @@
+"""Pluggable destinations for telemetry rows produced one step at a time.
+
+``SubmarineApp.iter_run`` hands every row to a list of sinks as soon as
+it is produced, so long runs do not need to keep all rows in memory and
+a crash only loses rows that were not flushed yet.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import IO
+
+
+class TelemetrySink(ABC):
+    """Base class: receives rows one by one and can be checkpointed."""
+
+    @abstractmethod
+    def write(self, row: dict) -> None:
+        """Take one telemetry row."""
+
+    def flush(self) -> None:
+        """Push buffered rows to their destination (no-op by default)."""
+
+    def close(self) -> None:
+        """Release resources; the sink should not be written to afterwards."""
+
+        self.flush()
+
+    @abstractmethod
+    def checkpoint_state(self) -> dict:
+        """Flush and return what ``restore_state`` needs to continue this sink.
+
+        Used by ``checkpoint.save_checkpoint``.
+        """
+
+    @abstractmethod
+    def restore_state(self, state: dict) -> None:
+        """Continue from a ``checkpoint_state`` result."""
+
+    def __enter__(self) -> TelemetrySink:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ListSink(TelemetrySink):
+    """Keeps every row in a list (the historical ``telemetry_rows`` behavior)."""
+
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+
+    def write(self, row: dict) -> None:
+        self.rows.append(row)
+
+    def checkpoint_state(self) -> dict:
+        return {"rows": list(self.rows)}
+
+    def restore_state(self, state: dict) -> None:
+        self.rows = list(state["rows"])
+
+
+class RingBufferSink(TelemetrySink):
+    """Keeps only the newest ``maxlen`` rows, e.g. for UI plots and labels."""
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        if maxlen <= 0:
+            raise ValueError("maxlen must be > 0.")
+        self._rows: deque[dict] = deque(maxlen=maxlen)
+        self.total_rows = 0
+
+    def write(self, row: dict) -> None:
+        self._rows.append(row)
+        self.total_rows += 1
+
+    def checkpoint_state(self) -> dict:
+        return {"rows": list(self._rows), "total_rows": self.total_rows}
+
+    def restore_state(self, state: dict) -> None:
+        self._rows.clear()
+        self._rows.extend(state["rows"])
+        self.total_rows = state["total_rows"]
+
+    def rows(self) -> list[dict]:
+        """Return buffered rows, oldest first."""
+
+        return list(self._rows)
+
+    @property
+    def latest(self) -> dict | None:
+        """Return the most recent row, if any."""
+
+        return self._rows[-1] if self._rows else None
+
+
+class CsvSink(TelemetrySink):
+    """Writes rows incrementally in the ``save_report`` CSV layout.
+
+    The header comes from the first row's keys, exactly like
+    ``csv.DictWriter`` in ``save_report``. The file is flushed every
+    ``flush_every`` rows. When ``max_bytes`` is set, the file is rotated
+    at the first flush after it grows past that size: ``report.csv`` becomes
+    ``report.1.csv`` (older files shift up to ``backup_count``) and a new
+    ``report.csv`` starts with its own header, so every file is a
+    complete report on its own.
+    """
+
+    def __init__(
+        self,
+        output_path: str | Path,
+        *,
+        flush_every: int = 1000,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+    ) -> None:
+        if flush_every <= 0:
+            raise ValueError("flush_every must be > 0.")
+        self.path = Path(output_path)
+        self.flush_every = flush_every
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rows_written = 0
+        self.rotations = 0
+        self._fieldnames: list[str] | None = None
+        self._fh: IO[str] | None = None
+        self._writer: csv.DictWriter | None = None
+        self._pending = 0
+        self._closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, row: dict) -> None:
+        if self._closed:
+            raise RuntimeError("CsvSink is closed.")
+        if self._writer is None:
+            self._fieldnames = list(row.keys())
+            self._open()
+
+        self._writer.writerow(row)
+        self.rows_written += 1
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+            # Size is checked at flush points so writes stay cheap.
+            if self.max_bytes is not None and self._fh.tell() >= self.max_bytes:
+                self._rotate()
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if self._fh is None:
+            # No rows at all: match save_report's empty-file behavior.
+            self.path.write_text("", encoding="utf-8")
+        else:
+            self._fh.close()
+            self._fh = None
+        self._closed = True
+
+    def checkpoint_state(self) -> dict:
+        """Flush and record how far the current file is written.
+
+        The file's inode is kept to find it again after later rotations;
+        with ``max_bytes`` set, a CRC of the written bytes checks it.
+        """
+
+        self.flush()
+        state = {
+            "offset": None,
+            "fieldnames": self._fieldnames,
+            "rows_written": self.rows_written,
+            "rotations": self.rotations,
+        }
+        if self._fh is not None:
+            state["offset"] = self._fh.tell()
+            state["inode"] = os.fstat(self._fh.fileno()).st_ino
+            if self.max_bytes is not None:
+                state["crc32"] = zlib.crc32(self.path.read_bytes()[: state["offset"]])
+        return state
+
+    def restore_state(self, state: dict) -> None:
+        """Reopen the file and cut off rows written after the checkpoint.
+
+        Rotations made after the checkpoint are rolled back first: newer
+        files are removed and the checkpointed file and its backups move
+        back to their old names. Raises ``ValueError`` when the files on
+        disk no longer hold the checkpointed rows.
+        """
+
+        if self._fh is not None:
+            self._fh.close()
+            self._fh, self._writer = None, None
+        if state["offset"] is not None:
+            self._roll_back(self._rotations_since(state))
+            data = self.path.read_bytes()[: state["offset"]] if "crc32" in state else None
+            size = self.path.stat().st_size
+            if size < state["offset"] or (data is not None and zlib.crc32(data) != state["crc32"]):
+                raise ValueError(f"{self.path} no longer matches the checkpoint.")
+        self.rows_written = state["rows_written"]
+        self.rotations = state["rotations"]
+        self._fieldnames = state["fieldnames"]
+        self._pending = 0
+        self._closed = False
+        if state["offset"] is None:
+            return
+        self._fh = self.path.open("r+", newline="", encoding="utf-8")
+        self._fh.seek(state["offset"])
+        self._fh.truncate()
+        self._writer = csv.DictWriter(self._fh, fieldnames=self._fieldnames)
+
+    def _rotations_since(self, state: dict) -> int:
+        """How many times the checkpointed file has been rotated since (0 = still current)."""
+
+        candidates = [self.path] + [self._backup_path(i) for i in range(1, self.backup_count + 1)]
+        for count, path in enumerate(candidates):
+            if path.exists() and path.stat().st_ino == state["inode"]:
+                return count
+        raise ValueError(f"The file checkpointed as {self.path} is gone (rotated out or replaced).")
+
+    def _roll_back(self, count: int) -> None:
+        """Undo the last ``count`` rotations (see ``_rotate``)."""
+
+        if count == 0:
+            return
+        self.path.unlink(missing_ok=True)
+        for index in range(1, count):
+            self._backup_path(index).unlink(missing_ok=True)
+        self._backup_path(count).replace(self.path)
+        for index in range(count + 1, self.backup_count + 1):
+            older = self._backup_path(index)
+            if older.exists():
+                older.replace(self._backup_path(index - count))
+
+    def _open(self) -> None:
+        """Start a fresh file and write the header."""
+
+        self._fh = self.path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._fh, fieldnames=self._fieldnames)
+        self._writer.writeheader()
+
+    def _rotate(self) -> None:
+        """Shift ``report.N.csv`` files up by one and reopen ``report.csv``."""
+
+        self._fh.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                older = self._backup_path(index)
+                if older.exists():
+                    older.replace(self._backup_path(index + 1))
+            self.path.replace(self._backup_path(1))
+        self.rotations += 1
+        self._pending = 0
+        self._open()
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{index}{self.path.suffix}")
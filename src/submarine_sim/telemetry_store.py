@@ -0,0 +1,268 @@
+"""Columnar in-memory storage for simulation telemetry.
+
+Each ``PhysicsSnapshot`` field lives in its own preallocated, typed NumPy
+array that grows by doubling. ``environment_mode`` is stored as small
+integer codes plus a category list. Reporting code reads the columns as
+zero-copy views instead of walking a list of per-step dictionaries.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from .physics_engine import PhysicsBatch, PhysicsSnapshot
+
+# Column order written by ``SubmarineApp.save_report`` (see docs/phase1/output-spec.md).
+TELEMETRY_FIELDS = (
+    "drag_force_n",
+    "buoyancy_force_n",
+    "effective_velocity_ms",
+    "torque_required_nm",
+    "torque_margin_nm",
+    "cavitation_risk",
+    "gm_m",
+    "stability_warning",
+    "environment_mode",
+)
+
+SNAPSHOT_FIELDS = TELEMETRY_FIELDS[:-1]
+
+FIELD_DTYPES = {
+    "drag_force_n": np.float64,
+    "buoyancy_force_n": np.float64,
+    "effective_velocity_ms": np.float64,
+    "torque_required_nm": np.float64,
+    "torque_margin_nm": np.float64,
+    "cavitation_risk": np.bool_,
+    "gm_m": np.float64,
+    "stability_warning": np.bool_,
+}
+
+
+class TelemetryStore:
+    """Growable struct-of-arrays buffer with one row per simulation step."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._data = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in FIELD_DTYPES.items()}
+        self._mode_codes = np.empty(self._capacity, dtype=np.uint8)
+        self.categories: list[str] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def clear(self) -> None:
+        """Drop all rows but keep the allocated buffers."""
+
+        self._size = 0
+
+    def __getstate__(self) -> dict:
+        """Pickle only the filled rows, not the spare capacity."""
+
+        return {
+            "size": self._size,
+            "data": {name: column[: self._size].copy() for name, column in self._data.items()},
+            "mode_codes": self._mode_codes[: self._size].copy(),
+            "categories": list(self.categories),
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        size = state["size"]
+        self._capacity = max(size, 1)
+        self._size = size
+        self._data = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in FIELD_DTYPES.items()}
+        for name, column in state["data"].items():
+            self._data[name][:size] = column
+        self._mode_codes = np.empty(self._capacity, dtype=np.uint8)
+        self._mode_codes[:size] = state["mode_codes"]
+        self.categories = list(state["categories"])
+
+    def _mode_code(self, mode: str) -> int:
+        """Return the category code for an environment mode, adding it if new."""
+
+        try:
+            return self.categories.index(mode)
+        except ValueError:
+            self.categories.append(mode)
+            return len(self.categories) - 1
+
+    def _reserve(self, extra: int) -> None:
+        """Grow every column (by doubling) so ``extra`` more rows fit."""
+
+        needed = self._size + extra
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._data.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._data[name] = grown
+        codes = np.empty(capacity, dtype=self._mode_codes.dtype)
+        codes[: self._size] = self._mode_codes[: self._size]
+        self._mode_codes = codes
+        self._capacity = capacity
+
+    def append(self, snapshot: PhysicsSnapshot, environment_mode: str) -> int:
+        """Store one snapshot and return its row index."""
+
+        if self._size == self._capacity:
+            self._reserve(1)
+        i = self._size
+        data = self._data
+        data["drag_force_n"][i] = snapshot.drag_force_n
+        data["buoyancy_force_n"][i] = snapshot.buoyancy_force_n
+        data["effective_velocity_ms"][i] = snapshot.effective_velocity_ms
+        data["torque_required_nm"][i] = snapshot.torque_required_nm
+        data["torque_margin_nm"][i] = snapshot.torque_margin_nm
+        data["cavitation_risk"][i] = snapshot.cavitation_risk
+        data["gm_m"][i] = snapshot.gm_m
+        data["stability_warning"][i] = snapshot.stability_warning
+        self._mode_codes[i] = self._mode_code(environment_mode)
+        self._size = i + 1
+        return i
+
+    def extend(self, batch: PhysicsBatch, environment_mode: str) -> None:
+        """Append every row of a ``PhysicsBatch`` in one copy per column."""
+
+        n = len(batch)
+        self._reserve(n)
+        start, stop = self._size, self._size + n
+        for name in SNAPSHOT_FIELDS:
+            self._data[name][start:stop] = getattr(batch, name)
+        self._mode_codes[start:stop] = self._mode_code(environment_mode)
+        self._size = stop
+
+    @classmethod
+    def from_batch(cls, batch: PhysicsBatch, environment_mode: str) -> TelemetryStore:
+        """Build a store holding exactly the rows of ``batch``."""
+
+        store = cls(capacity=len(batch))
+        store.extend(batch, environment_mode)
+        return store
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a zero-copy view of one snapshot column."""
+
+        return self._data[name][: self._size]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Return zero-copy views of all snapshot columns."""
+
+        return {name: self.column(name) for name in SNAPSHOT_FIELDS}
+
+    @property
+    def mode_codes(self) -> np.ndarray:
+        """Zero-copy view of ``environment_mode`` codes into ``categories``."""
+
+        return self._mode_codes[: self._size]
+
+    def environment_modes(self) -> np.ndarray:
+        """Return decoded ``environment_mode`` strings (one per row)."""
+
+        if self._size == 0:
+            return np.empty(0, dtype=object)
+        return np.asarray(self.categories, dtype=object)[self.mode_codes]
+
+    def row(self, index: int) -> dict:
+        """Return one row as a dictionary in ``update_scene`` format."""
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("telemetry row index out of range")
+        row = {name: self._data[name][index].item() for name in SNAPSHOT_FIELDS}
+        row["environment_mode"] = self.categories[self._mode_codes[index]]
+        return row
+
+    def rows(self, start: int = 0, stop: int | None = None) -> TelemetryRows:
+        """Return a lazy list-like view over rows ``start:stop``."""
+
+        return TelemetryRows(self, start, self._size if stop is None else stop)
+
+    def iter_rows(self, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+        """Yield row dictionaries, converting columns in bulk."""
+
+        stop = self._size if stop is None else stop
+        columns = [self._data[name][start:stop].tolist() for name in SNAPSHOT_FIELDS]
+        modes = [self.categories[c] for c in self._mode_codes[start:stop].tolist()]
+        for values in zip(*columns, modes):
+            yield dict(zip(TELEMETRY_FIELDS, values))
+
+    def to_records(self) -> np.recarray:
+        """Return a NumPy record array copy (``environment_mode`` as text)."""
+
+        modes = self.environment_modes().astype(str)
+        width = max((len(m) for m in self.categories), default=1)
+        dtype = [(name, FIELD_DTYPES[name]) for name in SNAPSHOT_FIELDS] + [("environment_mode", f"U{width}")]
+        records = np.empty(self._size, dtype=dtype)
+        for name in SNAPSHOT_FIELDS:
+            records[name] = self.column(name)
+        records["environment_mode"] = modes
+        return records.view(np.recarray)
+
+    def to_pandas(self):
+        """Return a ``pandas.DataFrame`` with a categorical ``environment_mode``."""
+
+        try:
+            import pandas as pd
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("to_pandas() needs pandas; install it from requirements.txt.") from exc
+
+        frame = pd.DataFrame(self.columns(), copy=False)
+        frame["environment_mode"] = pd.Categorical.from_codes(self.mode_codes, categories=self.categories)
+        return frame
+
+    def save_csv(self, output_path: str | Path) -> None:
+        """Write all rows in the ``save_report`` CSV layout."""
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._size == 0:
+            path.write_text("", encoding="utf-8")
+            return
+
+        columns = [self.column(name).tolist() for name in SNAPSHOT_FIELDS]
+        columns.append([self.categories[c] for c in self.mode_codes.tolist()])
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(TELEMETRY_FIELDS)
+            writer.writerows(zip(*columns))
+
+
+class TelemetryRows(Sequence):
+    """Read-only list of row dictionaries backed by a ``TelemetryStore``.
+
+    Rows are built only when accessed, so returning a run's rows costs
+    nothing until a caller actually reads them.
+    """
+
+    def __init__(self, store: TelemetryStore, start: int, stop: int) -> None:
+        self._store = store
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("telemetry row index out of range")
+        return self._store.row(self._start + index)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self._store.iter_rows(self._start, self._stop)
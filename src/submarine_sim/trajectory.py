@@ -0,0 +1,307 @@
+"""Time-integrating trajectory model for whole-run simulations.
+
+``SubmarineApp.update_scene`` evaluates the same state on every step.
+This module evolves velocity, depth, pitch and yaw over time instead.
+Each state equation has a closed-form or cumulative-sum solution, so a
+full run is computed as NumPy arrays without a per-step Python loop.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from .models import SimulationInput
+from .physics_engine import PhysicsBatch, PhysicsEngine
+from .telemetry_store import SNAPSHOT_FIELDS, TELEMETRY_FIELDS, TelemetryStore
+
+
+@dataclass
+class TrajectoryConfig:
+    """Tunable constants for the trajectory model."""
+
+    dt_s: float = 0.1
+    # Propeller thrust produced per N*m of motor torque (1 / prop radius).
+    thrust_per_torque: float = 10.0
+    # Net downward force; 0.0 means the hull is neutrally buoyant.
+    ballast_n: float = 0.0
+    # Cross-flow drag coefficient used for vertical (heave) motion.
+    heave_drag_coefficient: float = 1.0
+
+
+@dataclass
+class TrajectoryResult:
+    """State arrays and per-step physics outputs for one run."""
+
+    time_s: np.ndarray
+    velocity_ms: np.ndarray
+    depth_m: np.ndarray
+    pitch_deg: np.ndarray
+    yaw_deg: np.ndarray
+    x_m: np.ndarray
+    y_m: np.ndarray
+    snapshots: PhysicsBatch
+    environment_mode: str
+
+    def __len__(self) -> int:
+        return len(self.time_s)
+
+    def row(self, index: int) -> dict:
+        """Return one telemetry row as a plain dictionary."""
+
+        row = {name: getattr(self.snapshots, name)[index].item() for name in SNAPSHOT_FIELDS}
+        row["environment_mode"] = self.environment_mode
+        return row
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Yield telemetry rows with the same keys as ``update_scene``."""
+
+        columns = [getattr(self.snapshots, name).tolist() for name in SNAPSHOT_FIELDS]
+        for values in zip(*columns):
+            row = dict(zip(TELEMETRY_FIELDS, values))
+            row["environment_mode"] = self.environment_mode
+            yield row
+
+    def save_report(self, output_path: str | Path) -> None:
+        """Write telemetry to CSV in the ``SubmarineApp.save_report`` layout."""
+
+        self.to_store().save_csv(output_path)
+
+    def to_store(self) -> TelemetryStore:
+        """Copy the per-step outputs into a columnar ``TelemetryStore``."""
+
+        return TelemetryStore.from_batch(self.snapshots, self.environment_mode)
+
+
+class TrajectoryIntegrator:
+    """Integrates the vehicle state over a whole run in one call."""
+
+    def __init__(self, physics_engine: PhysicsEngine, config: TrajectoryConfig | None = None) -> None:
+        self.physics_engine = physics_engine
+        self.config = config or TrajectoryConfig()
+
+    def surge_velocity(
+        self, v0: float, thrust_n: float, drag_k: float, mass_kg: float, time_s: np.ndarray
+    ) -> np.ndarray:
+        """Solve ``m dv/dt = T - k v^2`` exactly for every time sample."""
+
+        v_inf = np.sqrt(thrust_n / drag_k)
+        rate = np.sqrt(thrust_n * drag_k) / mass_kg
+        ratio = v0 / v_inf
+        if np.isclose(ratio, 1.0):
+            return np.full_like(time_s, v_inf)
+        if ratio < 1.0:
+            # Accelerating towards terminal speed.
+            return v_inf * np.tanh(np.arctanh(ratio) + rate * time_s)
+        # Decelerating from above terminal speed (coth branch).
+        return v_inf / np.tanh(np.arctanh(1.0 / ratio) + rate * time_s)
+
+    def integrate(
+        self,
+        case: SimulationInput,
+        *,
+        steps: int,
+        area_m2: float,
+        volume_m3: float,
+        drag_coefficient: float,
+        sensor_noise_sigma: float = 0.0,
+        environment_mode: str = "base",
+        dt_s: float | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> TrajectoryResult:
+        """Integrate ``steps`` samples of the state and evaluate physics on each."""
+
+        if steps < 0:
+            raise ValueError("steps must be >= 0.")
+        dt = self.config.dt_s if dt_s is None else dt_s
+        if dt <= 0.0:
+            raise ValueError("dt_s must be > 0.")
+
+        hg = case.hull_geometry
+        ps = case.physics_state
+        so = case.steering_output
+        env = case.environment
+        g = self.physics_engine.gravity
+        rho = env.fluid_density_kgm3
+
+        # Row 0 is the initial state, so it matches a plain update_scene step.
+        time_s = np.arange(steps, dtype=float) * dt
+
+        # Surge: motor thrust against quadratic drag, neutrally buoyant mass.
+        mass = rho * volume_m3
+        drag_k = 0.5 * rho * drag_coefficient * area_m2
+        thrust = so.motor_torque_nm * self.config.thrust_per_torque
+        velocity = self.surge_velocity(ps.velocity_ms, thrust, drag_k, mass, time_s)
+        if steps:
+            # tanh(arctanh(x)) can round; pin the initial sample to the case value.
+            velocity[0] = ps.velocity_ms
+
+        # Pitch: buoyancy restoring moment relaxes pitch when GM > 0.
+        gm_m = self.physics_engine.stability_check(hg.length_m, hg.max_diameter_m)
+        pitch_rate = np.sqrt(g * abs(gm_m)) / hg.length_m
+        decay = -pitch_rate if gm_m >= 0.0 else pitch_rate
+        pitch_deg = np.clip(ps.pitch_deg * np.exp(decay * time_s), -90.0, 90.0)
+        pitch_rad = np.radians(pitch_deg)
+
+        # Noise-free physics pass; the fin only achieves the angle the motor can hold.
+        nominal = self.physics_engine.step_batch(
+            velocity_ms=velocity,
+            current_vector_ms=env.current_vector_ms,
+            density_kgm3=rho,
+            drag_coefficient=drag_coefficient,
+            area_m2=area_m2,
+            volume_m3=volume_m3,
+            target_fin_angle_deg=so.target_fin_angle_deg,
+            fin_offset_m=hg.fin_offset_x,
+            motor_torque_nm=so.motor_torque_nm,
+            depth_m=ps.depth_m,
+            length_m=hg.length_m,
+            diameter_m=hg.max_diameter_m,
+            sensor_noise_sigma=0.0,
+        )
+        authority = np.ones_like(velocity)
+        needs = nominal.torque_required_nm > so.motor_torque_nm
+        authority[needs] = so.motor_torque_nm / nominal.torque_required_nm[needs]
+        fin_rad = np.radians(so.target_fin_angle_deg) * authority
+
+        # Yaw: kinematic turn rate v * tan(delta) / L, integrated with a cumulative sum.
+        yaw_rate = velocity * np.tan(fin_rad) / hg.length_m
+        yaw_deg = ps.yaw_deg + np.degrees(self._accumulate(yaw_rate, dt))
+
+        # Depth: pitch-induced climb plus terminal heave speed from net ballast.
+        heave = 0.0
+        if self.config.ballast_n != 0.0:
+            cross_area = hg.length_m * hg.max_diameter_m
+            heave = np.sign(self.config.ballast_n) * np.sqrt(
+                2.0 * abs(self.config.ballast_n) / (rho * self.config.heave_drag_coefficient * cross_area)
+            )
+        depth_rate = heave - velocity * np.sin(pitch_rad)
+        depth_m = np.maximum(ps.depth_m + self._accumulate(depth_rate, dt), 0.0)
+
+        horizontal = velocity * np.cos(pitch_rad)
+        yaw_rad = np.radians(yaw_deg)
+        x_m = self._accumulate(horizontal * np.cos(yaw_rad), dt)
+        y_m = self._accumulate(horizontal * np.sin(yaw_rad), dt)
+
+        snapshots = self.physics_engine.step_batch(
+            velocity_ms=velocity,
+            current_vector_ms=env.current_vector_ms,
+            density_kgm3=rho,
+            drag_coefficient=drag_coefficient,
+            area_m2=area_m2,
+            volume_m3=volume_m3,
+            target_fin_angle_deg=so.target_fin_angle_deg,
+            fin_offset_m=hg.fin_offset_x,
+            motor_torque_nm=so.motor_torque_nm,
+            depth_m=depth_m,
+            length_m=hg.length_m,
+            diameter_m=hg.max_diameter_m,
+            sensor_noise_sigma=sensor_noise_sigma,
+            rng=rng,
+        )
+
+        return TrajectoryResult(
+            time_s=time_s,
+            velocity_ms=velocity,
+            depth_m=depth_m,
+            pitch_deg=pitch_deg,
+            yaw_deg=yaw_deg,
+            x_m=x_m,
+            y_m=y_m,
+            snapshots=snapshots,
+            environment_mode=environment_mode,
+        )
+
+    @staticmethod
+    def _accumulate(rate: np.ndarray, dt: float) -> np.ndarray:
+        """Integrate a rate with forward Euler; entry 0 is always zero."""
+
+        out = np.empty_like(rate)
+        if len(rate):
+            out[0] = 0.0
+            np.cumsum(rate[:-1] * dt, out=out[1:])
+        return out
+
+
+class TrajectoryDecimator:
+    """Keeps at most ``budget`` points of a growing path.
+
+    Points are kept at a fixed stride. When the buffer fills up, every
+    other kept point is dropped and the stride doubles, so the path keeps
+    its overall shape in a fixed amount of memory. The kept points are
+    always path samples ``0, stride, 2 * stride, ...``.
+    """
+
+    def __init__(self, budget: int = 4096, dim: int = 3) -> None:
+        if budget < 2:
+            raise ValueError("budget must be >= 2.")
+        self.budget = budget
+        self.stride = 1
+        self.total = 0
+        self._points = np.empty((budget, dim))
+        self._count = 0
+        self._latest: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Forget the path but keep the buffer."""
+
+        self.stride = 1
+        self.total = 0
+        self._count = 0
+        self._latest = None
+
+    @property
+    def points(self) -> np.ndarray:
+        """Zero-copy view of the kept points."""
+
+        return self._points[: self._count]
+
+    def extend(self, points: np.ndarray) -> None:
+        """Append the next samples of the path."""
+
+        points = np.asarray(points, dtype=float).reshape(-1, self._points.shape[1])
+        if not len(points):
+            return
+        index = self.total + np.arange(len(points))
+        keep = index % self.stride == 0
+        pending, pending_index = points[keep], index[keep]
+        while len(pending):
+            space = self.budget - self._count
+            taken = pending[:space]
+            self._points[self._count : self._count + len(taken)] = taken
+            self._count += len(taken)
+            pending, pending_index = pending[space:], pending_index[space:]
+            if self._count == self.budget:
+                # Full: halve the resolution of what is kept so far.
+                halved = self._points[::2].copy()
+                self._count = len(halved)
+                self._points[: self._count] = halved
+                self.stride *= 2
+                keep = pending_index % self.stride == 0
+                pending, pending_index = pending[keep], pending_index[keep]
+        self.total += len(points)
+        self._latest = points[-1].copy()
+
+    def fill(self, out: np.ndarray) -> int:
+        """Write the path (plus the newest sample) into a fixed-size buffer.
+
+        ``out`` needs ``budget + 1`` rows. Unused rows repeat the last
+        point, so renderers can upload the same buffer size every time.
+        Returns the number of real points written.
+        """
+
+        n = self._count
+        out[:n] = self._points[:n]
+        # The newest sample is drawn even when the stride skips it.
+        if self._latest is not None and (n - 1) * self.stride != self.total - 1:
+            out[n] = self._latest
+            n += 1
+        if n:
+            out[n:] = out[n - 1]
+        return n
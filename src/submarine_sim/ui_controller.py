@@ -7,7 +7,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .alerts import AlertEvent
     from .app import SubmarineApp
+    from .telemetry_store import TelemetryRows
+    from .trajectory import TrajectoryResult
 
 
 @dataclass
@@ -43,6 +46,7 @@ class UIController:
 
         self.state.environment_mode = "real" if self.state.environment_mode == "base" else "base"
         self.state.noise_enabled = self.state.environment_mode == "real"
+        self._noise_changed()
         return self.state.environment_mode
 
     def set_environment_mode(self, mode: str) -> str:
@@ -52,12 +56,20 @@ class UIController:
             raise ValueError("Environment mode must be 'base' or 'real'.")
         self.state.environment_mode = mode
         self.state.noise_enabled = mode == "real"
+        self._noise_changed()
         return self.state.environment_mode
 
     def set_noise_enabled(self, enabled: bool) -> None:
         """Turn sensor noise on or off."""
 
         self.state.noise_enabled = enabled
+        self._noise_changed()
+
+    def _noise_changed(self) -> None:
+        """Let the app drop cached values that depend on the noise setting."""
+
+        if self._app is not None:
+            self._app.invalidate_derived("noise")
 
     def trigger_emergency_surface(self) -> None:
         """Flag that emergency surface was requested."""
@@ -69,11 +81,21 @@ class UIController:
 
         self._require_app().load_case(json_path)
 
-    def run_simulation(self, steps: int) -> list[dict]:
+    def run_simulation(self, steps: int) -> TelemetryRows:
         """Proxy: run simulation for N steps."""
 
         return self._require_app().run(steps=steps)
 
+    def run_trajectory(self, steps: int, dt_s: float | None = None) -> TrajectoryResult:
+        """Proxy: integrate the vehicle state over N time steps."""
+
+        return self._require_app().run_trajectory(steps=steps, dt_s=dt_s)
+
+    def evaluate_alerts(self, start: int = 0) -> list[AlertEvent]:
+        """Proxy: scan stored telemetry for alert episodes."""
+
+        return self._require_app().evaluate_alerts(start)
+
     def save_report(self, output_path: str | Path) -> None:
         """Proxy: save telemetry report to CSV."""
 
@@ -0,0 +1,8 @@
+"""Make ``submarine_sim`` importable from ``src`` without installing it."""
+
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
@@ -0,0 +1,63 @@
+"""Checkpoint/resume of streamed CSV reports."""
+
+from pathlib import Path
+
+import pytest
+
+from submarine_sim.app import SubmarineApp
+from submarine_sim.telemetry_sinks import CsvSink
+
+ROOT = Path(__file__).resolve().parents[1]
+CASE = ROOT / "data" / "real_case.json"
+
+
+def _app(seed: int = 7) -> SubmarineApp:
+    app = SubmarineApp()
+    app.load_case(CASE)
+    app.ui_controller.set_environment_mode("real")
+    app.physics_engine.seed(seed)
+    return app
+
+
+def _sink(path: Path) -> CsvSink:
+    return CsvSink(path, flush_every=20, max_bytes=20_000, backup_count=5)
+
+
+def _files(directory: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in sorted(directory.glob("*.csv"))}
+
+
+def test_resume_after_rotation_matches_uninterrupted_run(tmp_path):
+    reference_dir, resumed_dir = tmp_path / "reference", tmp_path / "resumed"
+    with _sink(reference_dir / "report.csv") as sink:
+        _app().run_streaming(1000, [sink])
+
+    checkpoint = tmp_path / "run.ckpt"
+    app, sink = _app(), _sink(resumed_dir / "report.csv")
+    app.run_streaming(300, [sink])
+    app.save_checkpoint(checkpoint, [sink])
+    app.run_streaming(400, [sink])
+    rotations_before_crash = sink.rotations
+    sink.flush()  # the "crash": the process dies without closing the sink
+
+    app, sink = _app(seed=99), _sink(resumed_dir / "report.csv")
+    assert app.resume(checkpoint, [sink]) == 300
+    assert rotations_before_crash > sink.rotations
+    app.run_streaming(700, [sink])
+    sink.close()
+
+    assert b"\x00" not in b"".join(_files(resumed_dir).values())
+    assert _files(resumed_dir) == _files(reference_dir)
+
+
+def test_resume_refuses_when_checkpointed_file_was_rotated_out(tmp_path):
+    checkpoint = tmp_path / "run.ckpt"
+    path = tmp_path / "report.csv"
+    app, sink = _app(), CsvSink(path, flush_every=20, max_bytes=5_000, backup_count=1)
+    app.run_streaming(50, [sink])
+    app.save_checkpoint(checkpoint, [sink])
+    app.run_streaming(500, [sink])
+    sink.flush()
+
+    with pytest.raises(ValueError):
+        _app().resume(checkpoint, [CsvSink(path, flush_every=20, max_bytes=5_000, backup_count=1)])
@@ -0,0 +1,49 @@
+"""Values cached between physics steps follow case, hull and noise changes."""
+
+from pathlib import Path
+
+from submarine_sim.app import SubmarineApp
+
+CASE = Path(__file__).resolve().parents[1] / "data" / "base_case.json"
+
+
+def _fresh_drag(length_m: float, diameter_m: float, fin_area_m2: float) -> float:
+    app = SubmarineApp()
+    app.load_case(CASE)
+    app.hull_generator.set_dimensions(length_m, diameter_m, fin_area_m2)
+    return app.update_scene()["drag_force_n"]
+
+
+def test_direct_hull_update_invalidates_cached_step_inputs():
+    app = SubmarineApp()
+    app.load_case(CASE)
+    before = app.update_scene()["drag_force_n"]
+    app.hull_generator.update_hull(6.0, 1.0, 0.2)
+    after = app.update_scene()["drag_force_n"]
+    assert after != before
+    assert after == _fresh_drag(6.0, 1.0, 0.2)
+    assert app.derived.stats["props"].invalidations == 1
+
+
+def test_noise_toggle_invalidates_sigma():
+    app = SubmarineApp()
+    app.load_case(CASE.with_name("real_case.json"))
+    quiet = app.update_scene()["effective_velocity_ms"]
+    app.ui_controller.set_noise_enabled(True)
+    app.physics_engine.seed(1)
+    assert app.update_scene()["effective_velocity_ms"] != quiet
+    assert app.update_scene()["effective_velocity_ms"] != quiet
+
+
+def test_level_of_detail_change_invalidates_mesh_hydrostatics():
+    app = SubmarineApp(hydrostatics="mesh")
+    app.load_case(CASE)
+    medium = app.update_scene()["drag_force_n"]
+    app.hull_generator.set_level_of_detail("low")
+    low = app.update_scene()["drag_force_n"]
+    assert low != medium
+
+    fresh = SubmarineApp(hydrostatics="mesh")
+    fresh.hull_generator.set_level_of_detail("low")
+    fresh.load_case(CASE)
+    assert low == fresh.update_scene()["drag_force_n"]
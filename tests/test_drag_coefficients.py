@@ -0,0 +1,73 @@
+"""Only NACA profiles with a known drag coefficient are accepted."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from submarine_sim import SubmarineApp, service
+from submarine_sim.case_batch import PROFILE_FIELD, CaseBatch
+from submarine_sim.drag_tables import FIXED_DRAG_COEFFICIENTS, fixed_drag_coefficients
+from submarine_sim.math_ingestor import MathIngestor
+from submarine_sim.schema_validator import default_validator
+from submarine_sim.sweep import SweepAxis
+
+CASE = Path(__file__).resolve().parents[1] / "data" / "base_case.json"
+
+
+def _data(profile: str) -> dict:
+    data = json.loads(CASE.read_text(encoding="utf-8"))
+    data["hull_geometry"]["naca_profile"] = profile
+    return data
+
+
+@pytest.mark.parametrize(("profile", "cd"), [("0009", 0.2), ("0012", 0.23), ("0015", 0.23)])
+def test_known_profiles_keep_fixed_values(profile, cd):
+    ingestor = MathIngestor()
+    ingestor.load_dict(_data(profile))
+    assert ingestor.get_drag_coefficient() == pytest.approx(cd)
+    assert CaseBatch.from_cases([ingestor.current_params]).drag_coefficients()[0] == pytest.approx(cd)
+
+
+def test_schema_enum_matches_fixed_values():
+    (choice,) = [c for c in default_validator().choices if c.field == PROFILE_FIELD]
+    assert set(choice.choices) == set(FIXED_DRAG_COEFFICIENTS)
+
+
+def test_unknown_profile_is_rejected_at_load():
+    with pytest.raises(ValueError, match="naca_profile must be one of"):
+        MathIngestor().load_dict(_data("2412"))
+
+
+def test_unknown_profile_is_a_per_case_error_record(tmp_path):
+    lines = [json.dumps(_data("2412")), json.dumps(_data("0009"))]
+    (tmp_path / "cases.jsonl").write_text("\n".join(lines), encoding="utf-8")
+    records = list(MathIngestor().iter_cases(tmp_path / "cases.jsonl"))
+    assert [r.ok for r in records] == [False, True]
+    assert "naca_profile" in records[0].error
+
+
+def test_validate_records_flags_unknown_profile():
+    result = default_validator().validate_records([_data("0009"), _data("2412")])
+    assert result.mask.tolist() == [True, False]
+    assert result.errors_for(1)[0][0] == PROFILE_FIELD
+
+
+def test_fixed_drag_coefficients_raise_for_unknown_profile():
+    with pytest.raises(ValueError, match="2412"):
+        fixed_drag_coefficients(np.array(["0009", "2412"], dtype=object))
+
+
+def test_sweep_axis_rejects_unknown_profile():
+    with pytest.raises(ValueError, match="naca_profile"):
+        SweepAxis.parse(PROFILE_FIELD, ["0009", "2412"])
+
+
+def test_batched_service_request_fails_alone(monkeypatch):
+    monkeypatch.setattr(service, "_APP", SubmarineApp())
+    good = {"case": _data("0009"), "mode": "base", "steps": 1, "integrate": False, "seed": None, "telemetry": False}
+    bad = dict(good, case=_data("2412"))
+    results = service._process_batch([good, bad, good])
+    assert "error" in results[1]
+    assert "last_snapshot" in results[0] and "last_snapshot" in results[2]
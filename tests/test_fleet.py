@@ -0,0 +1,28 @@
+"""Fleet proximity and collision reporting."""
+
+from pathlib import Path
+
+import numpy as np
+
+from submarine_sim.fleet import Fleet
+from submarine_sim.math_ingestor import MathIngestor
+
+CASE = Path(__file__).resolve().parents[1] / "data" / "base_case.json"
+
+
+def _brute_force(points: np.ndarray, radius: float) -> set[tuple[int, int]]:
+    d = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+    i, j = np.nonzero(np.triu(d < radius, k=1))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+def test_collisions_beyond_proximity_radius_are_reported():
+    case = MathIngestor().load_json(CASE)
+    fleet = Fleet.from_case(case, 16, spacing_m=0.8 * case.hull_geometry.length_m, seed=0, proximity_m=0.5)
+    # Pairs are found at the positions the step starts from.
+    expected = _brute_force(fleet.positions(), case.hull_geometry.length_m)
+    result = fleet.step()
+    i, j, distance = result.close_pairs
+    assert expected
+    assert set(zip(i[result.collisions].tolist(), j[result.collisions].tolist())) == expected
+    assert np.all((distance < 0.5) | result.collisions)
@@ -0,0 +1,14 @@
+"""Bulk ingestion returns error records for missing files, with or without a cache."""
+
+import pytest
+
+from submarine_sim.math_ingestor import MathIngestor
+from submarine_sim.parse_cache import ParseCache
+
+
+@pytest.mark.parametrize("name", ["nope.jsonl", "nope.json"])
+@pytest.mark.parametrize("cache", [None, ParseCache()])
+def test_missing_file_gives_one_error_record(tmp_path, name, cache):
+    records = list(MathIngestor().iter_cases(tmp_path / name, cache=cache))
+    assert len(records) == 1
+    assert not records[0].ok
@@ -0,0 +1,35 @@
+"""Real-time steering commands follow the same strict number rule as case files."""
+
+from pathlib import Path
+
+import pytest
+
+from submarine_sim.app import SubmarineApp
+from submarine_sim.realtime import QueueChannel, RealTimeLoop
+
+CASE = Path(__file__).resolve().parents[1] / "data" / "base_case.json"
+
+
+def _run(command: dict):
+    app = SubmarineApp()
+    app.load_case(CASE)
+    channel = QueueChannel()
+    channel.send_command(command)
+    stats = RealTimeLoop(app, channel, rate_hz=1000.0).run(ticks=1)
+    return app.ingestor.current_params.steering_output, stats
+
+
+@pytest.mark.parametrize("value", ["5", True, float("nan"), None])
+def test_non_numeric_command_value_is_rejected(value):
+    steering, stats = _run({"motor_torque_nm": value})
+    assert stats.commands_rejected == 1
+    assert stats.commands_applied == 0
+    assert "motor_torque_nm" in stats.summary()["command_errors"][0]
+    assert steering.motor_torque_nm != value
+
+
+def test_numeric_command_is_applied():
+    steering, stats = _run({"target_fin_angle_deg": 5})
+    assert stats.commands_applied == 1
+    assert stats.summary()["command_errors"] == []
+    assert steering.target_fin_angle_deg == 5
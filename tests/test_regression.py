@@ -0,0 +1,31 @@
+"""Report parsing never invents flag values."""
+
+from pathlib import Path
+
+import pytest
+
+from submarine_sim.regression import compare_files, parse_telemetry_csv
+
+REPORT = Path(__file__).resolve().parents[1] / "logs" / "phase1_report.csv"
+
+
+def test_shipped_report_flags_parse():
+    columns = parse_telemetry_csv(REPORT.read_text(encoding="utf-8"))
+    assert columns["cavitation_risk"].dtype == bool
+    assert not columns["stability_warning"].any()
+
+
+@pytest.mark.parametrize("value", ["true", "1", "", "Tru"])
+def test_bad_flag_raises_with_row_and_column(value):
+    lines = REPORT.read_text(encoding="utf-8").splitlines()
+    lines[2] = lines[2].replace(",False,", f",{value},", 1)
+    with pytest.raises(ValueError, match="Row 2, column 'cavitation_risk'"):
+        parse_telemetry_csv("\n".join(lines))
+
+
+def test_bad_flag_is_a_pair_error(tmp_path):
+    text = REPORT.read_text(encoding="utf-8")
+    (tmp_path / "bad.csv").write_text(text.replace(",False,", ",1,", 1), encoding="utf-8")
+    result = compare_files(REPORT, tmp_path / "bad.csv")
+    assert not result.passed
+    assert "cavitation_risk" in result.error
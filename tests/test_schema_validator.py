@@ -0,0 +1,39 @@
+"""Single-case validation rejects values that are not JSON numbers."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from submarine_sim.math_ingestor import MathIngestor
+
+CASE = Path(__file__).resolve().parents[1] / "data" / "base_case.json"
+
+
+def _case() -> dict:
+    return json.loads(CASE.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("value", ["3.05", True, None])
+def test_non_numeric_field_is_rejected(value):
+    data = _case()
+    data["hull_geometry"]["length_m"] = value
+    with pytest.raises(ValueError, match="length_m must be a number"):
+        MathIngestor().load_dict(data)
+
+
+def test_non_numeric_current_item_is_rejected():
+    data = _case()
+    data["environment"]["current_vector_ms"][0] = "0.1"
+    with pytest.raises(ValueError, match="current_vector_ms.0"):
+        MathIngestor().load_dict(data)
+
+
+def test_bulk_ingestion_marks_string_values_failed(tmp_path):
+    data = _case()
+    data["physics_state"]["velocity_ms"] = "2.5"
+    (tmp_path / "bad.json").write_text(json.dumps(data), encoding="utf-8")
+    (tmp_path / "good.json").write_text(json.dumps(_case()), encoding="utf-8")
+    records = {Path(r.source).name: r for r in MathIngestor().iter_cases(tmp_path)}
+    assert records["good.json"].ok
+    assert not records["bad.json"].ok